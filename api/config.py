@@ -25,7 +25,7 @@ class DatabaseConfig(BaseModel):
     url: str
     echo: bool = False
     # 连接池配置
-    pool_size: int = 5  # 连接池大小
+    pool_size: int = 20  # 连接池大小
     max_overflow: int = 10  # 最大溢出连接数
     pool_timeout: int = 30  # 连接池超时时间（秒）
     pool_recycle: int = 1800  # 连接回收时间（秒）
@@ -61,6 +61,12 @@ class AppConfig(BaseModel):
     log_config_path: Optional[str] = Field(default=None)
     static_dir: str = Field(default="static")
     admin_user: AdminUserConfig = Field(default_factory=AdminUserConfig)
+    # MCP 工具并发执行上限
+    mcp_max_concurrency: int = Field(default=10, ge=1)
+    # 工具代码执行线程数
+    tool_executor_workers: int = Field(default=8, ge=1)
+    # OpenAPI 文件上传大小上限（字节）
+    openapi_max_upload_size: int = Field(default=10 * 1024 * 1024)
 
 
 def get_config() -> AppConfig:
@@ -81,6 +87,10 @@ def get_config() -> AppConfig:
     # Database configuration
     db_url = os.getenv("DB_URL", "sqlite+aiosqlite:///./easy_mcp.db")
     db_echo = os.getenv("DB_ECHO", "False").lower() == "true"
+    db_pool_size = int(os.getenv("DB_POOL_SIZE", "20"))
+    db_max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    db_pool_timeout = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    db_pool_recycle = int(os.getenv("DB_POOL_RECYCLE", "1800"))
 
     # JWT configuration
     jwt_secret = os.getenv("JWT_SECRET_KEY", "easy_mcp_secret")
@@ -104,12 +114,28 @@ def get_config() -> AppConfig:
     admin_password = os.getenv("ADMIN_PASSWORD", "admin")
     admin_email = os.getenv("ADMIN_EMAIL", "admin@example.com")
 
+    # MCP configuration
+    mcp_max_concurrency = int(os.getenv("MCP_MAX_CONCURRENCY", "10"))
+    tool_executor_workers = int(os.getenv("TOOL_EXECUTOR_WORKERS", "8"))
+
+    # OpenAPI configuration
+    openapi_max_upload_size = int(
+        os.getenv("OPENAPI_MAX_UPLOAD_SIZE", str(10 * 1024 * 1024))
+    )  # 10 MB
+
     return AppConfig(
         debug=debug,
         title=app_name,
         version=app_version,
         description=app_description,
-        database=DatabaseConfig(url=db_url, echo=db_echo),
+        database=DatabaseConfig(
+            url=db_url,
+            echo=db_echo,
+            pool_size=db_pool_size,
+            max_overflow=db_max_overflow,
+            pool_timeout=db_pool_timeout,
+            pool_recycle=db_pool_recycle,
+        ),
         jwt=JWTConfig(
             secret_key=jwt_secret,
             algorithm=jwt_algorithm,
@@ -122,6 +148,9 @@ def get_config() -> AppConfig:
         admin_user=AdminUserConfig(
             username=admin_username, password=admin_password, email=admin_email
         ),
+        mcp_max_concurrency=mcp_max_concurrency,
+        tool_executor_workers=tool_executor_workers,
+        openapi_max_upload_size=openapi_max_upload_size,
     )
 
 
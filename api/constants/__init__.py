@@ -2,6 +2,6 @@
 Constants package.
 """
 
-from .tool_constants import ToolType
+from .tool_constants import CallTypeName, ToolType, ToolTypeName
 
-__all__ = ["ToolType"]
+__all__ = ["CallTypeName", "ToolType", "ToolTypeName"]
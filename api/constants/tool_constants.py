@@ -2,6 +2,8 @@
 Tool constants definition.
 """
 
+from typing import Literal
+
 
 # Tool types
 class ToolType:
@@ -28,3 +30,10 @@ class ToolType:
             cls.DATABASE: "数据库工具",
         }
         return display_names.get(tool_type, "未知工具")
+
+
+# Tool type as a schema field type; values match ToolType.ALL_TYPES
+ToolTypeName = Literal["basic", "http", "database"]
+
+# Tool call type as a schema field type
+CallTypeName = Literal["mcp", "debug"]
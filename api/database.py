@@ -5,6 +5,7 @@ Database connection and session management.
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from sqlalchemy import Column, Index, MetaData, Table, event, inspect
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
@@ -18,6 +19,24 @@ database_url = config.database.url
 # Convert SQLite URL to async format if needed
 if database_url.startswith("sqlite:"):
     database_url = database_url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+is_sqlite = database_url.startswith("sqlite")
+
+# Applied once to every new SQLite connection; pooled connections keep them
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+)
+
+# Indexes replaced by composite indexes, by table: index name -> column.
+# Existing databases still have them and would keep maintaining them.
+SUPERSEDED_INDEXES = {
+    "tb_audit": {
+        "ix_tb_audit_action": "action",
+        "ix_tb_audit_resource_type": "resource_type",
+        "ix_tb_audit_created_at": "created_at",
+    },
+}
 
 # Create async engine with connection pooling
 engine = create_async_engine(
@@ -29,9 +48,28 @@ engine = create_async_engine(
     max_overflow=config.database.max_overflow,
     pool_timeout=config.database.pool_timeout,
     pool_recycle=config.database.pool_recycle,
-    pool_pre_ping=True,  # Verify connections before using them
+    # Verify server connections before using them; a local SQLite file
+    # cannot drop a connection, so skip the extra round-trip there
+    pool_pre_ping=not is_sqlite,
 )
 
+if is_sqlite:
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """
+        Configure a new SQLite connection before it enters the pool.
+
+        Args:
+            dbapi_connection: DBAPI connection
+            connection_record: Pool connection record
+        """
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+
 # Create async session factory
 async_session_factory = sessionmaker(
     engine,
@@ -42,12 +80,46 @@ async_session_factory = sessionmaker(
 )
 
 
+def _create_missing_indexes(conn) -> None:
+    """
+    Create indexes declared on the models that an existing database lacks.
+
+    create_all only creates indexes together with new tables, so indexes
+    added to an existing table would otherwise never be built.
+
+    Args:
+        conn: Synchronous connection
+    """
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+def _drop_superseded_indexes(conn) -> None:
+    """
+    Drop the indexes listed in SUPERSEDED_INDEXES that still exist.
+
+    Args:
+        conn: Synchronous connection
+    """
+    inspector = inspect(conn)
+    for table_name, indexes in SUPERSEDED_INDEXES.items():
+        existing = {index["name"] for index in inspector.get_indexes(table_name)}
+        for name, column in indexes.items():
+            if name in existing:
+                # DROP INDEX only needs the index and table names
+                table = Table(table_name, MetaData(), Column(column))
+                Index(name, table.c[column]).drop(conn)
+
+
 async def create_db_and_tables() -> None:
     """
-    Create database tables.
+    Create database tables and any missing indexes, and drop superseded ones.
     """
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
+        await conn.run_sync(_drop_superseded_indexes)
 
 
 @asynccontextmanager
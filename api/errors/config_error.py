@@ -2,7 +2,7 @@
 Configuration-related error classes.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 from api.errors.base_error import ServiceError
 
@@ -87,7 +87,7 @@ class ConfigInUseError(ServiceError):
     def __init__(
         self,
         config_id: int,
-        used_by_tools: Optional[Dict[str, Any]] = None,
+        used_by_tools: Optional[List[Dict[str, Any]]] = None,
         reason: Optional[str] = None,
         description: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
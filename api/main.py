@@ -2,12 +2,14 @@
 Main application module.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from api.config import get_config, setup_logging
@@ -30,8 +32,10 @@ from api.routers import (
     static_router,
     openapi_router,
     tag_router,
+    batch_router,
 )
 from api.routers.mcp_router import mcp_server_lifespan
+from api.utils.audit_util import run_audit_writer
 from api.utils.init_admin import init_admin_user
 
 # Get configuration
@@ -61,11 +65,19 @@ async def lifespan(app: FastAPI):
     async with get_session() as db:
         await init_admin_user(db)
 
+    # Write audit logs in batches off the request path
+    audit_writer = asyncio.create_task(run_audit_writer())
+
     # Initialize MCP server
-    async with mcp_server_lifespan():
-        logger.info("MCP server initialized")
-        yield
-        logger.info("MCP server shutdown")
+    try:
+        async with mcp_server_lifespan():
+            logger.info("MCP server initialized")
+            yield
+            logger.info("MCP server shutdown")
+    finally:
+        # Cancelling flushes the audit rows still queued
+        audit_writer.cancel()
+        await asyncio.gather(audit_writer, return_exceptions=True)
 
     # Shutdown
     logger.info("Shutting down...")
@@ -78,6 +90,7 @@ app = FastAPI(
     version=config.version,
     debug=config.debug,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -108,6 +121,7 @@ app.include_router(log_router.router, prefix="/api/v1")
 app.include_router(openapi_router.router, prefix="/api/v1")
 app.include_router(tool_log_router.router, prefix="/api/v1")
 app.include_router(tag_router.router, prefix="/api/v1")
+app.include_router(batch_router.router, prefix="/api/v1")
 
 # Add MCP router
 app.include_router(mcp_router.router)
@@ -133,9 +147,14 @@ app.include_router(static_router.router)
 if __name__ == "__main__":
     import uvicorn
 
+    # loop/http "auto" pick uvloop and httptools when they are installed;
+    # MCP only uses SSE, so the websocket protocol is disabled
     uvicorn.run(
         "api.main:app",
         host="0.0.0.0",
         port=8000,
         reload=config.debug,
+        loop="auto",
+        http="auto",
+        ws="none",
     )
@@ -4,9 +4,11 @@ Audit log model.
 
 from typing import Optional
 
-from sqlalchemy import BigInteger, Text
+from sqlalchemy import BigInteger, Index, Text
 from sqlmodel import Field, SQLModel
 
+from api.utils.search_util import prefix_search_indexes
+
 
 class TbAudit(SQLModel, table=True):
     """
@@ -30,10 +32,30 @@ class TbAudit(SQLModel, table=True):
     id: int = Field(primary_key=True)
     user_id: Optional[int] = Field(default=None, index=True)
     username: str = Field(index=True)
-    action: str = Field(index=True)
-    resource_type: str = Field(index=True)
+    action: str = Field()
+    resource_type: str = Field()
     resource_id: Optional[int] = Field(default=None, index=True)
     resource_name: Optional[str] = Field(default=None, index=True)
     details: Optional[str] = Field(default=None, sa_type=Text)
     ip_address: Optional[str] = Field(default=None)
-    created_at: int = Field(index=True, sa_type=BigInteger)
+    created_at: int = Field(sa_type=BigInteger)
+
+    __table_args__ = (
+        # Audit listing sort order, with id as tie-breaker for keyset cursors
+        Index("ix_tb_audit_created_at_id", "created_at", "id"),
+        # Equality filters followed by the created_at sort used by audit
+        # listing; the leading columns also serve plain action/resource_type
+        # lookups
+        Index("ix_tb_audit_action_created_at", "action", "created_at"),
+        Index(
+            "ix_tb_audit_resource_type_resource_id_created_at",
+            "resource_type",
+            "resource_id",
+            "created_at",
+        ),
+    )
+
+
+# Case-insensitive prefix search on the username and resource name filters
+prefix_search_indexes(TbAudit.__tablename__, TbAudit.username)
+prefix_search_indexes(TbAudit.__tablename__, TbAudit.resource_name)
@@ -7,6 +7,8 @@ from typing import Optional
 from sqlalchemy import BigInteger, Text
 from sqlmodel import Field, SQLModel
 
+from api.utils.search_util import prefix_search_indexes
+
 
 class TbConfig(SQLModel, table=True):
     """
@@ -35,3 +37,7 @@ class TbConfig(SQLModel, table=True):
     updated_at: Optional[int] = Field(default=None, sa_type=BigInteger)
     created_by: Optional[str] = Field(default=None)
     updated_by: Optional[str] = Field(default=None)
+
+
+# Case-insensitive prefix search on the configuration name
+prefix_search_indexes(TbConfig.__tablename__, TbConfig.name)
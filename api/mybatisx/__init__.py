@@ -2,6 +2,6 @@
 MyBatis XML parser and SQL generator.
 """
 
-from .mybatis_xml import MyBatisXml
+from .mybatis_xml import BACKSLASH_ESCAPE_SCHEMES, MyBatisXml
 
-__all__ = ["MyBatisXml"]
+__all__ = ["BACKSLASH_ESCAPE_SCHEMES", "MyBatisXml"]
@@ -6,6 +6,15 @@ import re
 import xml.etree.ElementTree as ET
 from typing import Dict, Any, Optional
 
+# URL schemes of databases whose string literals treat backslash as an
+# escape character by default
+BACKSLASH_ESCAPE_SCHEMES = frozenset({"mysql", "doris", "clickhouse"})
+
+# Items of a comma-separated IN value that are inlined unquoted
+_NUMBER_PATTERN = re.compile(r"-?\d+(\.\d+)?")
+# Items of a comma-separated IN value that are already quoted literals
+_QUOTED_PATTERN = re.compile(r"'([^']*)'")
+
 
 class MyBatisXml:
     """
@@ -15,18 +24,61 @@ class MyBatisXml:
     executable SQL statements with parameter substitution.
     """
 
-    def __init__(self, sql_content: str):
+    def __init__(self, sql_content: str, backslash_escapes: bool = False):
         """
         Initialize MyBatisXml with SQL content.
 
         Args:
             sql_content: MyBatis SQL content (without mapper wrapper)
+            backslash_escapes: Whether the target database treats backslash
+                as an escape character in string literals (MySQL, Doris,
+                ClickHouse)
         """
         self.sql_content = sql_content
+        self.backslash_escapes = backslash_escapes
         # Wrap the SQL content in a temporary root element for parsing
         wrapped_content = f"<root>{sql_content}</root>"
         self.root = ET.fromstring(wrapped_content)
 
+    def _quote(self, value: str) -> str:
+        """
+        Render a string as an SQL string literal.
+
+        Args:
+            value: String value
+
+        Returns:
+            str: Quoted literal that the value cannot end early
+        """
+        if self.backslash_escapes:
+            value = value.replace("\\", "\\\\")
+        return "'" + value.replace("'", "''") + "'"
+
+    def _in_list(self, value: str) -> str:
+        """
+        Render a comma-separated string as the items of an IN list.
+
+        Numbers are inlined as-is, already quoted items are re-quoted and
+        everything else is quoted, so the value cannot add SQL of its own.
+
+        Args:
+            value: Comma-separated items
+
+        Returns:
+            str: Comma-separated SQL literals
+        """
+        items = []
+        for item in value.split(","):
+            item = item.strip()
+            quoted = _QUOTED_PATTERN.fullmatch(item)
+            if _NUMBER_PATTERN.fullmatch(item):
+                items.append(item)
+            elif quoted:
+                items.append(self._quote(quoted.group(1)))
+            else:
+                items.append(self._quote(item))
+        return ",".join(items)
+
     def _substitute_parameters(self, sql: str, params: Dict[str, Any]) -> str:
         """
         Substitute parameters in SQL text.
@@ -54,13 +106,13 @@ class MyBatisXml:
             if isinstance(value, str):
                 # 如果在 CONCAT 函数内部，需要加引号
                 if "CONCAT(" in before and ")" in after:
-                    return f"'{value}'"
-                # 如果在 IN 子句中，不加引号
+                    return self._quote(value)
+                # 如果在 IN 子句中，按逗号拆分后逐项转义
                 elif "IN" in before and ("(" in before or "(" in after):
-                    return value
+                    return self._in_list(value)
                 # 其他字符串情况加引号
                 else:
-                    return f"'{value}'"
+                    return self._quote(value)
             else:
                 return str(value)
 
@@ -2,7 +2,7 @@
 Audit router.
 """
 
-from typing import Optional
+from typing import Optional, Tuple
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +12,9 @@ from api.models.tb_user import TbUser
 from api.schemas.audit_schema import AuditResponse
 from api.schemas.common_schema import PaginatedResponse
 from api.services.audit_service import AuditService
+from api.utils.param_util import parse_audit_cursor
+from api.utils.response_util import paginated_json_response
+from api.utils.search_util import SearchMode
 from api.utils.security_util import get_current_user
 
 # Create router
@@ -29,6 +32,10 @@ async def get_audits(
     resource_name: Optional[str] = Query(None, description="Resource name filter"),
     start_time: Optional[int] = Query(None, description="Start time filter (UnixMS)"),
     end_time: Optional[int] = Query(None, description="End time filter (UnixMS)"),
+    mode: SearchMode = Query(
+        "prefix", description="How username and resource_name match: prefix or contains"
+    ),
+    cursor: Optional[Tuple[int, int]] = Depends(parse_audit_cursor),
     db: AsyncSession = Depends(get_db),
     current_user: TbUser = Depends(get_current_user),
 ):
@@ -45,6 +52,8 @@ async def get_audits(
         resource_name: Resource name filter
         start_time: Start time filter (UnixMS)
         end_time: End time filter (UnixMS)
+        mode: Search mode for username and resource_name
+        cursor: Cursor from the previous page's next_cursor, "created_at:id"
         db: Database session
         current_user: Current user
 
@@ -52,7 +61,7 @@ async def get_audits(
         PaginatedResponse[AuditResponse]: Paginated list of audit logs
     """
     service = AuditService(db)
-    audits, total = await service.query_audits(
+    audits, total, has_next = await service.query_audits(
         page,
         size,
         username,
@@ -62,8 +71,15 @@ async def get_audits(
         resource_name,
         start_time,
         end_time,
+        mode,
+        cursor,
     )
 
-    return PaginatedResponse(
-        data=[AuditResponse.model_validate(audit) for audit in audits], total=total
+    next_cursor = f"{audits[-1].created_at}:{audits[-1].id}" if has_next else None
+
+    return paginated_json_response(
+        [AuditResponse.model_validate(audit).model_dump() for audit in audits],
+        total,
+        has_next,
+        next_cursor,
     )
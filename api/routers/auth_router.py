@@ -12,6 +12,7 @@ from api.database import get_db
 from api.errors.user_error import InvalidCredentialsError
 from api.schemas.common_schema import Response
 from api.schemas.user_schema import LoginRequest, TokenResponse
+from api.utils.param_util import json_body, json_body_openapi
 from api.utils.security_util import authenticate_user, create_access_token
 
 # Get JWT configuration
@@ -22,8 +23,15 @@ ACCESS_TOKEN_EXPIRE_MINUTES = config.jwt.access_token_expire_minutes
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-@router.post("/login", response_model=Response[TokenResponse])
-async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_db)):
+@router.post(
+    "/login",
+    response_model=Response[TokenResponse],
+    openapi_extra=json_body_openapi(LoginRequest),
+)
+async def login(
+    login_data: LoginRequest = Depends(json_body(LoginRequest)),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Login endpoint.
 
@@ -0,0 +1,149 @@
+"""
+Batch router.
+"""
+
+import asyncio
+from typing import List
+
+import orjson
+from fastapi import APIRouter, Depends, Request
+
+from api.errors.base_error import ValidationError
+from api.models.tb_user import TbUser
+from api.schemas.batch_schema import BatchRequest, BatchSubRequest, BatchSubResponse
+from api.schemas.common_schema import Response
+from api.utils.security_util import get_current_user
+
+# Create router
+router = APIRouter(prefix="/tool-batch", tags=["batch"])
+
+API_PREFIX = "/api/v1/"
+FORWARDED_HEADERS = {b"authorization", b"cookie"}
+
+
+async def _dispatch(request: Request, sub_request: BatchSubRequest) -> BatchSubResponse:
+    """
+    Run a sub-request against the application without leaving the process.
+
+    Args:
+        request: The outer batch request
+        sub_request: Sub-request to run
+
+    Returns:
+        BatchSubResponse: Status and decoded body of the sub-request
+    """
+    path, _, query = sub_request.url.partition("?")
+    body = b"" if sub_request.body is None else orjson.dumps(sub_request.body)
+    headers = [
+        (key, value)
+        for key, value in request.scope["headers"]
+        if key in FORWARDED_HEADERS
+    ]
+    headers.append((b"content-type", b"application/json"))
+    headers.append((b"content-length", str(len(body)).encode()))
+
+    scope = {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": sub_request.method,
+        "scheme": request.scope.get("scheme", "http"),
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": headers,
+        "client": request.scope.get("client"),
+        "server": request.scope.get("server"),
+    }
+
+    body_sent = False
+    response_done = asyncio.Event()
+
+    async def receive():
+        nonlocal body_sent
+        if body_sent:
+            # Like a live connection, only report a disconnect once the
+            # response is complete; middleware listens for it while streaming.
+            await response_done.wait()
+            return {"type": "http.disconnect"}
+        body_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    status = 500
+    chunks: List[bytes] = []
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_done.set()
+
+    try:
+        await request.app(scope, receive, send)
+    finally:
+        response_done.set()
+
+    raw = b"".join(chunks)
+    try:
+        content = orjson.loads(raw) if raw else None
+    except ValueError:
+        content = raw.decode(errors="replace")
+    return BatchSubResponse(id=sub_request.id, status=status, body=content)
+
+
+@router.post("", response_model=Response[List[BatchSubResponse]])
+async def execute_batch(
+    batch: BatchRequest,
+    request: Request,
+    current_user: TbUser = Depends(get_current_user),
+):
+    """
+    Execute several API calls in one round-trip.
+
+    Consecutive GET sub-requests run concurrently; any other method runs on
+    its own, in order, after everything before it has finished. Each
+    sub-request goes through the full middleware and auth stack with its
+    own database session.
+
+    Args:
+        batch: Sub-requests to execute
+        request: The outer request, used to forward credentials
+        current_user: Current user
+
+    Returns:
+        Response[List[BatchSubResponse]]: Results in the order submitted
+    """
+    for sub_request in batch.requests:
+        path = sub_request.url.partition("?")[0]
+        if not path.startswith(API_PREFIX) or path.startswith(
+            API_PREFIX + "tool-batch"
+        ):
+            raise ValidationError(
+                reason="Invalid batch url",
+                description=f"Unsupported batch url: {sub_request.url}",
+                details={"id": sub_request.id},
+            )
+
+    results: List[BatchSubResponse] = []
+    pending_reads: List[BatchSubRequest] = []
+
+    async def flush_reads():
+        if pending_reads:
+            results.extend(
+                await asyncio.gather(*(_dispatch(request, r) for r in pending_reads))
+            )
+            pending_reads.clear()
+
+    for sub_request in batch.requests:
+        if sub_request.method == "GET":
+            pending_reads.append(sub_request)
+            continue
+        await flush_reads()
+        results.append(await _dispatch(request, sub_request))
+    await flush_reads()
+
+    return Response(data=results)
@@ -2,9 +2,10 @@
 Configuration router.
 """
 
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.database import get_db
@@ -12,12 +13,23 @@ from api.models.tb_user import TbUser
 from api.schemas.common_schema import Response, PaginatedResponse
 from api.schemas.config_schema import ConfigCreate, ConfigUpdate, ConfigResponse
 from api.schemas.usage_schema import ConfigUsageResponse
-from api.services.config_service import ConfigService
+from api.services.config_service import (
+    ConfigService,
+    get_cached_config_read,
+    get_config_read_cache_version,
+    set_cached_config_read,
+)
+from api.utils.param_util import json_body, json_body_openapi
+from api.utils.response_util import validate_rows
+from api.utils.search_util import SearchMode
 from api.utils.security_util import get_current_user
 
 # Create router
 router = APIRouter(prefix="/config", tags=["config"])
 
+# List validator, built once so each page is validated in a single call
+_CONFIGS_ADAPTER = TypeAdapter(List[ConfigResponse])
+
 
 @router.get("", response_model=PaginatedResponse[ConfigResponse])
 async def get_configs(
@@ -26,6 +38,10 @@ async def get_configs(
     search: Optional[str] = Query(
         None, description="Search term for name or description"
     ),
+    mode: SearchMode = Query(
+        "prefix",
+        description="prefix: name starts with search; contains: name or description contains search",
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: TbUser = Depends(get_current_user),
 ):
@@ -36,6 +52,7 @@ async def get_configs(
         page: Page number
         size: Page size
         search: Search term
+        mode: Search mode
         db: Database session
         current_user: Current user
 
@@ -43,26 +60,30 @@ async def get_configs(
         PaginatedResponse[ConfigResponse]: Paginated list of configurations
     """
     service = ConfigService(db)
-    configs, total = await service.query_configs(page, size, search)
+    configs, total = await service.query_configs(page, size, search, mode)
 
     return PaginatedResponse(
-        data=[ConfigResponse.model_validate(config) for config in configs], total=total
+        data=validate_rows(_CONFIGS_ADAPTER, ConfigResponse, configs), total=total
     )
 
 
-@router.post("", response_model=Response[ConfigResponse])
+@router.post(
+    "",
+    response_model=Response[ConfigResponse],
+    openapi_extra=json_body_openapi(ConfigCreate),
+)
 async def create_config(
-    config_data: ConfigCreate,
     db: AsyncSession = Depends(get_db),
     current_user: TbUser = Depends(get_current_user),
+    config_data: ConfigCreate = Depends(json_body(ConfigCreate)),
 ):
     """
     Create a new configuration.
 
     Args:
-        config_data: Configuration data
         db: Database session
         current_user: Current user
+        config_data: Configuration data
 
     Returns:
         Response[ConfigResponse]: Created configuration
@@ -82,6 +103,8 @@ async def get_config(
     """
     Get configuration by ID.
 
+    Rendered configurations are cached briefly and dropped on any change.
+
     Args:
         config_id: Configuration ID
         db: Database session
@@ -90,10 +113,17 @@ async def get_config(
     Returns:
         Response[ConfigResponse]: Configuration
     """
-    service = ConfigService(db)
-    config = await service.get_config_by_id(config_id)
-
-    return Response(data=ConfigResponse.model_validate(config) if config else None)
+    cache_key = ("config", config_id)
+    cached = get_cached_config_read(cache_key)
+    if cached is None:
+        version = get_config_read_cache_version()
+        service = ConfigService(db)
+        config = await service.get_config_by_id(config_id)
+        # Wrapped in a tuple so a missing configuration is cached too
+        cached = (ConfigResponse.model_validate(config) if config else None,)
+        set_cached_config_read(cache_key, cached, version)
+
+    return Response(data=cached[0])
 
 
 @router.put("/{config_id}", response_model=Response[ConfigResponse])
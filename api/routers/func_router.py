@@ -18,6 +18,7 @@ from api.schemas.func_schema import (
 )
 from api.schemas.usage_schema import FuncUsageResponse
 from api.services.func_service import FuncService
+from api.utils.response_util import paginated_json_response
 from api.utils.security_util import get_current_user
 
 # Create router
@@ -31,6 +32,9 @@ async def get_funcs(
     search: Optional[str] = Query(
         None, description="Search term for name or description"
     ),
+    cursor: Optional[int] = Query(
+        None, description="Cursor from the previous page (overrides page)"
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: TbUser = Depends(get_current_user),
 ):
@@ -41,6 +45,7 @@ async def get_funcs(
         page: Page number
         size: Page size
         search: Search term
+        cursor: Cursor from the previous page's next_cursor
         db: Database session
         current_user: Current user
 
@@ -48,10 +53,13 @@ async def get_funcs(
         PaginatedResponse[FuncResponse]: Paginated list of functions
     """
     service = FuncService(db)
-    funcs, total = await service.query_funcs(page, size, search)
+    funcs, total, has_next = await service.query_funcs(page, size, search, cursor)
+
+    next_cursor = str(funcs[-1].id) if has_next else None
 
-    return PaginatedResponse(
-        data=[FuncResponse.model_validate(func) for func in funcs], total=total
+    # Function rows map one-to-one onto FuncResponse, so they are dumped as-is
+    return paginated_json_response(
+        [func.model_dump() for func in funcs], total, has_next, next_cursor
     )
 
 
@@ -191,6 +199,9 @@ async def get_func_deploy_history(
     func_id: int,
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[int] = Query(
+        None, description="Cursor from the previous page (overrides page)"
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: TbUser = Depends(get_current_user),
 ):
@@ -201,6 +212,7 @@ async def get_func_deploy_history(
         func_id: Function ID
         page: Page number
         size: Page size
+        cursor: Cursor from the previous page's next_cursor
         db: Database session
         current_user: Current user
 
@@ -208,11 +220,15 @@ async def get_func_deploy_history(
         PaginatedResponse[FuncDeployResponse]: Paginated list of function deployments
     """
     service = FuncService(db)
-    deploys, total = await service.get_func_deploy_history(func_id, page, size)
+    deploys, total, has_next = await service.get_func_deploy_history(
+        func_id, page, size, cursor
+    )
+
+    next_cursor = str(deploys[-1].version) if has_next else None
 
-    return PaginatedResponse(
-        data=[FuncDeployResponse.model_validate(deploy) for deploy in deploys],
-        total=total,
+    # Deployment rows map one-to-one onto FuncDeployResponse
+    return paginated_json_response(
+        [deploy.model_dump() for deploy in deploys], total, has_next, next_cursor
     )
 
 
@@ -3,6 +3,7 @@ Log router.
 """
 
 from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.config import get_config
@@ -90,3 +91,46 @@ async def get_log_content(
             displayed_lines=displayed_lines,
         )
     )
+
+
+@router.get("/stream/{file_name}", response_class=StreamingResponse)
+async def stream_log_content(
+    file_name: str,
+    max_lines: int = Query(
+        1000, ge=1, le=100000, description="Maximum number of lines to return"
+    ),
+    tail: bool = Query(
+        True,
+        description="If True, returns the last max_lines, otherwise returns from the beginning",
+    ),
+    current_user: TbUser = Depends(get_current_user),
+):
+    """
+    Stream content of a log file as plain text.
+
+    Unlike /content, the lines are not packed into a JSON string: they are
+    sent in chunks straight from a memory map of the file, so large logs are
+    never held in memory or escaped. Line counts are returned in the
+    X-Total-Lines and X-Displayed-Lines headers.
+
+    Args:
+        file_name: Name of the log file
+        max_lines: Maximum number of lines to return
+        tail: If True, returns the last max_lines, otherwise returns from the beginning
+        current_user: Current user
+
+    Returns:
+        StreamingResponse: text/plain stream of the selected lines
+    """
+    file_path, start, end, total_lines = log_service.get_log_range(
+        file_name, max_lines, tail
+    )
+
+    return StreamingResponse(
+        log_service.iter_log_bytes(file_path, start, end),
+        media_type="text/plain; charset=utf-8",
+        headers={
+            "X-Total-Lines": str(total_lines),
+            "X-Displayed-Lines": str(min(max_lines, total_lines)),
+        },
+    )
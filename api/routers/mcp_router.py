@@ -2,9 +2,11 @@
 MCP router.
 """
 
+import asyncio
 import json
 import logging
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import List, Dict, Any, Optional, Tuple
 
 from fastapi import APIRouter, Depends, Request as FastAPIRequest
@@ -15,37 +17,60 @@ from mcp.types import TextContent
 from mcp.types import Tool as McpTool
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.config import get_config
 from api.database import get_db
 from api.errors.mcp_error import McpMessageHandlingError, McpToolExecutionError
 from api.errors.tool_error import ToolNotFoundError
+from api.models.tb_user import TbUser
+from api.schemas.common_schema import Response as ApiResponse
+from api.schemas.mcp_schema import McpConcurrencyResponse, McpConcurrencyUpdate
 from api.services.tool_service import ToolService
+from api.utils.json_util import loads_cached
+from api.utils.security_util import check_is_admin, get_current_user
 
 # Create logger
 logger = logging.getLogger(__name__)
 
+# Get configuration
+config = get_config()
+
 # Create router
 router = APIRouter(tags=["mcp"])
 
+# 当前 SSE 连接的数据库会话和标签过滤器，由 handle_sse 设置，
+# MCP 服务器处理请求时在同一上下文中读取
+_db_ctx: ContextVar[AsyncSession] = ContextVar("mcp_db")
+_tag_filter_ctx: ContextVar[Optional[str]] = ContextVar("mcp_tag_filter", default=None)
+
 
 class McpServerManager:
     """MCP 服务器管理类，负责初始化和管理 MCP 服务器及 SSE 传输"""
 
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 10):
         self.server: Optional[McpServer] = None
         self.transport: Optional[SseServerTransport] = None
+        # 工具执行并发控制：使用 Condition 保护计数器，支持运行时调整上限
+        self._active = 0
+        self._max = max_concurrency
+        self._cond = asyncio.Condition()
 
     def initialize(self):
         """初始化 MCP 服务器和 SSE 传输
 
-        注意：工具列表和执行函数将在 handle_sse 中注册，
-        以便能够访问数据库会话
+        工具列表和执行函数只在这里注册一次，数据库会话和标签过滤器
+        通过上下文变量从 handle_sse 传入
         """
         logger.info("初始化 MCP 服务器...")
         self.server = McpServer("Easy MCP Server")
         self.transport = SseServerTransport("/messages/")
 
-        # 注意：工具列表和执行函数将在 handle_sse 中注册
-        # 这里不注册是因为我们需要数据库会话
+        @self.server.list_tools()
+        async def list_tools() -> List[McpTool]:
+            return await self._get_enabled_tools(_db_ctx.get(), _tag_filter_ctx.get())
+
+        @self.server.call_tool()
+        async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+            return await self._execute_tool(name, arguments, _db_ctx.get())
 
         logger.info("MCP 服务器初始化成功")
 
@@ -56,6 +81,44 @@ class McpServerManager:
         self.server = None
         self.transport = None
 
+    @property
+    def max_concurrency(self) -> int:
+        """工具执行并发上限"""
+        return self._max
+
+    @property
+    def active_count(self) -> int:
+        """正在执行的工具数量"""
+        return self._active
+
+    async def set_max_concurrency(self, value: int):
+        """调整工具执行并发上限
+
+        调大上限时唤醒所有等待者重新检查条件；调小上限时，
+        正在执行的任务不受影响，新的执行请求会等待直到低于新上限。
+
+        Args:
+            value: 新的并发上限，必须大于 0
+        """
+        if value < 1:
+            raise ValueError("并发上限必须大于 0")
+        async with self._cond:
+            self._max = value
+            self._cond.notify_all()
+        logger.info(f"MCP 工具执行并发上限调整为 {value}")
+
+    async def _acquire_slot(self):
+        """等待并占用一个执行名额"""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._max)
+            self._active += 1
+
+    async def _release_slot(self):
+        """释放执行名额并唤醒一个等待者"""
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
     async def _get_enabled_tools(
         self, db: AsyncSession, tag_filter: Optional[str] = None
     ) -> List[McpTool]:
@@ -78,22 +141,13 @@ class McpServerManager:
             from api.services.tag_service import TagService
 
             tag_service = TagService(db)
-            tags, _ = await tag_service.query_tags(page=1, size=1000, search=tag_filter)
-            if tags:
-                # 找到匹配的标签
-                matching_tag = next(
-                    (tag for tag in tags if tag.name == tag_filter), None
-                )
-                if matching_tag:
-                    tag_ids = [matching_tag.id]
-
-        tools = await tool_service.query_tools(page=1, size=1000, tag_ids=tag_ids)
-
-        # 获取所有工具（第一个元素是工具列表，第二个是总数）
-        all_tools = tools[0]
+            # 按名称精确查找标签，避免拉取大量候选标签
+            matching_tag = await tag_service.get_tag_by_name(tag_filter)
+            if matching_tag:
+                tag_ids = [matching_tag.id]
 
-        # 过滤启用的工具
-        enabled_tools = [tool for tool in all_tools if tool.is_enabled]
+        # 获取所有启用的工具（只查询名称、描述和参数）
+        enabled_tools = await tool_service.list_mcp_tools(tag_ids=tag_ids)
 
         # 转换为 MCP 工具对象
         mcp_tools = []
@@ -110,16 +164,16 @@ class McpServerManager:
         """将数据库工具对象转换为 MCP 工具对象
 
         Args:
-            tool: 数据库工具对象
+            tool: 数据库工具对象或包含 name、description、parameters 的查询行
 
         Returns:
             Optional[McpTool]: MCP 工具对象，如果转换失败则返回 None
         """
-        # 解析参数
+        # 解析参数（按参数内容缓存解析结果）
         parameters = {}
         if tool.parameters:
             try:
-                parameters = json.loads(tool.parameters)
+                parameters = loads_cached(tool.parameters)
             except json.JSONDecodeError:
                 logger.warning(f"无法解析工具 {tool.name} 的参数")
                 return None
@@ -144,6 +198,7 @@ class McpServerManager:
         """
         logger.info(f"MCP 服务器: 调用工具: {name}, 参数: {arguments}")
 
+        await self._acquire_slot()
         try:
             result, logs = await self._process_tool_execution(name, arguments, db)
 
@@ -182,6 +237,8 @@ class McpServerManager:
             logger.error(f"执行工具 '{name}' 出错: {error_message}")
             error_response = {"error": error_message}
             return [TextContent(text=json.dumps(error_response, ensure_ascii=False))]
+        finally:
+            await self._release_slot()
 
     async def _process_tool_execution(
         self, name: str, arguments: Dict[str, Any], db: AsyncSession
@@ -203,7 +260,7 @@ class McpServerManager:
         tool_service = ToolService(db)
 
         # 获取工具
-        tool = await tool_service.get_tool_by_name(name)
+        tool = await tool_service.get_mcp_tool_ref(name)
         if not tool:
             logger.error(f"找不到工具 '{name}'")
             raise ToolNotFoundError(name=name)
@@ -230,7 +287,7 @@ class McpServerManager:
 
 
 # 创建全局 MCP 服务器管理器实例
-mcp_manager = McpServerManager()
+mcp_manager = McpServerManager(max_concurrency=config.mcp_max_concurrency)
 
 
 # MCP 服务器生命周期管理
@@ -283,26 +340,21 @@ async def handle_sse(
         server = get_mcp_server()
         transport = get_sse_transport()
 
-        # 注册工具列表函数（使用闭包捕获数据库会话和标签过滤器）
-        async def list_tools_with_db():
-            return await mcp_manager._get_enabled_tools(db, tag_filter)
-
-        # 注册工具执行函数（使用闭包捕获数据库会话）
-        async def execute_tool_with_db(name: str, arguments: Dict[str, Any]):
-            return await mcp_manager._execute_tool(name, arguments, db)
-
-        # 重新注册工具列表和执行函数
-        server.list_tools()(list_tools_with_db)
-        server.call_tool()(execute_tool_with_db)
-
-        # 连接到 SSE
-        async with transport.connect_sse(
-            request.scope, request.receive, request._send
-        ) as streams:
-            # 运行 MCP 应用
-            await server.run(
-                streams[0], streams[1], server.create_initialization_options()
-            )
+        # 为当前连接设置数据库会话和标签过滤器
+        db_token = _db_ctx.set(db)
+        tag_filter_token = _tag_filter_ctx.set(tag_filter)
+        try:
+            # 连接到 SSE
+            async with transport.connect_sse(
+                request.scope, request.receive, request._send
+            ) as streams:
+                # 运行 MCP 应用
+                await server.run(
+                    streams[0], streams[1], server.create_initialization_options()
+                )
+        finally:
+            _tag_filter_ctx.reset(tag_filter_token)
+            _db_ctx.reset(db_token)
         return Response()
     except Exception as e:
         logger.error(f"处理 SSE 连接时出错: {str(e)}")
@@ -376,3 +428,55 @@ async def message_handler(request: FastAPIRequest):
         error_msg = f"处理消息发送时出错: {str(e)}"
         logger.error(error_msg, exc_info=True)
         raise McpMessageHandlingError(error_message=str(e))
+
+
+def _concurrency_response() -> ApiResponse[McpConcurrencyResponse]:
+    """构建并发配置响应"""
+    return ApiResponse(
+        data=McpConcurrencyResponse(
+            max_concurrency=mcp_manager.max_concurrency,
+            active=mcp_manager.active_count,
+        )
+    )
+
+
+# 查询工具执行并发配置
+@router.get(
+    "/api/v1/mcp/concurrency", response_model=ApiResponse[McpConcurrencyResponse]
+)
+async def get_mcp_concurrency(current_user: TbUser = Depends(get_current_user)):
+    """获取 MCP 工具执行并发上限和当前执行数
+
+    Args:
+        current_user: 当前用户
+
+    Returns:
+        Response[McpConcurrencyResponse]: 并发配置
+    """
+    return _concurrency_response()
+
+
+# 运行时调整工具执行并发上限
+@router.put(
+    "/api/v1/mcp/concurrency", response_model=ApiResponse[McpConcurrencyResponse]
+)
+async def update_mcp_concurrency(
+    request: McpConcurrencyUpdate,
+    current_user: TbUser = Depends(get_current_user),
+):
+    """调整 MCP 工具执行并发上限
+
+    Args:
+        request: 并发配置
+        current_user: 当前用户
+
+    Returns:
+        Response[McpConcurrencyResponse]: 调整后的并发配置
+
+    Raises:
+        HTTPException: 当前用户不是管理员时
+    """
+    # 并发上限作用于整个进程，仅管理员可调整
+    await check_is_admin(current_user)
+    await mcp_manager.set_max_concurrency(request.max_concurrency)
+    return _concurrency_response()
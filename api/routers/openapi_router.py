@@ -8,20 +8,63 @@ from typing import List
 from fastapi import APIRouter, Depends, File, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.config import get_config
 from api.database import get_db
+from api.errors.base_error import ValidationError
 from api.models.tb_user import TbUser
 from api.schemas.common_schema import Response
 from api.schemas.openapi_schema import OpenApi
 from api.schemas.tool_schema import ToolResponse
 from api.services.openapi_service import OpenApiService
+from api.utils.param_util import json_body
 from api.utils.security_util import get_current_user
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Get configuration
+config = get_config()
+
 # Create router
 router = APIRouter(prefix="/tool-openapi", tags=["tool-openapi"])
 
+# Chunk size used when reading uploaded files
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def _read_upload(file: UploadFile, max_size: int) -> bytes:
+    """
+    Read an uploaded file in chunks, rejecting it once it exceeds max_size.
+
+    Args:
+        file: Uploaded file
+        max_size: Maximum allowed size in bytes
+
+    Returns:
+        bytes: File content
+
+    Raises:
+        ValidationError: If the file is larger than max_size
+    """
+    too_large = ValidationError(
+        reason="File too large",
+        description=f"OpenAPI file exceeds the maximum size of {max_size} bytes",
+    )
+
+    # Reject early when the multipart parser already knows the size
+    if file.size is not None and file.size > max_size:
+        raise too_large
+
+    chunks = []
+    received = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        received += len(chunk)
+        if received > max_size:
+            raise too_large
+        chunks.append(chunk)
+
+    return b"".join(chunks)
+
 
 @router.post("/analyze", response_model=Response[OpenApi])
 async def analyze_openapi(
@@ -41,7 +84,7 @@ async def analyze_openapi(
         Response[OpenApiAnalysisResponse]: Analysis result
     """
     # Read file content
-    file_content = await file.read()
+    file_content = await _read_upload(file, config.openapi_max_upload_size)
 
     # Analyze OpenAPI file
     service = OpenApiService(db)
@@ -50,19 +93,34 @@ async def analyze_openapi(
     return Response(data=result)
 
 
-@router.post("/import", response_model=Response[List[ToolResponse]])
+@router.post(
+    "/import",
+    response_model=Response[List[ToolResponse]],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": {"$ref": "#/components/schemas/OpenApi"}}
+            },
+        }
+    },
+)
 async def import_openapi(
-    import_data: OpenApi,
     db: AsyncSession = Depends(get_db),
     current_user: TbUser = Depends(get_current_user),
+    import_data: OpenApi = Depends(json_body(OpenApi)),
 ):
     """
     Import OpenAPI tools.
 
+    The body can hold thousands of endpoints, so it is parsed and validated
+    in a single pass from the raw bytes instead of going through an
+    intermediate Python object.
+
     Args:
-        import_data: Import data
         db: Database session
         current_user: Current user
+        import_data: OpenApi import data
 
     Returns:
         Response[List[ToolResponse]]: Imported tools
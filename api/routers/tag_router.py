@@ -17,6 +17,7 @@ from api.schemas.tag_schema import (
     TagWithToolCount,
 )
 from api.services.tag_service import TagService
+from api.utils.response_util import paginated_json_response
 from api.utils.security_util import get_current_user
 
 # Create router
@@ -49,9 +50,8 @@ async def get_tags(
     service = TagService(db)
     tags, total = await service.query_tags(page, size, search)
 
-    return PaginatedResponse(
-        data=[TagResponse.model_validate(tag.__dict__) for tag in tags], total=total
-    )
+    # Tag rows map one-to-one onto TagResponse
+    return paginated_json_response([tag.model_dump() for tag in tags], total)
 
 
 @router.get("/with-count", response_model=PaginatedResponse[TagWithToolCount])
@@ -80,10 +80,8 @@ async def get_tags_with_tool_count(
     service = TagService(db)
     tags_with_count, total = await service.get_tags_with_tool_count(page, size, search)
 
-    return PaginatedResponse(
-        data=[TagWithToolCount.model_validate(tag) for tag in tags_with_count],
-        total=total,
-    )
+    # The service already returns TagWithToolCount-shaped dictionaries
+    return paginated_json_response(tags_with_count, total)
 
 
 @router.post("", response_model=Response[TagResponse])
@@ -106,7 +104,7 @@ async def create_tag(
     service = TagService(db)
     tag = await service.create_tag(tag_data, current_user.username)
 
-    return Response(data=TagResponse.model_validate(tag.__dict__))
+    return Response(data=TagResponse.model_validate(tag))
 
 
 @router.get("/{tag_id}", response_model=Response[TagResponse])
@@ -134,7 +132,7 @@ async def get_tag(
 
         raise TagNotFoundError(tag_id=tag_id)
 
-    return Response(data=TagResponse.model_validate(tag.__dict__))
+    return Response(data=TagResponse.model_validate(tag))
 
 
 @router.put("/{tag_id}", response_model=Response[TagResponse])
@@ -159,7 +157,7 @@ async def update_tag(
     service = TagService(db)
     tag = await service.update_tag(tag_id, tag_data, current_user.username)
 
-    return Response(data=TagResponse.model_validate(tag.__dict__))
+    return Response(data=TagResponse.model_validate(tag))
 
 
 @router.delete("/{tag_id}", response_model=Response[None])
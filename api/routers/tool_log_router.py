@@ -5,6 +5,7 @@ Tool log router.
 from typing import Optional, List
 
 from fastapi import APIRouter, Depends, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.database import get_db
@@ -17,11 +18,16 @@ from api.schemas.tool_log_schema import (
     ToolUsageStatsResponse,
 )
 from api.services.tool_log_service import ToolLogService
+from api.utils.json_util import dump_rows_json
+from api.utils.response_util import raw_json_response, raw_paginated_json_response
 from api.utils.security_util import get_current_user
 
 # Create router
 router = APIRouter(prefix="/tool-log", tags=["tool-log"])
 
+_TRENDS_ADAPTER = TypeAdapter(List[ToolTrendResponse])
+_TOOL_USAGE_STATS_ADAPTER = TypeAdapter(List[ToolUsageStatsResponse])
+
 
 @router.get("", response_model=PaginatedResponse[ToolLogResponse])
 async def get_tool_logs(
@@ -57,8 +63,13 @@ async def get_tool_logs(
         page, size, tool_name, call_type, is_success, start_time, end_time
     )
 
-    return PaginatedResponse(
-        data=[ToolLogResponse.model_validate(log) for log in logs], total=total
+    # Log rows map one-to-one onto ToolLogResponse; the JSON payload columns
+    # are embedded as-is instead of being escaped into strings
+    return raw_paginated_json_response(
+        dump_rows_json(
+            logs, ToolLogResponse.model_fields, ToolLogResponse.json_columns
+        ),
+        total,
     )
 
 
@@ -80,7 +91,8 @@ async def get_tool_stats(
     service = ToolLogService(db)
     stats = await service.get_stats()
 
-    return Response(data=stats)
+    # Stats are built from trusted aggregates; encode without revalidating
+    return raw_json_response(stats.model_dump_json().encode())
 
 
 @router.get("/trends", response_model=Response[List[ToolTrendResponse]])
@@ -103,7 +115,7 @@ async def get_tool_trends(
     service = ToolLogService(db)
     trends = await service.get_trends(days)
 
-    return Response(data=trends)
+    return raw_json_response(_TRENDS_ADAPTER.dump_json(trends))
 
 
 @router.get("/tool-stats", response_model=Response[List[ToolUsageStatsResponse]])
@@ -126,4 +138,4 @@ async def get_tool_usage_stats(
     service = ToolLogService(db)
     tool_stats = await service.get_tool_stats(limit)
 
-    return Response(data=tool_stats)
+    return raw_json_response(_TOOL_USAGE_STATS_ADAPTER.dump_json(tool_stats))
@@ -2,14 +2,18 @@
 Tool router.
 """
 
-from typing import List, Optional, Any
-import json
+from typing import AsyncIterator, Dict, List, Optional, Any, Set
 
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, Depends, Query, Request, Response as FastAPIResponse
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.database import get_db
+from api.database import get_db, get_session
 from api.errors.tool_error import ToolExecutionError, ToolNotFoundError
+from api.models.tb_tag import TbTag
+from api.models.tb_tool import TbTool
 from api.models.tb_user import TbUser
 from api.schemas.common_schema import PaginatedResponse, Response
 from api.schemas.config_schema import ConfigResponse
@@ -21,18 +25,58 @@ from api.schemas.tool_schema import (
     ToolDebugRequest,
     ToolDebugResponse,
     ToolDeployResponse,
+    ToolDetailResponse,
     ToolResponse,
     ToolUpdate,
     ToolMcpResponse,
     ToolMcpExecuteRequest,
 )
 from api.schemas.tag_schema import TagResponse, ToolTagRequest
-from api.services.tool_service import ToolService
+from api.services.tool_service import BUILTIN_TOOLS_CACHE_TTL, ToolService
+from api.utils.json_util import loads_cached
+from api.utils.param_util import parse_tag_ids, parse_tool_include
+from api.utils.response_util import (
+    check_etag,
+    compute_etag,
+    raw_json_response,
+    validate_rows,
+)
 from api.utils.security_util import get_current_user
 
 # Create router
 router = APIRouter(prefix="/tool", tags=["tool"])
 
+# List validators, built once so each list is validated in a single call
+_TOOLS_ADAPTER = TypeAdapter(List[ToolResponse])
+_TAGS_ADAPTER = TypeAdapter(List[TagResponse])
+_FUNCS_ADAPTER = TypeAdapter(List[FuncResponse])
+_CONFIGS_ADAPTER = TypeAdapter(List[ConfigResponse])
+_DEPLOYS_ADAPTER = TypeAdapter(List[ToolDeployResponse])
+
+
+def _build_tool_responses(
+    tools: List[TbTool], tags_by_tool: Dict[int, List[TbTag]]
+) -> List[ToolResponse]:
+    """
+    Build tool responses with their tags, reading ORM attributes directly.
+
+    Args:
+        tools: Tool objects
+        tags_by_tool: Tags keyed by tool ID
+
+    Returns:
+        List[ToolResponse]: Tool responses
+    """
+    responses = validate_rows(_TOOLS_ADAPTER, ToolResponse, tools)
+    for response in responses:
+        # Tag rows map one-to-one onto TagResponse and come straight from the
+        # database, so they are constructed without validation
+        response.tags = [
+            TagResponse.model_construct(**tag.model_dump())
+            for tag in tags_by_tool[response.id]
+        ]
+    return responses
+
 
 @router.get("", response_model=PaginatedResponse[ToolResponse])
 async def get_tools(
@@ -41,8 +85,12 @@ async def get_tools(
     search: Optional[str] = Query(
         None, description="Search term for name or description"
     ),
-    tag_ids: Optional[str] = Query(
-        None, description="Comma-separated tag IDs to filter by"
+    tag_ids: Optional[List[int]] = Depends(parse_tag_ids),
+    cursor: Optional[int] = Query(
+        None, description="Cursor from the previous page (overrides page)"
+    ),
+    include_total: bool = Query(
+        True, description="Whether to count the total number of tools"
     ),
     db: AsyncSession = Depends(get_db),
     current_user: TbUser = Depends(get_current_user),
@@ -54,7 +102,9 @@ async def get_tools(
         page: Page number
         size: Page size
         search: Search term
-        tag_ids: Comma-separated tag IDs to filter by (e.g., "1,2,3")
+        tag_ids: Tag IDs to filter by, parsed from e.g. "1,2,3"
+        cursor: Cursor from the previous page's next_cursor
+        include_total: Whether to count the total number of tools
         db: Database session
         current_user: Current user
 
@@ -63,27 +113,19 @@ async def get_tools(
     """
     service = ToolService(db)
 
-    # Parse comma-separated tag_ids string to list of integers
-    parsed_tag_ids = None
-    if tag_ids:
-        try:
-            parsed_tag_ids = [
-                int(tag_id.strip()) for tag_id in tag_ids.split(",") if tag_id.strip()
-            ]
-        except ValueError:
-            parsed_tag_ids = None
+    tools, total, has_next = await service.query_tools(
+        page, size, search, tag_ids, cursor, include_total
+    )
 
-    tools, total = await service.query_tools(page, size, search, parsed_tag_ids)
+    # Load tags for the whole page in one query
+    tags_by_tool = await service.get_tools_tags([tool.id for tool in tools])
+    tool_responses = _build_tool_responses(tools, tags_by_tool)
 
-    # Load tags for each tool
-    tool_responses = []
-    for tool in tools:
-        tags = await service.get_tool_tags(tool.id)
-        tool_dict = tool.__dict__.copy()
-        tool_dict["tags"] = [tag.__dict__ for tag in tags]
-        tool_responses.append(ToolResponse.model_validate(tool_dict))
+    next_cursor = str(tools[-1].id) if has_next else None
 
-    return PaginatedResponse(data=tool_responses, total=total)
+    return PaginatedResponse(
+        data=tool_responses, total=total, has_next=has_next, next_cursor=next_cursor
+    )
 
 
 @router.post("", response_model=Response[ToolResponse])
@@ -128,42 +170,74 @@ async def create_and_deploy_tool(
     """
     service = ToolService(db)
     tool = await service.create_tool(tool_data, current_user.username)
-    await service.deploy_tool(tool.id, "Initial deployment", current_user.username)
-
-    # Refresh tool to get updated version
-    tool = await service.get_tool_by_id(tool.id)
+    await service.deploy_tool(
+        tool.id, "Initial deployment", current_user.username, tool=tool
+    )
 
     return Response(data=ToolResponse.model_validate(tool))
 
 
-@router.get("/{tool_id}", response_model=Response[ToolResponse])
+@router.get("/{tool_id}", response_model=Response[ToolDetailResponse])
 async def get_tool(
     tool_id: int,
+    request: Request,
+    http_response: FastAPIResponse,
+    include: Set[str] = Depends(parse_tool_include),
     db: AsyncSession = Depends(get_db),
     current_user: TbUser = Depends(get_current_user),
 ):
     """
     Get tool by ID.
 
+    Tags are always returned; funcs and configs are embedded when listed in
+    include, saving separate calls to /func and /config. Supports
+    conditional requests: an If-None-Match matching the returned ETag gets
+    304 Not Modified.
+
     Args:
         tool_id: Tool ID
+        request: Current request
+        http_response: Response used to set the ETag header
+        include: Related data to embed, parsed from e.g. "funcs,configs"
         db: Database session
         current_user: Current user
 
     Returns:
-        Response[ToolResponse]: Tool
+        Response[ToolDetailResponse]: Tool
     """
     service = ToolService(db)
-    tool = await service.get_tool_by_id(tool_id)
-
-    if tool:
-        tags = await service.get_tool_tags(tool.id)
-        tool_dict = tool.__dict__.copy()
-        tool_dict["tags"] = [tag.__dict__ for tag in tags]
-        return Response(data=ToolResponse.model_validate(tool_dict))
-    else:
+    tool, tags = await service.get_tool_with_tags(tool_id)
+
+    if not tool:
         return Response(data=None)
 
+    funcs = await service.get_tool_funcs(tool.id) if "funcs" in include else None
+    configs = await service.get_tool_configs(tool.id) if "configs" in include else None
+
+    etag = compute_etag(
+        "tool",
+        tool.id,
+        tool.updated_at,
+        tool.current_version,
+        tool.is_enabled,
+        [(tag.id, tag.updated_at) for tag in tags],
+        funcs and [(func.id, func.updated_at) for func in funcs],
+        configs and [(config.id, config.updated_at) for config in configs],
+        sorted(include),
+    )
+    not_modified = check_etag(request, http_response, etag)
+    if not_modified is not None:
+        return not_modified
+
+    detail = ToolDetailResponse.model_validate(tool)
+    detail.tags = _TAGS_ADAPTER.validate_python(tags)
+    if funcs is not None:
+        detail.funcs = _FUNCS_ADAPTER.validate_python(funcs)
+    if configs is not None:
+        detail.configs = validate_rows(_CONFIGS_ADAPTER, ConfigResponse, configs)
+
+    return Response(data=detail)
+
 
 @router.put("/{tool_id}", response_model=Response[ToolResponse])
 async def update_tool(
@@ -213,10 +287,7 @@ async def update_and_deploy_tool(
     """
     service = ToolService(db)
     tool = await service.update_tool(tool_id, tool_data, current_user.username)
-    await service.deploy_tool(tool_id, description, current_user.username)
-
-    # Refresh tool to get updated version
-    tool = await service.get_tool_by_id(tool_id)
+    await service.deploy_tool(tool_id, description, current_user.username, tool=tool)
 
     return Response(data=ToolResponse.model_validate(tool) if tool else None)
 
@@ -226,18 +297,28 @@ async def update_and_deploy_tool(
 )
 async def get_tool_deploy_history(
     tool_id: int,
+    request: Request,
+    http_response: FastAPIResponse,
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[int] = Query(
+        None, description="Cursor from the previous page (overrides page)"
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: TbUser = Depends(get_current_user),
 ):
     """
     Get tool deployment history.
 
+    Supports conditional requests via ETag / If-None-Match.
+
     Args:
         tool_id: Tool ID
+        request: Current request
+        http_response: Response used to set the ETag header
         page: Page number
         size: Page size
+        cursor: Cursor from the previous page's next_cursor
         db: Database session
         current_user: Current user
 
@@ -245,11 +326,30 @@ async def get_tool_deploy_history(
         PaginatedResponse[ToolDeployResponse]: Paginated list of tool deployments
     """
     service = ToolService(db)
-    deploys, total = await service.get_tool_deploy_history(tool_id, page, size)
+    deploys, total, has_next = await service.get_tool_deploy_history(
+        tool_id, page, size, cursor
+    )
+
+    etag = compute_etag(
+        "deploys",
+        tool_id,
+        page,
+        size,
+        cursor,
+        total,
+        [(deploy.id, deploy.updated_at) for deploy in deploys],
+    )
+    not_modified = check_etag(request, http_response, etag)
+    if not_modified is not None:
+        return not_modified
+
+    next_cursor = str(deploys[-1].version) if has_next else None
 
     return PaginatedResponse(
-        data=[ToolDeployResponse.model_validate(deploy) for deploy in deploys],
+        data=validate_rows(_DEPLOYS_ADAPTER, ToolDeployResponse, deploys),
         total=total,
+        has_next=has_next,
+        next_cursor=next_cursor,
     )
 
 
@@ -348,6 +448,8 @@ async def debug_tool(
 @router.get("/{tool_id}/func", response_model=Response[List[FuncResponse]])
 async def get_tool_functions(
     tool_id: int,
+    request: Request,
+    http_response: FastAPIResponse,
     db: AsyncSession = Depends(get_db),
     current_user: TbUser = Depends(get_current_user),
 ):
@@ -356,6 +458,8 @@ async def get_tool_functions(
 
     Args:
         tool_id: Tool ID
+        request: Current request
+        http_response: Response used to set the ETag header
         db: Database session
         current_user: Current user
 
@@ -365,14 +469,19 @@ async def get_tool_functions(
     service = ToolService(db)
     funcs = await service.get_tool_funcs(tool_id)
 
-    func_responses = [FuncResponse.model_validate(func) for func in funcs]
+    etag = compute_etag("func", tool_id, [(item.id, item.updated_at) for item in funcs])
+    not_modified = check_etag(request, http_response, etag)
+    if not_modified is not None:
+        return not_modified
 
-    return Response(data=func_responses)
+    return Response(data=_FUNCS_ADAPTER.validate_python(funcs))
 
 
 @router.get("/{tool_id}/config", response_model=Response[List[ConfigResponse]])
 async def get_tool_configs(
     tool_id: int,
+    request: Request,
+    http_response: FastAPIResponse,
     db: AsyncSession = Depends(get_db),
     current_user: TbUser = Depends(get_current_user),
 ):
@@ -381,6 +490,8 @@ async def get_tool_configs(
 
     Args:
         tool_id: Tool ID
+        request: Current request
+        http_response: Response used to set the ETag header
         db: Database session
         current_user: Current user
 
@@ -390,9 +501,14 @@ async def get_tool_configs(
     service = ToolService(db)
     configs = await service.get_tool_configs(tool_id)
 
-    config_responses = [ConfigResponse.model_validate(config) for config in configs]
+    etag = compute_etag(
+        "config", tool_id, [(item.id, item.updated_at) for item in configs]
+    )
+    not_modified = check_etag(request, http_response, etag)
+    if not_modified is not None:
+        return not_modified
 
-    return Response(data=config_responses)
+    return Response(data=validate_rows(_CONFIGS_ADAPTER, ConfigResponse, configs))
 
 
 @router.patch("/{tool_id}/enable", response_model=Response[ToolResponse])
@@ -441,6 +557,7 @@ async def disable_tool(
 
 @router.get("-builtin", response_model=Response[BuiltinToolListResponse])
 async def list_builtin_tools(
+    http_response: FastAPIResponse,
     db: AsyncSession = Depends(get_db),
     current_user: TbUser = Depends(get_current_user),
 ):
@@ -452,6 +569,11 @@ async def list_builtin_tools(
     """
     service = ToolService(db)
     response = await service.list_builtin_tools()
+
+    # The catalog only changes on redeploy, let the browser reuse it too
+    http_response.headers["Cache-Control"] = (
+        f"private, max-age={BUILTIN_TOOLS_CACHE_TTL}"
+    )
     return Response(data=response)
 
 
@@ -485,24 +607,61 @@ async def list_mcp_tools(
     """
     List all tools available for MCP.
 
+    The rendered list is cached by the service until a tool changes and is
+    returned as raw JSON.
+
     Returns:
         Response[List[ToolMcpResponse]]: List of tools with name, description and parameters
     """
     service = ToolService(db)
-    tools, _ = await service.query_tools(page=1, size=1000)  # Get all tools
-
-    # Filter enabled tools and map to MCP response
-    mcp_tools = [
-        ToolMcpResponse(
-            name=tool.name,
-            description=tool.description,
-            parameters=json.loads(tool.parameters),
-        )
-        for tool in tools
-        if tool.is_enabled
-    ]
+    return raw_json_response(await service.get_mcp_tools_json())
 
-    return Response(data=mcp_tools)
+
+@router.get(
+    "-mcp/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "One tool per line",
+            "content": {
+                "application/x-ndjson": {"schema": ToolMcpResponse.model_json_schema()}
+            },
+        }
+    },
+)
+async def stream_mcp_tools(
+    tag_ids: Optional[List[int]] = Depends(parse_tag_ids),
+    current_user: TbUser = Depends(get_current_user),
+):
+    """
+    Stream tools available for MCP as newline-delimited JSON.
+
+    Each line is one tool with name, description and parameters, written as
+    rows arrive from the database so large catalogs are never held in memory.
+
+    Args:
+        tag_ids: Tag IDs to filter by
+        current_user: Current user
+
+    Returns:
+        StreamingResponse: application/x-ndjson stream of tools
+    """
+
+    async def iter_lines() -> AsyncIterator[bytes]:
+        # The request scoped session is closed before a streaming body is sent,
+        # so the stream owns its session
+        async with get_session() as db:
+            async for tool in ToolService(db).stream_mcp_tools(tag_ids):
+                line = orjson.dumps(
+                    {
+                        "name": tool.name,
+                        "description": tool.description,
+                        "parameters": loads_cached(tool.parameters),
+                    }
+                )
+                yield line + b"\n"
+
+    return StreamingResponse(iter_lines(), media_type="application/x-ndjson")
 
 
 @router.post("-mcp/{name}/execute", response_model=Response[Any])
@@ -527,7 +686,7 @@ async def execute_mcp_tool(
     service = ToolService(db)
 
     # Get tool by name
-    tool = await service.get_tool_by_name(name)
+    tool = await service.get_mcp_tool_ref(name)
     if not tool:
         raise ToolNotFoundError(name=name)
 
@@ -543,6 +702,8 @@ async def execute_mcp_tool(
 @router.get("/{tool_id}/tags", response_model=Response[List[TagResponse]])
 async def get_tool_tags(
     tool_id: int,
+    request: Request,
+    http_response: FastAPIResponse,
     db: AsyncSession = Depends(get_db),
     current_user: TbUser = Depends(get_current_user),
 ):
@@ -551,6 +712,8 @@ async def get_tool_tags(
 
     Args:
         tool_id: Tool ID
+        request: Current request
+        http_response: Response used to set the ETag header
         db: Database session
         current_user: Current user
 
@@ -560,7 +723,12 @@ async def get_tool_tags(
     service = ToolService(db)
     tags = await service.get_tool_tags(tool_id)
 
-    return Response(data=[TagResponse.model_validate(tag.__dict__) for tag in tags])
+    etag = compute_etag("tags", tool_id, [(item.id, item.updated_at) for item in tags])
+    not_modified = check_etag(request, http_response, etag)
+    if not_modified is not None:
+        return not_modified
+
+    return Response(data=_TAGS_ADAPTER.validate_python(tags))
 
 
 @router.put("/{tool_id}/tags", response_model=Response[None])
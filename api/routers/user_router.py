@@ -2,23 +2,39 @@
 User router.
 """
 
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response as FastAPIResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.database import get_db
 from api.models.tb_user import TbUser
-from api.schemas.common_schema import Response, PaginatedResponse
-from api.schemas.user_schema import UserCreate, UserUpdate, UserResponse
-from api.services.user_service import UserService
+from api.schemas.user_schema import (
+    UserCreate,
+    UserItemResponse,
+    UserListResponse,
+    UserResponse,
+    UserUpdate,
+)
+from api.services.user_service import (
+    UserService,
+    get_cached_user_read,
+    get_user_read_cache_version,
+    set_cached_user_read,
+)
+from api.utils.param_util import json_body, json_body_openapi
+from api.utils.response_util import paginated_json_response
 from api.utils.security_util import get_current_user
 
 # Create router
 router = APIRouter(prefix="/user", tags=["user"])
 
+# List validator, built once so each page is validated in a single call
+_USERS_ADAPTER = TypeAdapter(List[UserResponse])
 
-@router.get("", response_model=PaginatedResponse[UserResponse])
+
+@router.get("", response_model=UserListResponse)
 async def get_users(
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(20, ge=1, le=100, description="Page size"),
@@ -31,6 +47,9 @@ async def get_users(
     """
     Get users with pagination.
 
+    Pages are served from a short-lived process cache that is cleared
+    whenever a user changes; the X-Cache header reports HIT or MISS.
+
     Args:
         page: Page number
         size: Page size
@@ -39,63 +58,91 @@ async def get_users(
         current_user: Current user
 
     Returns:
-        PaginatedResponse[UserResponse]: Paginated list of users
+        UserListResponse: Paginated list of users
     """
-    service = UserService(db)
-    users, total = await service.query_users(page, size, search)
-
-    return PaginatedResponse(
-        data=[UserResponse.model_validate(user) for user in users], total=total
-    )
-
-
-@router.post("", response_model=Response[UserResponse])
+    cache_key = ("list", page, size, search)
+    cached = get_cached_user_read(cache_key)
+    if cached is None:
+        version = get_user_read_cache_version()
+        service = UserService(db)
+        users, total = await service.query_users(page, size, search)
+        cached = (
+            _USERS_ADAPTER.dump_python(_USERS_ADAPTER.validate_python(users)),
+            total,
+        )
+        set_cached_user_read(cache_key, cached, version)
+        cache_status = "MISS"
+    else:
+        cache_status = "HIT"
+
+    response = paginated_json_response(*cached)
+    response.headers["X-Cache"] = cache_status
+    return response
+
+
+@router.post(
+    "", response_model=UserItemResponse, openapi_extra=json_body_openapi(UserCreate)
+)
 async def create_user(
-    user_data: UserCreate,
     db: AsyncSession = Depends(get_db),
     current_user: TbUser = Depends(get_current_user),
+    user_data: UserCreate = Depends(json_body(UserCreate)),
 ):
     """
     Create a new user.
 
     Args:
-        user_data: User data
         db: Database session
         current_user: Current user
+        user_data: User data
 
     Returns:
-        Response[UserResponse]: Created user
+        UserItemResponse: Created user
     """
     service = UserService(db)
     user = await service.create_user(user_data, current_user.username)
 
-    return Response(data=UserResponse.model_validate(user))
+    return UserItemResponse(data=UserResponse.model_validate(user))
 
 
-@router.get("/{user_id}", response_model=Response[UserResponse])
+@router.get("/{user_id}", response_model=UserItemResponse)
 async def get_user(
     user_id: int,
+    http_response: FastAPIResponse,
     db: AsyncSession = Depends(get_db),
     current_user: TbUser = Depends(get_current_user),
 ):
     """
     Get user by ID.
 
+    Served from the same cache as the user list, see get_users.
+
     Args:
         user_id: User ID
+        http_response: Outgoing response, receives the X-Cache header
         db: Database session
         current_user: Current user
 
     Returns:
-        Response[UserResponse]: User
+        UserItemResponse: User
     """
-    service = UserService(db)
-    user = await service.get_user_by_id(user_id)
-
-    return Response(data=UserResponse.model_validate(user) if user else None)
-
-
-@router.put("/{user_id}", response_model=Response[UserResponse])
+    cache_key = ("user", user_id)
+    cached = get_cached_user_read(cache_key)
+    if cached is None:
+        version = get_user_read_cache_version()
+        service = UserService(db)
+        user = await service.get_user_by_id(user_id)
+        # Wrapped in a tuple so a missing user is cached too
+        cached = (UserResponse.model_validate(user) if user else None,)
+        set_cached_user_read(cache_key, cached, version)
+        http_response.headers["X-Cache"] = "MISS"
+    else:
+        http_response.headers["X-Cache"] = "HIT"
+
+    return UserItemResponse(data=cached[0])
+
+
+@router.put("/{user_id}", response_model=UserItemResponse)
 async def update_user(
     user_id: int,
     user_data: UserUpdate,
@@ -112,15 +159,15 @@ async def update_user(
         current_user: Current user
 
     Returns:
-        Response[UserResponse]: Updated user
+        UserItemResponse: Updated user
     """
     service = UserService(db)
     user = await service.update_user(user_id, user_data, current_user.username)
 
-    return Response(data=UserResponse.model_validate(user) if user else None)
+    return UserItemResponse(data=UserResponse.model_validate(user) if user else None)
 
 
-@router.delete("/{user_id}", response_model=Response[UserResponse])
+@router.delete("/{user_id}", response_model=UserItemResponse)
 async def delete_user(
     user_id: int,
     db: AsyncSession = Depends(get_db),
@@ -135,9 +182,9 @@ async def delete_user(
         current_user: Current user
 
     Returns:
-        Response[UserResponse]: Deleted user
+        UserItemResponse: Deleted user
     """
     service = UserService(db)
     user = await service.delete_user(user_id, current_user.username)
 
-    return Response(data=UserResponse.model_validate(user) if user else None)
+    return UserItemResponse(data=UserResponse.model_validate(user) if user else None)
@@ -4,6 +4,24 @@ def easy_database_call(
     """
     Execute database query with direct driver support (synchronous version).
 
+    Connections to server databases are pooled per connection target, so
+    repeated calls skip the TCP/auth handshake. Function code is executed
+    afresh for every tool call, so the pools and the parsed URL cache live on
+    a module registered in sys.modules rather than in this function's
+    namespace.
+
+    Values from parameters are bound by the driver when the SQL uses the
+    driver's named placeholders: %(name)s for PostgreSQL, MySQL/Doris and
+    ClickHouse, :name for SQLite and Oracle. SQL without such placeholders is
+    executed as-is. Once placeholders are used with the %(name)s style, a
+    literal % in the SQL must be written as %%.
+
+    Read-only statements (SELECT, SHOW, DESCRIBE, EXPLAIN) can be cached by
+    setting sql_cache_ttl (seconds) in the tool configuration. Cached results
+    are reused until they expire. When the query fails, an expired result is
+    returned instead of the error while it is younger than
+    sql_cache_max_stale (seconds, 10 times sql_cache_ttl by default).
+
     Args:
         url: Database connection URL
         username: Database username
@@ -15,233 +33,417 @@ def easy_database_call(
     Returns:
         dict: Query results
     """
-    from urllib.parse import urlparse
-
-    print(f"url: {url}")
-    print(f"username: {username}")
-    print(f"sql: {sql}")
-
-    try:
-        # Parse database URL to determine driver type
-        # Handle JDBC URL format: jdbc:mysql://host:port/database
-        if url.startswith("jdbc:"):
-            # Extract the actual database URL from JDBC format
-            actual_url = url[5:]  # Remove 'jdbc:' prefix
-            parsed_url = urlparse(actual_url)
+    import re
+    import sys
+    import threading
+    import time
+    import types
+    from collections import OrderedDict
+
+    state_name = "_easy_database_call_pools"
+    state = sys.modules.get(state_name)
+    if state is None:
+        from functools import lru_cache
+        from urllib.parse import urlparse
+
+        def parse_url(url):
+            # Handle JDBC URL format: jdbc:mysql://host:port/database
+            return urlparse(url[5:] if url.startswith("jdbc:") else url)
+
+        state = types.ModuleType(state_name)
+        state.lock = threading.Lock()
+        state.engines = {}
+        state.clients = {}
+        state.parse_url = lru_cache(maxsize=256)(parse_url)
+        # Cached read-only results: key -> (fetched at, result), oldest first
+        state.results = OrderedDict()
+        state = sys.modules.setdefault(state_name, state)
+
+    def get_pool(key, dialect_url, creator):
+        # SQLAlchemy is used only for its connection pool: connections are
+        # still created by the native driver and handed out as DBAPI objects
+        with state.lock:
+            engine = state.engines.get(key)
+            if engine is None:
+                from sqlalchemy import create_engine
+
+                engine = create_engine(
+                    dialect_url,
+                    creator=creator,
+                    pool_size=5,
+                    max_overflow=5,
+                    pool_pre_ping=True,
+                    pool_recycle=3600,
+                )
+                state.engines[key] = engine
+            return engine
+
+    def fetch_dicts(cursor, column_names=None, batch_size=1000):
+        # Fetch in batches so driver rows are released as they are converted,
+        # instead of holding every raw row and every dict at the same time
+        results = []
+        while True:
+            batch = cursor.fetchmany(batch_size)
+            if not batch:
+                return results
+            if column_names is None:
+                results.extend(batch)
+            else:
+                results.extend(dict(zip(column_names, row)) for row in batch)
+
+    def bind_parameters(placeholder):
+        # Collect the parameters the SQL references through the driver's
+        # placeholder style; None means the SQL is executed without binding
+        if not parameters:
+            return None
+        names = set(re.findall(placeholder, sql))
+        bound = {name: parameters[name] for name in names if name in parameters}
+        return bound or None
+
+    def execute(cursor, placeholder):
+        bound = bind_parameters(placeholder)
+        if bound is None:
+            cursor.execute(sql)
         else:
-            parsed_url = urlparse(url)
+            cursor.execute(sql, bound)
+
+    # Named placeholder styles: %(name)s and :name
+    pyformat = r"%\((\w+)\)s"
+    named = r"(?<![:\w]):([A-Za-z_]\w*)"
+
+    def query_sqlite(parsed_url):
+        # SQLite support (synchronous)
+        import sqlite3
+
+        db_path = parsed_url.path
+        if db_path.startswith("/"):
+            db_path = db_path[1:]  # Remove leading slash
+
+        with sqlite3.connect(db_path) as conn:
+            cursor = conn.cursor()
+            execute(cursor, named)
+
+            # Get column names and descriptions
+            columns = []
+            column_names = []
+            if cursor.description:
+                for desc in cursor.description:
+                    column_name = desc[0]
+                    column_names.append(column_name)
+                    # SQLite doesn't provide column comments, use name as description
+                    columns.append({"name": column_name, "description": column_name})
+
+            # Fetch results as dicts built once per row from the column names
+            results = fetch_dicts(cursor, column_names) if cursor.description else []
+
+            return {"columns": columns, "rows": results, "row_count": len(results)}
+
+    def query_postgresql(parsed_url):
+        # PostgreSQL support (synchronous)
+        import psycopg2
+
+        # Build connection string
+        conn_str = f"postgresql://{username}:{password}@{parsed_url.hostname}:{parsed_url.port or 5432}{parsed_url.path}"
+
+        pool = get_pool(
+            ("postgresql", conn_str),
+            "postgresql+psycopg2://",
+            lambda: psycopg2.connect(conn_str),
+        )
+        conn = pool.raw_connection()
+        try:
+            # A plain tuple cursor: rows are decoded by the driver in C,
+            # and dicts are built once per row from the column names
+            with conn.cursor() as cursor:
+                execute(cursor, pyformat)
 
-        scheme = parsed_url.scheme.lower()
-
-        if scheme == "sqlite":
-            # SQLite support (synchronous)
-            import sqlite3
+                # Get column names and descriptions
+                columns = []
+                column_names = []
+                if cursor.description:
+                    for desc in cursor.description:
+                        column_name = desc[0]
+                        column_names.append(column_name)
+                        # PostgreSQL doesn't provide column comments in basic cursor, use name as description
+                        columns.append(
+                            {"name": column_name, "description": column_name}
+                        )
 
-            db_path = parsed_url.path
-            if db_path.startswith("/"):
-                db_path = db_path[1:]  # Remove leading slash
+                # Fetch results (statements without a result set have no description)
+                results = (
+                    fetch_dicts(cursor, column_names) if cursor.description else []
+                )
+                conn.commit()
 
-            with sqlite3.connect(db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(sql)
+                return {
+                    "columns": columns,
+                    "rows": results,
+                    "row_count": len(results),
+                }
+        finally:
+            # Return the connection to the pool
+            conn.close()
+
+    def query_mysql(parsed_url):
+        # MySQL/Doris support (synchronous)
+        # Doris uses MySQL protocol, so we can use the same driver
+        import pymysql
+
+        connect_args = {
+            "host": parsed_url.hostname,
+            "port": parsed_url.port,
+            "user": username,
+            "password": password,
+            "database": parsed_url.path[1:] if parsed_url.path else None,
+            "autocommit": True,
+            "cursorclass": pymysql.cursors.DictCursor,
+        }
+        pool = get_pool(
+            ("mysql",) + tuple(str(v) for v in connect_args.values()),
+            "mysql+pymysql://",
+            lambda: pymysql.connect(**connect_args),
+        )
+        conn = pool.raw_connection()
+        try:
+            # Unbuffered cursor: rows are streamed from the server while
+            # they are read instead of being buffered in full first
+            with conn.cursor(pymysql.cursors.SSDictCursor) as cursor:
+                execute(cursor, pyformat)
 
                 # Get column names and descriptions
                 columns = []
                 if cursor.description:
                     for desc in cursor.description:
                         column_name = desc[0]
-                        # SQLite doesn't provide column comments, use name as description
+                        # MySQL/Doris doesn't provide column comments in basic cursor, use name as description
                         columns.append(
                             {"name": column_name, "description": column_name}
                         )
 
-                # Fetch results
-                rows = cursor.fetchall()
-
-                # Convert to list of dicts
-                results = []
-                for row in rows:
-                    result_dict = {}
-                    for i, col_info in enumerate(columns):
-                        result_dict[col_info["name"]] = row[i]
-                    results.append(result_dict)
-
-                return {"columns": columns, "rows": results, "row_count": len(results)}
-
-        elif scheme in ["postgresql", "postgres"]:
-            # PostgreSQL support (synchronous)
-            import psycopg2
-            import psycopg2.extras
-
-            # Build connection string
-            conn_str = f"postgresql://{username}:{password}@{parsed_url.hostname}:{parsed_url.port or 5432}{parsed_url.path}"
-
-            with psycopg2.connect(conn_str) as conn:
-                with conn.cursor(
-                    cursor_factory=psycopg2.extras.RealDictCursor
-                ) as cursor:
-                    cursor.execute(sql)
-
-                    # Get column names and descriptions
-                    columns = []
-                    if cursor.description:
-                        for desc in cursor.description:
-                            column_name = desc[0]
-                            # PostgreSQL doesn't provide column comments in basic cursor, use name as description
-                            columns.append(
-                                {"name": column_name, "description": column_name}
-                            )
-
-                    # Fetch results
-                    rows = cursor.fetchall()
-
-                    # Convert to list of dicts
-                    results = []
-                    for row in rows:
-                        results.append(dict(row))
-
-                    return {
-                        "columns": columns,
-                        "rows": results,
-                        "row_count": len(results),
-                    }
-
-        elif scheme in ["mysql", "doris"]:
-            # MySQL/Doris support (synchronous)
-            # Doris uses MySQL protocol, so we can use the same driver
-            import pymysql
-
-            conn = pymysql.connect(
-                host=parsed_url.hostname,
-                port=parsed_url.port,
-                user=username,
-                password=password,
-                database=parsed_url.path[1:] if parsed_url.path else None,
-                autocommit=True,
-                cursorclass=pymysql.cursors.DictCursor,
-            )
-            try:
-                with conn.cursor() as cursor:
-                    cursor.execute(sql)
-
-                    # Get column names and descriptions
-                    columns = []
-                    if cursor.description:
-                        for desc in cursor.description:
-                            column_name = desc[0]
-                            # MySQL/Doris doesn't provide column comments in basic cursor, use name as description
-                            columns.append(
-                                {"name": column_name, "description": column_name}
-                            )
-
-                    # Fetch results
-                    rows = cursor.fetchall()
-
-                    # Convert to list of dicts (already dicts with DictCursor)
-                    results = list(rows) if rows else []
-
-                    return {
-                        "columns": columns,
-                        "rows": results,
-                        "row_count": len(results),
-                    }
-            finally:
-                conn.close()
-
-        elif scheme == "clickhouse":
-            # ClickHouse support (synchronous)
-            import clickhouse_connect
-
-            conn = clickhouse_connect.get_client(
-                host=parsed_url.hostname,
-                port=parsed_url.port,
-                username=username,
-                password=password,
-                database=parsed_url.path[1:] if parsed_url.path else "default",
-            )
-            try:
-                # Execute query using ClickHouse client
-                result = conn.query(sql)
+                # Fetch results (already dicts with SSDictCursor)
+                results = fetch_dicts(cursor) if cursor.description else []
+
+                return {
+                    "columns": columns,
+                    "rows": results,
+                    "row_count": len(results),
+                }
+        finally:
+            # Return the connection to the pool
+            conn.close()
+
+    def query_clickhouse(parsed_url):
+        # ClickHouse support (synchronous)
+        import clickhouse_connect
+
+        # The HTTP client keeps its own connection pool, so one client is
+        # shared per target; without a session id it is safe to share
+        # between threads
+        client_args = {
+            "host": parsed_url.hostname,
+            "port": parsed_url.port,
+            "username": username,
+            "password": password,
+            "database": parsed_url.path[1:] if parsed_url.path else "default",
+        }
+        client_key = tuple(str(v) for v in client_args.values())
+        with state.lock:
+            conn = state.clients.get(client_key)
+            if conn is None:
+                conn = clickhouse_connect.get_client(
+                    autogenerate_session_id=False, **client_args
+                )
+                state.clients[client_key] = conn
+
+        # Execute query using ClickHouse client
+        result = conn.query(sql, parameters=bind_parameters(pyformat))
+
+        # Get column names and descriptions
+        columns = []
+        if result.column_names:
+            for column_name in result.column_names:
+                # ClickHouse doesn't provide column comments in basic query, use name as description
+                columns.append({"name": column_name, "description": column_name})
+
+        # Convert result to list of dicts
+        column_names = result.column_names
+        rows = [dict(zip(column_names, row)) for row in result.result_rows]
+
+        return {
+            "columns": columns,
+            "rows": rows,
+            "row_count": len(rows),
+        }
+
+    def query_oracle(parsed_url):
+        # Oracle support (synchronous)
+        import cx_Oracle
+
+        # Default port for Oracle is 1521
+        default_port = 1521
+
+        # Oracle connection string format: host:port/service_name
+        service_name = parsed_url.path[1:] if parsed_url.path else "XE"
+        dsn = cx_Oracle.makedsn(
+            parsed_url.hostname,
+            parsed_url.port or default_port,
+            service_name=service_name,
+        )
+
+        pool = get_pool(
+            ("oracle", dsn, username, password),
+            "oracle+cx_oracle://",
+            lambda: cx_Oracle.connect(user=username, password=password, dsn=dsn),
+        )
+        conn = pool.raw_connection()
+
+        try:
+            with conn.cursor() as cursor:
+                execute(cursor, named)
 
                 # Get column names and descriptions
                 columns = []
-                if result.column_names:
-                    for column_name in result.column_names:
-                        # ClickHouse doesn't provide column comments in basic query, use name as description
+                column_names = []
+                if cursor.description:
+                    for desc in cursor.description:
+                        column_name = desc[0]
+                        column_names.append(column_name)
+                        # Oracle doesn't provide column comments in basic cursor, use name as description
                         columns.append(
                             {"name": column_name, "description": column_name}
                         )
 
-                # Convert result to list of dicts
-                rows = []
-                if result.result_rows:
-                    for row in result.result_rows:
-                        row_dict = {}
-                        for i, column_name in enumerate(result.column_names):
-                            row_dict[column_name] = row[i]
-                        rows.append(row_dict)
+                # Fetch results as dicts built once per row from the column names
+                results = (
+                    fetch_dicts(cursor, column_names) if cursor.description else []
+                )
 
                 return {
                     "columns": columns,
-                    "rows": rows,
-                    "row_count": len(rows),
+                    "rows": results,
+                    "row_count": len(results),
                 }
-            finally:
-                conn.close()
-
-        elif scheme == "oracle":
-            # Oracle support (synchronous)
-            import cx_Oracle
-
-            # Default port for Oracle is 1521
-            default_port = 1521
-
-            # Oracle connection string format: host:port/service_name
-            service_name = parsed_url.path[1:] if parsed_url.path else "XE"
-            dsn = cx_Oracle.makedsn(
-                parsed_url.hostname,
-                parsed_url.port or default_port,
-                service_name=service_name,
-            )
-
-            conn = cx_Oracle.connect(user=username, password=password, dsn=dsn)
-
-            try:
-                with conn.cursor() as cursor:
-                    cursor.execute(sql)
-
-                    # Get column names and descriptions
-                    columns = []
-                    if cursor.description:
-                        for desc in cursor.description:
-                            column_name = desc[0]
-                            # Oracle doesn't provide column comments in basic cursor, use name as description
-                            columns.append(
-                                {"name": column_name, "description": column_name}
-                            )
-
-                    # Fetch results
-                    rows = cursor.fetchall()
-
-                    # Convert to list of dicts
-                    results = []
-                    for row in rows:
-                        result_dict = {}
-                        for i, col_info in enumerate(columns):
-                            result_dict[col_info["name"]] = row[i]
-                        results.append(result_dict)
-
-                    return {
-                        "columns": columns,
-                        "rows": results,
-                        "row_count": len(results),
-                    }
-            finally:
-                conn.close()
+        finally:
+            # Return the connection to the pool
+            conn.close()
+
+    # Query handler per URL scheme
+    handlers = {
+        "sqlite": query_sqlite,
+        "postgresql": query_postgresql,
+        "postgres": query_postgresql,
+        "mysql": query_mysql,
+        "doris": query_mysql,
+        "clickhouse": query_clickhouse,
+        "oracle": query_oracle,
+    }
+
+    def copy_result(result):
+        # Callers may modify the returned rows, so never hand out the cached ones
+        return {**result, "rows": [dict(row) for row in result["rows"]]}
 
-        else:
+    print(f"url: {url}")
+    print(f"username: {username}")
+    print(f"sql: {sql}")
+
+    # Opt-in result cache for read-only statements
+    cache_ttl = float((config or {}).get("sql_cache_ttl") or 0)
+    max_stale = float((config or {}).get("sql_cache_max_stale") or cache_ttl * 10)
+    cache_key = None
+    cached = None
+    if cache_ttl > 0 and re.match(
+        r"\s*(SELECT|SHOW|DESCRIBE|DESC|EXPLAIN)\b", sql, re.IGNORECASE
+    ):
+        cache_key = (
+            url,
+            username,
+            password,
+            sql,
+            repr(sorted((parameters or {}).items())),
+        )
+        with state.lock:
+            cached = state.results.get(cache_key)
+            if cached is not None:
+                state.results.move_to_end(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < cache_ttl:
+            print("sql cache: hit")
+            return copy_result(cached[1])
+
+    try:
+        # Parse database URL to determine driver type (cached per URL)
+        parsed_url = state.parse_url(url)
+        scheme = parsed_url.scheme.lower()
+
+        handler = handlers.get(scheme)
+        if handler is None:
             raise ValueError(f"Unsupported database scheme: {scheme}")
+        result = handler(parsed_url)
 
     except Exception as e:
         print(f"Error executing database query: {str(e)}")
+        if cached is not None and time.monotonic() - cached[0] < max_stale:
+            # Serve the expired result rather than failing the tool call
+            print("sql cache: serving stale result")
+            return copy_result(cached[1])
         raise
+
+    if cache_key is not None:
+        with state.lock:
+            state.results[cache_key] = (time.monotonic(), copy_result(result))
+            state.results.move_to_end(cache_key)
+            while len(state.results) > 256:
+                state.results.popitem(last=False)
+    return result
+
+
+def easy_database_call_batch(
+    url: str, username: str, password: str, queries: list, config: dict
+) -> list:
+    """
+    Execute several independent queries against one database concurrently.
+
+    Each query runs on its own pooled connection, so a batch takes about as
+    long as its slowest query instead of the sum of all round trips. Use it
+    only for queries that do not depend on each other's effects; there is no
+    shared transaction and execution order is not guaranteed.
+
+    Diagnostic output of the individual queries is written by worker threads
+    and does not appear in the tool's debug log; a summary line per query
+    does.
+
+    Args:
+        url: Database connection URL
+        username: Database username
+        password: Database password
+        queries: Queries to run, each a dict with "sql" and optional
+            "parameters"
+        config: Tool configuration
+
+    Returns:
+        list: Query results in the order of queries
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def run(query):
+        return easy_database_call(
+            url,
+            username,
+            password,
+            query["sql"],
+            dict(query.get("parameters") or {}),
+            config,
+        )
+
+    if len(queries) <= 1:
+        return [run(query) for query in queries]
+
+    # Stay within the per-target connection pool (5 connections + overflow)
+    with ThreadPoolExecutor(max_workers=min(len(queries), 5)) as executor:
+        futures = [executor.submit(run, query) for query in queries]
+
+    results = []
+    for i, future in enumerate(futures):
+        result = future.result()
+        print(f"batch query {i + 1}: {result['row_count']} rows")
+        results.append(result)
+    return results
@@ -4,6 +4,9 @@ def easy_http_call(
     """
     Make HTTP request with parameters.
 
+    Requests go through one pooled HTTP client shared by all tool calls, so
+    connections to the same host are kept alive between calls.
+
     Args:
         method: HTTP method (GET, POST, PUT, DELETE)
         url: Request URL
@@ -14,29 +17,42 @@ def easy_http_call(
     Returns:
         dict: Response data
     """
-    import requests
+    import re
+
+    from api.utils.http_util import get_http_client
+
+    client = get_http_client()
+
+    # {name} placeholders; re caches the compiled pattern between calls
+    placeholder = re.compile(r"\{([^{}]+)\}")
+
+    def substitute(text):
+        # Replace every known placeholder in one pass, then consume the
+        # parameters used so they are not sent again in the body
+        if not parameters or "{" not in text:
+            return text
+        used = set()
+
+        def replace(match):
+            key = match.group(1)
+            if key not in parameters:
+                return match.group(0)
+            used.add(key)
+            return str(parameters[key])
+
+        text = placeholder.sub(replace, text)
+        for key in used:
+            del parameters[key]
+        return text
 
     # Process URL parameters
-    if parameters:
-        for key, value in list(parameters.items()):
-            var = f"{{{key}}}"
-            if var in url:
-                url = url.replace(var, str(value))
-                del parameters[key]
+    url = substitute(url)
 
     # Process header parameters
     http_headers = {}
     if headers:
         for header in headers:
-            header_key = header["key"]
-            header_value = header["value"]
-            if parameters:
-                for key, value in list(parameters.items()):
-                    var = f"{{{key}}}"
-                    if var in header_value:
-                        header_value = header_value.replace(var, str(value))
-                        del parameters[key]
-            http_headers[header_key] = header_value
+            http_headers[header["key"]] = substitute(header["value"])
 
     print(f"url: {url}")
     print(f"method: {method}")
@@ -48,7 +64,6 @@ def easy_http_call(
         "method": method,
         "url": url,
         "headers": http_headers,
-        "timeout": 30,
     }
 
     # Only add json parameter if there are remaining parameters
@@ -56,7 +71,7 @@ def easy_http_call(
         request_kwargs["json"] = parameters
 
     # Make request
-    response = requests.request(**request_kwargs)
+    response = client.request(**request_kwargs)
 
     # Return response
     if response.headers.get("content-type", "").startswith("application/json"):
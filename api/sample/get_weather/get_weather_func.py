@@ -6,6 +6,11 @@ def get_weather_func(city, apiKey):
     """
     import httpx
 
+    from api.utils.http_util import get_http_client
+
+    # 与 easy_http_call 共用连接池
+    client = get_http_client()
+
     try:
         # 验证参数
         if not city:
@@ -24,7 +29,8 @@ def get_weather_func(city, apiKey):
 
         # 发送请求
         print(f"正在获取城市 {city} 的天气信息")
-        response = httpx.get(url, params=params)
+        # 保持 httpx.get 的默认行为：5 秒超时，不跟随重定向
+        response = client.get(url, params=params, timeout=5, follow_redirects=False)
 
         # 检查响应状态
         response.raise_for_status()
@@ -2,11 +2,12 @@
 Audit log schemas.
 """
 
-import json
 from typing import Optional, Dict, Any
 
 from pydantic import BaseModel, Field, field_validator
 
+from api.utils.json_util import parse_json_text
+
 
 class AuditResponse(BaseModel):
     """
@@ -44,9 +45,4 @@ class AuditResponse(BaseModel):
     @field_validator("details", mode="before")
     @classmethod
     def parse_details(cls, v):
-        if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                return {}
-        return v
+        return parse_json_text(v)
@@ -0,0 +1,54 @@
+"""
+Batch request schemas.
+"""
+
+from typing import Any, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BatchSubRequest(BaseModel):
+    """
+    A single API call inside a batch.
+
+    Attributes:
+        id: Client supplied identifier echoed back in the response
+        url: API path including query string, e.g. /api/v1/tool/1/func
+        method: HTTP method
+        body: Optional JSON request body
+    """
+
+    id: str = Field(..., description="Client supplied request identifier")
+    url: str = Field(..., description="API path including query string")
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = Field(
+        default="GET", description="HTTP method"
+    )
+    body: Optional[Any] = Field(default=None, description="JSON request body")
+
+
+class BatchRequest(BaseModel):
+    """
+    Batch request model.
+
+    Attributes:
+        requests: Sub-requests to execute
+    """
+
+    requests: List[BatchSubRequest] = Field(
+        ..., min_length=1, max_length=20, description="Sub-requests to execute"
+    )
+
+
+class BatchSubResponse(BaseModel):
+    """
+    Result of a single sub-request.
+
+    Attributes:
+        id: Identifier of the sub-request
+        status: HTTP status code
+        body: Decoded response body
+    """
+
+    id: str = Field(..., description="Client supplied request identifier")
+    status: int = Field(..., description="HTTP status code")
+    body: Optional[Any] = Field(default=None, description="Response body")
@@ -2,11 +2,12 @@
 Common schemas.
 """
 
-import time
 from typing import Generic, TypeVar, List, Optional, Dict, Any
 
 from pydantic import BaseModel, Field
 
+from api.utils.time_util import get_current_unix_ms
+
 # Type variable for generic models
 T = TypeVar("T")
 
@@ -24,6 +25,28 @@ class PaginationParams(BaseModel):
     size: int = Field(default=20, ge=1, le=100, description="Page size")
 
 
+class AuditMixin(BaseModel):
+    """
+    Audit fields shared by resource response schemas.
+
+    Attributes:
+        created_at: Creation time (UnixMS)
+        updated_at: Update time (UnixMS)
+        created_by: Creator username
+        updated_by: Updater username
+    """
+
+    created_at: Optional[int] = Field(
+        default=None, description="Creation time (UnixMS)"
+    )
+    updated_at: Optional[int] = Field(default=None, description="Update time (UnixMS)")
+    created_by: Optional[str] = Field(default=None, description="Creator username")
+    updated_by: Optional[str] = Field(default=None, description="Updater username")
+
+    class Config:
+        from_attributes = True
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
     """
     Paginated response.
@@ -32,7 +55,9 @@ class PaginatedResponse(BaseModel, Generic[T]):
         code: Response code (0 for success)
         message: Response message
         data: Response data
-        total: Total number of items
+        total: Total number of items (None when the endpoint skipped counting)
+        has_next: Whether another page follows (None when unknown)
+        next_cursor: Cursor for the next page (cursor-paginated endpoints only)
         timestamp: Response timestamp (Unix milliseconds)
         request_id: Request ID for tracing
     """
@@ -40,9 +65,19 @@ class PaginatedResponse(BaseModel, Generic[T]):
     code: int = Field(default=0, description="Response code (0 for success)")
     message: str = Field(default="success", description="Response message")
     data: List[T] = Field(default_factory=list, description="Response data")
-    total: int = Field(default=0, description="Total number of items")
+    total: Optional[int] = Field(
+        default=0,
+        description="Total number of items (None when the endpoint skipped counting)",
+    )
+    has_next: Optional[bool] = Field(
+        default=None, description="Whether another page follows (None when unknown)"
+    )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the next page (cursor-paginated endpoints only)",
+    )
     timestamp: int = Field(
-        default_factory=lambda: int(time.time() * 1000),
+        default_factory=get_current_unix_ms,
         description="Response timestamp (Unix milliseconds)",
     )
     request_id: Optional[str] = Field(
@@ -66,7 +101,7 @@ class Response(BaseModel, Generic[T]):
     message: str = Field(default="success", description="Response message")
     data: Optional[T] = Field(default=None, description="Response data")
     timestamp: int = Field(
-        default_factory=lambda: int(time.time() * 1000),
+        default_factory=get_current_unix_ms,
         description="Response timestamp (Unix milliseconds)",
     )
     request_id: Optional[str] = Field(
@@ -90,7 +125,7 @@ class ErrorResponse(BaseModel):
     message: str = Field(description="Error message")
     details: Optional[Dict[str, Any]] = Field(default=None, description="Error details")
     timestamp: int = Field(
-        default_factory=lambda: int(time.time() * 1000),
+        default_factory=get_current_unix_ms,
         description="Response timestamp (Unix milliseconds)",
     )
     request_id: Optional[str] = Field(
@@ -2,10 +2,12 @@
 Configuration schemas.
 """
 
-import json
-from typing import Optional, Dict, Any
+from typing import Any, ClassVar, Dict, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, SkipValidation, field_validator
+
+from api.schemas.common_schema import AuditMixin
+from api.utils.json_util import parse_json_text
 
 
 class ConfigBase(BaseModel):
@@ -53,7 +55,7 @@ class ConfigUpdate(ConfigBase):
     )
 
 
-class ConfigResponse(ConfigBase):
+class ConfigResponse(ConfigBase, AuditMixin):
     """
     Configuration response schema.
 
@@ -67,25 +69,18 @@ class ConfigResponse(ConfigBase):
     """
 
     id: int = Field(description="Configuration ID")
-    conf_value: Optional[Dict[str, Any]] = Field(
-        default=None, description="Configuration values"
+    # Stored JSON was validated on write; skip re-walking it on every read
+    conf_schema: SkipValidation[Dict[str, Any]] = Field(
+        description="Configuration schema definition (JSON Schema)"
     )
-    created_at: Optional[int] = Field(
-        default=None, description="Creation time (UnixMS)"
+    conf_value: SkipValidation[Optional[Dict[str, Any]]] = Field(
+        default=None, description="Configuration values"
     )
-    updated_at: Optional[int] = Field(default=None, description="Update time (UnixMS)")
-    created_by: Optional[str] = Field(default=None, description="Creator username")
-    updated_by: Optional[str] = Field(default=None, description="Updater username")
 
-    class Config:
-        from_attributes = True
+    # Columns stored as JSON text, see response_util.validate_rows
+    json_columns: ClassVar[Tuple[str, ...]] = ("conf_schema", "conf_value")
 
     @field_validator("conf_schema", "conf_value", mode="before")
     @classmethod
     def parse_json(cls, v):
-        if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                return {}
-        return v
+        return parse_json_text(v)
@@ -2,10 +2,12 @@
 Function schemas.
 """
 
-from typing import Optional, List
+from typing import Optional, Tuple
 
 from pydantic import BaseModel, Field
 
+from api.schemas.common_schema import AuditMixin
+
 
 class FuncBase(BaseModel):
     """
@@ -30,8 +32,8 @@ class FuncCreate(FuncBase):
         depend_ids: Dependency function IDs
     """
 
-    depend_ids: Optional[List[int]] = Field(
-        default_factory=list, description="Dependency function IDs"
+    depend_ids: Optional[Tuple[int, ...]] = Field(
+        default=(), description="Dependency function IDs"
     )
 
 
@@ -43,12 +45,12 @@ class FuncUpdate(FuncBase):
         depend_ids: Dependency function IDs
     """
 
-    depend_ids: Optional[List[int]] = Field(
-        default_factory=list, description="Dependency function IDs"
+    depend_ids: Optional[Tuple[int, ...]] = Field(
+        default=(), description="Dependency function IDs"
     )
 
 
-class FuncResponse(FuncBase):
+class FuncResponse(FuncBase, AuditMixin):
     """
     Function response schema.
 
@@ -65,15 +67,6 @@ class FuncResponse(FuncBase):
     current_version: Optional[int] = Field(
         default=None, description="Current version number"
     )
-    created_at: Optional[int] = Field(
-        default=None, description="Creation time (UnixMS)"
-    )
-    updated_at: Optional[int] = Field(default=None, description="Update time (UnixMS)")
-    created_by: Optional[str] = Field(default=None, description="Creator username")
-    updated_by: Optional[str] = Field(default=None, description="Updater username")
-
-    class Config:
-        from_attributes = True
 
 
 class FuncDeployBase(BaseModel):
@@ -91,7 +84,7 @@ class FuncDeployBase(BaseModel):
     description: Optional[str] = Field(default=None, description="Version description")
 
 
-class FuncDeployResponse(FuncDeployBase):
+class FuncDeployResponse(FuncDeployBase, AuditMixin):
     """
     Function deployment response schema.
 
@@ -106,12 +99,3 @@ class FuncDeployResponse(FuncDeployBase):
 
     id: int = Field(description="Deployment record ID")
     func_id: int = Field(description="Function ID")
-    created_at: Optional[int] = Field(
-        default=None, description="Creation time (UnixMS)"
-    )
-    updated_at: Optional[int] = Field(default=None, description="Update time (UnixMS)")
-    created_by: Optional[str] = Field(default=None, description="Creator username")
-    updated_by: Optional[str] = Field(default=None, description="Updater username")
-
-    class Config:
-        from_attributes = True
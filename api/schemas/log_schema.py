@@ -2,9 +2,29 @@
 Log schemas.
 """
 
+from datetime import datetime
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
+
+# Size units from largest to smallest, with their thresholds in bytes
+_SIZE_UNITS = ((1024**3, "GB"), (1024**2, "MB"), (1024, "KB"))
+
+
+def _format_size(size_bytes: int) -> str:
+    """
+    Format file size in human-readable format.
+
+    Args:
+        size_bytes: Size in bytes
+
+    Returns:
+        str: Human-readable size
+    """
+    for threshold, unit in _SIZE_UNITS:
+        if size_bytes >= threshold:
+            return f"{size_bytes / threshold:.2f} {unit}"
+    return f"{size_bytes:.2f} B"
 
 
 class LogFileInfo(BaseModel):
@@ -23,9 +43,20 @@ class LogFileInfo(BaseModel):
     name: str = Field(..., description="File name")
     path: str = Field(..., description="File path")
     size: int = Field(..., description="File size in bytes")
-    size_human: str = Field(..., description="Human-readable file size")
     modified_at: int = Field(..., description="Modification time (UnixMS)")
-    modified_at_human: str = Field(..., description="Human-readable modification time")
+
+    # Display strings are only formatted when the model is serialized
+    @computed_field(description="Human-readable file size")
+    @property
+    def size_human(self) -> str:
+        return _format_size(self.size)
+
+    @computed_field(description="Human-readable modification time")
+    @property
+    def modified_at_human(self) -> str:
+        return datetime.fromtimestamp(self.modified_at / 1000).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
 
 
 class LogFilesResponse(BaseModel):
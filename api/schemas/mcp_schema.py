@@ -0,0 +1,22 @@
+"""
+MCP schemas.
+"""
+
+from pydantic import BaseModel, Field
+
+
+class McpConcurrencyUpdate(BaseModel):
+    """MCP concurrency update request."""
+
+    max_concurrency: int = Field(
+        ..., ge=1, description="Maximum number of concurrent tool executions"
+    )
+
+
+class McpConcurrencyResponse(BaseModel):
+    """MCP concurrency response."""
+
+    max_concurrency: int = Field(
+        ..., description="Maximum number of concurrent tool executions"
+    )
+    active: int = Field(..., description="Number of tool executions in progress")
@@ -7,6 +7,11 @@ import re
 
 from pydantic import BaseModel, Field, field_validator
 
+from api.schemas.common_schema import AuditMixin
+
+# Valid tag names: letters and digits only
+_TAG_NAME_PATTERN = re.compile(r"[a-zA-Z0-9]+")
+
 
 class TagBase(BaseModel):
     """
@@ -26,12 +31,13 @@ class TagBase(BaseModel):
     @classmethod
     def validate_name(cls, v):
         """Validate tag name - only alphanumeric characters allowed."""
-        if not v or not v.strip():
+        name = v.strip() if v else v
+        if not name:
             raise ValueError("Tag name cannot be empty")
         # Check for valid characters (only alphanumeric)
-        if not re.match(r"^[a-zA-Z0-9]+$", v.strip()):
+        if not _TAG_NAME_PATTERN.fullmatch(name):
             raise ValueError("Tag name can only contain letters and numbers")
-        return v.strip()
+        return name
 
 
 class TagCreate(TagBase):
@@ -63,16 +69,17 @@ class TagUpdate(BaseModel):
     def validate_name(cls, v):
         """Validate tag name - only alphanumeric characters allowed."""
         if v is not None:
-            if not v or not v.strip():
+            name = v.strip()
+            if not name:
                 raise ValueError("Tag name cannot be empty")
             # Check for valid characters (only alphanumeric)
-            if not re.match(r"^[a-zA-Z0-9]+$", v.strip()):
+            if not _TAG_NAME_PATTERN.fullmatch(name):
                 raise ValueError("Tag name can only contain letters and numbers")
-            return v.strip()
+            return name
         return v
 
 
-class TagResponse(TagBase):
+class TagResponse(TagBase, AuditMixin):
     """
     Tag response schema.
 
@@ -85,12 +92,6 @@ class TagResponse(TagBase):
     """
 
     id: int = Field(description="Tag ID")
-    created_at: Optional[int] = Field(
-        default=None, description="Creation time (UnixMS)"
-    )
-    updated_at: Optional[int] = Field(default=None, description="Update time (UnixMS)")
-    created_by: Optional[str] = Field(default=None, description="Creator username")
-    updated_by: Optional[str] = Field(default=None, description="Updater username")
 
 
 class ToolTagRequest(BaseModel):
@@ -2,9 +2,11 @@
 Tool log schemas.
 """
 
-from typing import Optional
+from typing import Any, ClassVar, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, Json
+
+from api.constants import CallTypeName
 
 
 class ToolLogResponse(BaseModel):
@@ -31,7 +33,7 @@ class ToolLogResponse(BaseModel):
     id: int = Field(description="Log ID")
     tool_name: str = Field(description="Tool name")
     tool_id: Optional[int] = Field(default=None, description="Tool ID")
-    call_type: str = Field(description="Call type (mcp, debug)")
+    call_type: CallTypeName = Field(description="Call type (mcp, debug)")
     request_time: int = Field(description="Request time (UnixMS)")
     response_time: Optional[int] = Field(
         default=None, description="Response time (UnixMS)"
@@ -43,14 +45,19 @@ class ToolLogResponse(BaseModel):
     error_message: Optional[str] = Field(
         default=None, description="Error message if failed"
     )
-    request_params: Optional[str] = Field(
+    request_params: Optional[Json[Any]] = Field(
         default=None, description="Request parameters"
     )
-    response_data: Optional[str] = Field(default=None, description="Response data")
+    response_data: Optional[Json[Any]] = Field(
+        default=None, description="Response data"
+    )
     ip_address: Optional[str] = Field(default=None, description="Client IP address")
     user_agent: Optional[str] = Field(default=None, description="Client user agent")
     created_at: int = Field(description="Creation time (UnixMS)")
 
+    # Columns stored as JSON text, see json_util.dump_rows_json
+    json_columns: ClassVar[Tuple[str, ...]] = ("request_params", "response_data")
+
     class Config:
         from_attributes = True
 
@@ -2,12 +2,93 @@
 Tool schemas.
 """
 
-import json
-from typing import Optional, List, Dict, Any
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    SkipValidation,
+    Tag,
+    field_validator,
+)
+from typing_extensions import Annotated, NotRequired, TypedDict
 
-from api.constants import ToolType
+from api.constants import ToolType, ToolTypeName
+from api.schemas.common_schema import AuditMixin
+from api.utils.json_util import parse_json_text
+
+
+class HttpHeader(TypedDict):
+    """
+    HTTP tool request header.
+
+    Attributes:
+        key: Header name
+        value: Header value
+    """
+
+    key: str
+    value: str
+
+
+class HttpSetting(TypedDict):
+    """
+    Settings of an HTTP tool.
+
+    Attributes:
+        url: Request URL, may contain {parameter} placeholders
+        method: HTTP method
+        headers: Request headers
+    """
+
+    __pydantic_config__ = ConfigDict(extra="allow")
+
+    url: str
+    method: str
+    headers: NotRequired[List[HttpHeader]]
+
+
+class DatabaseSetting(TypedDict):
+    """
+    Settings of a database tool.
+
+    Attributes:
+        url: Database connection URL
+        username: Database username
+        password: Database password
+        sql: MyBatis-style SQL template
+    """
+
+    __pydantic_config__ = ConfigDict(extra="allow")
+
+    url: str
+    username: NotRequired[Optional[str]]
+    password: NotRequired[Optional[str]]
+    sql: str
+
+
+def _setting_kind(value: Any) -> str:
+    """
+    Pick the settings shape from its keys, so only one branch is validated.
+    """
+    if isinstance(value, dict):
+        if "sql" in value:
+            return ToolType.DATABASE
+        if "method" in value:
+            return ToolType.HTTP
+    return ToolType.BASIC
+
+
+ToolSetting = Annotated[
+    Union[
+        Annotated[HttpSetting, Tag(ToolType.HTTP)],
+        Annotated[DatabaseSetting, Tag(ToolType.DATABASE)],
+        Annotated[Dict[str, Any], Tag(ToolType.BASIC)],
+    ],
+    Discriminator(_setting_kind),
+]
 
 
 class ToolBase(BaseModel):
@@ -25,16 +106,16 @@ class ToolBase(BaseModel):
 
     name: str = Field(description="Tool name")
     description: Optional[str] = Field(default=None, description="Tool description")
-    type: str = Field(
+    type: ToolTypeName = Field(
         default=ToolType.BASIC, description="Tool type (basic, http, or database)"
     )
-    setting: Dict[str, Any] = Field(
+    setting: ToolSetting = Field(
         default_factory=dict, description="Advanced settings (JSON string)"
     )
     parameters: Dict[str, Any] = Field(description="Tool parameters (JSON Schema)")
     code: str = Field(description="Tool implementation code")
 
-    @field_validator("type")
+    @field_validator("type", mode="before")
     @classmethod
     def validate_tool_type(cls, v):
         """Validate tool type."""
@@ -54,12 +135,8 @@ class ToolCreate(ToolBase):
         func_ids: Function IDs
     """
 
-    config_ids: Optional[List[int]] = Field(
-        default_factory=list, description="Config IDs"
-    )
-    func_ids: Optional[List[int]] = Field(
-        default_factory=list, description="Function IDs"
-    )
+    config_ids: Optional[Tuple[int, ...]] = Field(default=(), description="Config IDs")
+    func_ids: Optional[Tuple[int, ...]] = Field(default=(), description="Function IDs")
 
 
 class ToolUpdate(ToolBase):
@@ -71,15 +148,11 @@ class ToolUpdate(ToolBase):
         func_ids: Function IDs
     """
 
-    config_ids: Optional[List[int]] = Field(
-        default_factory=list, description="Config IDs"
-    )
-    func_ids: Optional[List[int]] = Field(
-        default_factory=list, description="Function IDs"
-    )
+    config_ids: Optional[Tuple[int, ...]] = Field(default=(), description="Config IDs")
+    func_ids: Optional[Tuple[int, ...]] = Field(default=(), description="Function IDs")
 
 
-class ToolResponse(ToolBase):
+class ToolResponse(ToolBase, AuditMixin):
     """
     Tool response schema.
 
@@ -102,35 +175,38 @@ class ToolResponse(ToolBase):
     tags: List["TagResponse"] = Field(
         default_factory=list, description="List of tags associated with the tool"
     )
-    created_at: Optional[int] = Field(
-        default=None, description="Creation time (UnixMS)"
+    # Stored JSON was validated on write; skip re-walking it on every read
+    parameters: SkipValidation[Dict[str, Any]] = Field(
+        description="Tool parameters (JSON Schema)"
+    )
+    setting: SkipValidation[Dict[str, Any]] = Field(
+        default_factory=dict, description="Advanced settings (JSON string)"
     )
-    updated_at: Optional[int] = Field(default=None, description="Update time (UnixMS)")
-    created_by: Optional[str] = Field(default=None, description="Creator username")
-    updated_by: Optional[str] = Field(default=None, description="Updater username")
 
-    class Config:
-        from_attributes = True
+    # Columns stored as JSON text, see response_util.validate_rows
+    json_columns: ClassVar[Tuple[str, ...]] = ("parameters", "setting")
 
-    @field_validator("parameters", mode="before")
+    @field_validator("parameters", "setting", mode="before")
     @classmethod
-    def parse_parameters(cls, v):
-        if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                return {}
-        return v
+    def parse_json(cls, v):
+        return parse_json_text(v)
 
-    @field_validator("setting", mode="before")
-    @classmethod
-    def parse_setting(cls, v):
-        if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                return {}
-        return v
+
+class ToolDetailResponse(ToolResponse):
+    """
+    Tool detail response schema.
+
+    Attributes:
+        funcs: Functions used by the tool, present when requested via include
+        configs: Configurations used by the tool, present when requested via include
+    """
+
+    funcs: Optional[List["FuncResponse"]] = Field(
+        default=None, description="Functions used by the tool"
+    )
+    configs: Optional[List["ConfigResponse"]] = Field(
+        default=None, description="Configurations used by the tool"
+    )
 
 
 class ToolDeployBase(BaseModel):
@@ -148,7 +224,7 @@ class ToolDeployBase(BaseModel):
 
     version: int = Field(description="Version number")
     parameters: Dict[str, Any] = Field(description="Tool parameters (JSON Schema)")
-    type: str = Field(
+    type: ToolTypeName = Field(
         default=ToolType.BASIC, description="Tool type (basic, http, or database)"
     )
     setting: Dict[str, Any] = Field(
@@ -158,7 +234,7 @@ class ToolDeployBase(BaseModel):
     description: Optional[str] = Field(default=None, description="Version description")
 
 
-class ToolDeployResponse(ToolDeployBase):
+class ToolDeployResponse(ToolDeployBase, AuditMixin):
     """
     Tool deployment response schema.
 
@@ -173,35 +249,21 @@ class ToolDeployResponse(ToolDeployBase):
 
     id: int = Field(description="Deployment record ID")
     tool_id: int = Field(description="Tool ID")
-    created_at: Optional[int] = Field(
-        default=None, description="Creation time (UnixMS)"
+    # Stored JSON was validated on write; skip re-walking it on every read
+    parameters: SkipValidation[Dict[str, Any]] = Field(
+        description="Tool parameters (JSON Schema)"
+    )
+    setting: SkipValidation[Dict[str, Any]] = Field(
+        default_factory=dict, description="Advanced settings (JSON string)"
     )
-    updated_at: Optional[int] = Field(default=None, description="Update time (UnixMS)")
-    created_by: Optional[str] = Field(default=None, description="Creator username")
-    updated_by: Optional[str] = Field(default=None, description="Updater username")
-
-    class Config:
-        from_attributes = True
 
-    @field_validator("parameters", mode="before")
-    @classmethod
-    def parse_parameters(cls, v):
-        if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                return {}
-        return v
+    # Columns stored as JSON text, see response_util.validate_rows
+    json_columns: ClassVar[Tuple[str, ...]] = ("parameters", "setting")
 
-    @field_validator("setting", mode="before")
+    @field_validator("parameters", "setting", mode="before")
     @classmethod
-    def parse_setting(cls, v):
-        if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                return {}
-        return v
+    def parse_json(cls, v):
+        return parse_json_text(v)
 
 
 class ToolDebugRequest(BaseModel):
@@ -293,8 +355,11 @@ class ToolMcpExecuteRequest(BaseModel):
     parameters: Dict[str, Any] = Field(..., description="Tool execution parameters")
 
 
-# Import TagResponse for forward reference
+# Import related responses for forward references
+from api.schemas.config_schema import ConfigResponse
+from api.schemas.func_schema import FuncResponse
 from api.schemas.tag_schema import TagResponse
 
 # Update forward references
 ToolResponse.model_rebuild()
+ToolDetailResponse.model_rebuild()
@@ -6,6 +6,8 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from api.schemas.common_schema import PaginatedResponse, Response
+
 
 class UserBase(BaseModel):
     """
@@ -64,6 +66,18 @@ class UserResponse(UserBase):
         from_attributes = True
 
 
+class UserItemResponse(Response[UserResponse]):
+    """
+    Standard response carrying a single user.
+    """
+
+
+class UserListResponse(PaginatedResponse[UserResponse]):
+    """
+    Paginated response carrying users.
+    """
+
+
 class LoginRequest(BaseModel):
     """
     Login request schema.
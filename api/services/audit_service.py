@@ -2,13 +2,14 @@
 Audit service.
 """
 
-from typing import Optional, List, Tuple
+from typing import Any, Dict, Optional, List, Tuple
 
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, insert, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from api.models.tb_audit import TbAudit
+from api.utils.search_util import SearchMode, search_condition
 
 
 class AuditService:
@@ -25,6 +26,18 @@ class AuditService:
         """
         self.db = db
 
+    async def record_many(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert audit logs in one executemany statement and one commit.
+
+        Args:
+            rows: Column values of the audit logs
+        """
+        if not rows:
+            return
+        await self.db.execute(insert(TbAudit), rows)
+        await self.db.commit()
+
     async def query_audits(
         self,
         page: int = 1,
@@ -36,10 +49,16 @@ class AuditService:
         resource_name: Optional[str] = None,
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
-    ) -> Tuple[List[TbAudit], int]:
+        mode: SearchMode = "prefix",
+        cursor: Optional[Tuple[int, int]] = None,
+    ) -> Tuple[List[TbAudit], int, bool]:
         """
         Query audit logs with pagination.
 
+        Audit logs are ordered by creation time, then ID, descending. When a
+        cursor is given, the page starts after that log (keyset pagination)
+        and page is ignored, so deep pages cost the same as the first one.
+
         Args:
             page: Page number (1-based)
             size: Page size
@@ -50,59 +69,53 @@ class AuditService:
             resource_name: Resource name filter
             start_time: Start time filter (UnixMS)
             end_time: End time filter (UnixMS)
+            mode: How username and resource_name match, "prefix" (indexed)
+                or "contains"
+            cursor: (created_at, id) of the last log of the previous page
 
         Returns:
-            Tuple[List[TbAudit], int]: List of audit logs and total count
+            Tuple[List[TbAudit], int, bool]: List of audit logs, total count
+                and whether more logs follow
         """
-        query = select(TbAudit)
-
-        # Apply filters
+        # Build the filters once so the page and count queries always agree
+        filters = []
         if username:
-            query = query.where(TbAudit.username.ilike(f"%{username}%"))
+            filters.append(search_condition(TbAudit.username, username, mode))
         if action:
-            query = query.where(TbAudit.action == action)
+            filters.append(TbAudit.action == action)
         if resource_type:
-            query = query.where(TbAudit.resource_type == resource_type)
+            filters.append(TbAudit.resource_type == resource_type)
         if resource_id:
-            query = query.where(TbAudit.resource_id == resource_id)
+            filters.append(TbAudit.resource_id == resource_id)
         if resource_name:
-            query = query.where(TbAudit.resource_name.ilike(f"%{resource_name}%"))
+            filters.append(search_condition(TbAudit.resource_name, resource_name, mode))
         if start_time:
-            query = query.where(TbAudit.created_at >= start_time)
+            filters.append(TbAudit.created_at >= start_time)
         if end_time:
-            query = query.where(TbAudit.created_at <= end_time)
+            filters.append(TbAudit.created_at <= end_time)
 
         # Count total
-        count_query = select(func.count(TbAudit.id))
-
-        # Apply the same filters to count query
-        if username:
-            count_query = count_query.where(TbAudit.username.ilike(f"%{username}%"))
-        if action:
-            count_query = count_query.where(TbAudit.action == action)
-        if resource_type:
-            count_query = count_query.where(TbAudit.resource_type == resource_type)
-        if resource_name:
-            count_query = count_query.where(
-                TbAudit.resource_name.ilike(f"%{resource_name}%")
-            )
-        if start_time:
-            count_query = count_query.where(TbAudit.created_at >= start_time)
-        if end_time:
-            count_query = count_query.where(TbAudit.created_at <= end_time)
-
+        count_query = select(func.count(TbAudit.id)).where(*filters)
         count_result = await self.db.execute(count_query)
         total = count_result.scalar()
 
-        # Apply pagination and ordering
+        # Apply pagination and ordering; one extra row tells whether more follow
         query = (
-            query.order_by(desc(TbAudit.created_at))
-            .offset((page - 1) * size)
-            .limit(size)
+            select(TbAudit)
+            .where(*filters)
+            .order_by(desc(TbAudit.created_at), desc(TbAudit.id))
+            .limit(size + 1)
         )
+        if cursor is not None:
+            query = query.where(
+                tuple_(TbAudit.created_at, TbAudit.id) < tuple_(*cursor)
+            )
+        else:
+            query = query.offset((page - 1) * size)
 
         # Execute query
         result = await self.db.execute(query)
-        audits = result.scalars().all()
+        audits = list(result.scalars().all())
 
-        return list(audits), total
+        has_next = len(audits) > size
+        return audits[:size], total, has_next
@@ -2,11 +2,13 @@
 Configuration service.
 """
 
-import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
-from sqlalchemy import desc, or_, func
+import orjson
+from pydantic import TypeAdapter
+from sqlalchemy import Row, bindparam, desc, or_, func, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -21,11 +23,102 @@ from api.schemas.config_schema import ConfigCreate, ConfigUpdate
 from api.schemas.tool_schema import ToolResponse
 from api.schemas.usage_schema import ConfigUsageResponse
 from api.utils.audit_util import audit
+from api.utils.response_util import validate_rows
+from api.utils.search_util import SearchMode, search_condition
 from api.utils.time_util import get_current_unix_ms
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Lookups built once and executed with bound parameters
+_SELECT_CONFIG_BY_ID = select(TbConfig).where(TbConfig.id == bindparam("config_id"))
+_SELECT_CONFIG_BY_NAME = select(TbConfig).where(TbConfig.name == bindparam("name"))
+
+# Validator for the tools listed in a usage response, built once
+_TOOL_RESPONSES_ADAPTER = TypeAdapter(List[ToolResponse])
+
+# Tool columns rendered by ToolResponse, loaded as plain rows for usage lists
+_TOOL_RESPONSE_COLUMNS = [
+    column for column in TbTool.__table__.c if column.key in ToolResponse.model_fields
+]
+
+# Rendered single-config reads, cleared on every change
+CONFIG_READ_CACHE_TTL = 1.0
+CONFIG_READ_CACHE_SIZE = 1024
+_config_read_cache: Dict[Hashable, Tuple[float, Any]] = {}
+# Bumped on every invalidation, see set_cached_config_read
+_config_read_cache_version = 0
+
+
+def get_cached_config_read(key: Hashable) -> Optional[Any]:
+    """
+    Get a cached configuration read result.
+
+    Args:
+        key: Cache key built by the caller from the read parameters
+
+    Returns:
+        Any: Cached value, or None if missing or expired
+    """
+    cached = _config_read_cache.get(key)
+    if cached is None or time.monotonic() - cached[0] >= CONFIG_READ_CACHE_TTL:
+        return None
+    return cached[1]
+
+
+def get_config_read_cache_version() -> int:
+    """
+    Get the current configuration read cache version.
+
+    Read it before loading a result that will be passed to
+    set_cached_config_read.
+
+    Returns:
+        int: Cache version
+    """
+    return _config_read_cache_version
+
+
+def set_cached_config_read(key: Hashable, value: Any, version: int) -> None:
+    """
+    Cache a configuration read result.
+
+    The result is dropped if the cache was invalidated since version was
+    read, since it may have been loaded before the change.
+
+    Args:
+        key: Cache key built by the caller from the read parameters
+        value: Value to cache, must not be mutated afterwards
+        version: Cache version read before the result was loaded
+    """
+    if version != _config_read_cache_version:
+        return
+    if len(_config_read_cache) >= CONFIG_READ_CACHE_SIZE:
+        _config_read_cache.clear()
+    _config_read_cache[key] = (time.monotonic(), value)
+
+
+def invalidate_config_read_cache() -> None:
+    """
+    Drop all cached configuration reads.
+    """
+    global _config_read_cache_version
+    _config_read_cache_version += 1
+    _config_read_cache.clear()
+
+
+def _dumps_json(value: Any) -> str:
+    """
+    Serialize a configuration schema or value for storage.
+
+    Args:
+        value: JSON-compatible value
+
+    Returns:
+        str: JSON text
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 class ConfigService:
     """
@@ -40,6 +133,29 @@ class ConfigService:
             db: Database session
         """
         self.db = db
+        # Lookups made through this service, keyed by ("id", id) or
+        # ("name", name); misses are remembered too
+        self._configs: Dict[Tuple[str, Any], Optional[TbConfig]] = {}
+
+    def _remember(self, key: Tuple[str, Any], config: Optional[TbConfig]) -> None:
+        """
+        Remember a lookup result under its key and, if found, both its keys.
+
+        Args:
+            key: Lookup key
+            config: Configuration found, or None
+        """
+        self._configs[key] = config
+        if config is not None:
+            self._configs[("id", config.id)] = config
+            self._configs[("name", config.name)] = config
+
+    def _forget_configs(self) -> None:
+        """
+        Drop remembered lookups and cached reads after a change.
+        """
+        self._configs.clear()
+        invalidate_config_read_cache()
 
     async def get_config_by_id(self, config_id: int) -> Optional[TbConfig]:
         """
@@ -51,8 +167,13 @@ class ConfigService:
         Returns:
             TbConfig: Configuration object or None if not found
         """
-        result = await self.db.execute(select(TbConfig).where(TbConfig.id == config_id))
-        return result.scalars().first()
+        key = ("id", config_id)
+        if key not in self._configs:
+            result = await self.db.execute(
+                _SELECT_CONFIG_BY_ID, {"config_id": config_id}
+            )
+            self._remember(key, result.scalars().first())
+        return self._configs[key]
 
     async def get_config_by_name(self, name: str) -> Optional[TbConfig]:
         """
@@ -64,11 +185,18 @@ class ConfigService:
         Returns:
             TbConfig: Configuration object or None if not found
         """
-        result = await self.db.execute(select(TbConfig).where(TbConfig.name == name))
-        return result.scalars().first()
+        key = ("name", name)
+        if key not in self._configs:
+            result = await self.db.execute(_SELECT_CONFIG_BY_NAME, {"name": name})
+            self._remember(key, result.scalars().first())
+        return self._configs[key]
 
     async def query_configs(
-        self, page: int = 1, size: int = 20, search: Optional[str] = None
+        self,
+        page: int = 1,
+        size: int = 20,
+        search: Optional[str] = None,
+        mode: SearchMode = "prefix",
     ) -> Tuple[List[TbConfig], int]:
         """
         Query configurations with pagination.
@@ -76,34 +204,29 @@ class ConfigService:
         Args:
             page: Page number (1-based)
             size: Page size
-            search: Search term for name or description
+            search: Search term
+            mode: "prefix" matches the start of the name using its index;
+                "contains" matches anywhere in the name or description
 
         Returns:
             Tuple[List[TbConfig], int]: List of configurations and total count
         """
-        query = select(TbConfig)
-
-        # Apply filters
-        if search:
-            query = query.where(
+        # Build the filters once so the page and count queries always agree
+        filters = []
+        if search and mode == "contains":
+            filters.append(
                 or_(
-                    TbConfig.name.ilike(f"%{search}%"),
-                    TbConfig.description.ilike(f"%{search}%"),
+                    search_condition(TbConfig.name, search, mode),
+                    search_condition(TbConfig.description, search, mode),
                 )
             )
+        elif search:
+            filters.append(search_condition(TbConfig.name, search, mode))
 
-        # Count total
-        count_query = select(func.count(TbConfig.id))
-
-        # Apply the same filters to count query
-        if search:
-            count_query = count_query.where(
-                or_(
-                    TbConfig.name.ilike(f"%{search}%"),
-                    TbConfig.description.ilike(f"%{search}%"),
-                )
-            )
+        query = select(TbConfig).where(*filters)
 
+        # Count total
+        count_query = select(func.count(TbConfig.id)).where(*filters)
         count_result = await self.db.execute(count_query)
         total = count_result.scalar()
 
@@ -134,8 +257,7 @@ class ConfigService:
             ConfigAlreadyExistsError: If configuration already exists
         """
         # Check if configuration already exists
-        existing_config = await self.get_config_by_name(config_data.name)
-        if existing_config:
+        if await self._name_taken(config_data.name):
             logger.warning(
                 f"Refuse to create configuration with existing name: {config_data.name}"
             )
@@ -146,8 +268,8 @@ class ConfigService:
         config = TbConfig(
             name=config_data.name,
             description=config_data.description,
-            conf_schema=json.dumps(config_data.conf_schema),
-            conf_value=json.dumps(config_data.conf_value)
+            conf_schema=_dumps_json(config_data.conf_schema),
+            conf_value=_dumps_json(config_data.conf_value)
             if config_data.conf_value
             else None,
             created_at=current_time,
@@ -156,9 +278,11 @@ class ConfigService:
             updated_by=current_user,
         )
 
+        # Sessions keep attributes after commit and every column is set
+        # here, with the id filled in by the INSERT, so no refresh is needed
         self.db.add(config)
         await self.db.commit()
-        await self.db.refresh(config)
+        self._forget_configs()
 
         return config
 
@@ -192,26 +316,38 @@ class ConfigService:
 
         # Check if name already exists
         if config_data.name != config.name:
-            existing_config = await self.get_config_by_name(config_data.name)
-            if existing_config:
+            if await self._name_taken(config_data.name, exclude_id=config_id):
                 logger.warning(
                     f"Refuse to update configuration with existing name: {config_data.name}"
                 )
                 raise ConfigAlreadyExistsError(name=config_data.name)
 
-        # Update configuration
-        config.name = config_data.name
-        config.description = config_data.description
-        config.conf_schema = json.dumps(config_data.conf_schema)
-
+        # Compare against the stored values and skip the write if nothing changed
+        changes: Dict[str, Any] = {
+            "name": config_data.name,
+            "description": config_data.description,
+            "conf_schema": _dumps_json(config_data.conf_schema),
+        }
         if config_data.conf_value is not None:
-            config.conf_value = json.dumps(config_data.conf_value)
+            changes["conf_value"] = _dumps_json(config_data.conf_value)
+
+        changes = {
+            field: value
+            for field, value in changes.items()
+            if getattr(config, field) != value
+        }
+        if not changes:
+            return config
+
+        # Update configuration
+        for field, value in changes.items():
+            setattr(config, field, value)
 
         config.updated_at = get_current_unix_ms()
         config.updated_by = current_user
 
         await self.db.commit()
-        await self.db.refresh(config)
+        self._forget_configs()
 
         return config
 
@@ -246,17 +382,17 @@ class ConfigService:
 
         # Update configuration value
         if conf_value is not None:
-            config.conf_value = json.dumps(conf_value)
+            config.conf_value = _dumps_json(conf_value)
 
         config.updated_at = get_current_unix_ms()
         config.updated_by = current_user
 
         await self.db.commit()
-        await self.db.refresh(config)
+        self._forget_configs()
 
         return config
 
-    async def check_config_in_use(self, config_id: int) -> Tuple[bool, List[dict]]:
+    async def check_config_in_use(self, config_id: int) -> Tuple[bool, List[Row]]:
         """
         Check if configuration is in use.
 
@@ -264,27 +400,50 @@ class ConfigService:
             config_id: Configuration ID
 
         Returns:
-            Tuple[bool, List[dict]]: Is in use, tools using it
+            Tuple[bool, List[Row]]: Is in use, (id, name) rows of the tools
+                using it
         """
-        # Check if used by tools
+        # Get the tools using it in a single join
         result = await self.db.execute(
-            select(TbToolConfig).where(TbToolConfig.config_id == config_id)
+            select(TbTool.id, TbTool.name)
+            .join(TbToolConfig, TbToolConfig.tool_id == TbTool.id)
+            .where(TbToolConfig.config_id == config_id)
         )
-        tool_configs = result.scalars().all()
+        tools_using = list(result.all())
 
-        # Get tool details
-        tools_using = []
-        for tool_config in tool_configs:
-            result = await self.db.execute(
-                select(TbConfig).where(TbConfig.id == tool_config.tool_id)
-            )
-            tool = result.scalars().first()
-            if tool:
-                tools_using.append({"id": tool.id, "name": tool.name})
+        return bool(tools_using), tools_using
+
+    async def _name_taken(self, name: str, exclude_id: Optional[int] = None) -> bool:
+        """
+        Check whether another configuration already uses a name.
+
+        Args:
+            name: Configuration name
+            exclude_id: Configuration ID to ignore, e.g. the one being updated
 
-        is_in_use = len(tools_using) > 0
+        Returns:
+            bool: True if the name is taken
+        """
+        query = select(literal(1)).where(TbConfig.name == name)
+        if exclude_id is not None:
+            query = query.where(TbConfig.id != exclude_id)
+        result = await self.db.execute(query.limit(1))
+        return result.first() is not None
 
-        return is_in_use, tools_using
+    async def _any_tool_uses(self, config_id: int) -> bool:
+        """
+        Check whether any tool references a configuration.
+
+        Args:
+            config_id: Configuration ID
+
+        Returns:
+            bool: True if at least one tool uses the configuration
+        """
+        result = await self.db.execute(
+            select(literal(1)).where(TbToolConfig.config_id == config_id).limit(1)
+        )
+        return result.first() is not None
 
     @audit(operation_type="delete", object_type="config")
     async def delete_config(
@@ -310,18 +469,25 @@ class ConfigService:
             logger.error(f"Configuration not found for delete operation: {config_id}")
             raise ConfigNotFoundError(config_id=config_id)
 
-        # Check if configuration is in use
-        is_in_use, tools_using = await self.check_config_in_use(config_id)
-        if is_in_use:
-            tool_names = ", ".join([tool["name"] for tool in tools_using])
+        # Check if configuration is in use; the tool list for the error is
+        # only loaded when it is
+        if await self._any_tool_uses(config_id):
+            _, tools_using = await self.check_config_in_use(config_id)
+            tool_names = ", ".join([tool.name for tool in tools_using])
             logger.warning(
                 f"Cannot delete configuration {config_id} because it is used by tools: {tool_names}"
             )
-            raise ConfigInUseError(config_id=config_id, used_by_tools=tools_using)
+            raise ConfigInUseError(
+                config_id=config_id,
+                used_by_tools=[
+                    {"id": tool.id, "name": tool.name} for tool in tools_using
+                ],
+            )
 
         # Delete configuration
         await self.db.delete(config)
         await self.db.commit()
+        self._forget_configs()
 
         return config
 
@@ -346,13 +512,14 @@ class ConfigService:
 
         # Get tools using this configuration
         result = await self.db.execute(
-            select(TbTool)
+            select(*_TOOL_RESPONSE_COLUMNS)
             .join(TbToolConfig, TbToolConfig.tool_id == TbTool.id)
             .where(TbToolConfig.config_id == config_id)
         )
-        tools = result.scalars().all()
+        tools = result.all()
 
-        # Create response
-        tool_responses = [ToolResponse.model_validate(tool) for tool in tools]
+        # ToolResponse parses its JSON columns in field validators, so
+        # model_construct cannot be used; validate the rows in one pass instead
+        tool_responses = validate_rows(_TOOL_RESPONSES_ADAPTER, ToolResponse, tools)
 
         return ConfigUsageResponse(tools=tool_responses)
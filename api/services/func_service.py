@@ -3,10 +3,11 @@ Function service.
 """
 
 import logging
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from sqlalchemy import desc, or_, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 from sqlalchemy.future import select
 
 from api.errors.func_error import (
@@ -68,71 +69,116 @@ class FuncService:
         return result.scalars().first()
 
     async def query_funcs(
-        self, page: int = 1, size: int = 20, search: Optional[str] = None
-    ) -> Tuple[List[TbFunc], int]:
+        self,
+        page: int = 1,
+        size: int = 20,
+        search: Optional[str] = None,
+        cursor: Optional[int] = None,
+    ) -> Tuple[List[TbFunc], int, bool]:
         """
         Query functions with pagination.
 
+        Functions are ordered by ID descending. When a cursor is given, the
+        page starts after that function ID (keyset pagination) and page is
+        ignored.
+
         Args:
             page: Page number (1-based)
             size: Page size
             search: Search term for name or description
+            cursor: ID of the last function of the previous page
 
         Returns:
-            Tuple[List[TbFunc], int]: List of functions and total count
+            Tuple[List[TbFunc], int, bool]: List of functions, total count and
+                whether more functions follow
         """
-        query = select(TbFunc)
-
-        # Apply filters
+        # Build the filters once so the page and count queries always agree
+        filters = []
         if search:
-            query = query.where(
+            filters.append(
                 or_(
                     TbFunc.name.ilike(f"%{search}%"),
                     TbFunc.description.ilike(f"%{search}%"),
                 )
             )
 
-        # Count total
-        count_query = select(func.count(TbFunc.id))
-
-        # Apply the same filters to count query
-        if search:
-            count_query = count_query.where(
-                or_(
-                    TbFunc.name.ilike(f"%{search}%"),
-                    TbFunc.description.ilike(f"%{search}%"),
-                )
-            )
+        query = select(TbFunc).where(*filters)
 
+        # Count total
+        count_query = select(func.count(TbFunc.id)).where(*filters)
         count_result = await self.db.execute(count_query)
         total = count_result.scalar()
 
-        # Apply pagination and ordering
-        query = query.order_by(desc(TbFunc.id)).offset((page - 1) * size).limit(size)
+        # Apply pagination and ordering; one extra row tells whether more follow
+        query = query.order_by(desc(TbFunc.id)).limit(size + 1)
+        if cursor is not None:
+            query = query.where(TbFunc.id < cursor)
+        else:
+            query = query.offset((page - 1) * size)
 
         # Execute query
         result = await self.db.execute(query)
-        funcs = result.scalars().all()
+        funcs = list(result.scalars().all())
 
-        return list(funcs), total
+        has_next = len(funcs) > size
+        return funcs[:size], total, has_next
 
     async def check_circular_dependency(
-        self, func_id: int, depend_ids: List[int], path: Optional[List[int]] = None
+        self, func_id: int, depend_ids: Sequence[int]
     ) -> None:
         """
         Check for circular dependencies.
 
+        Every dependency edge reachable from depend_ids is loaded with one
+        recursive query; the walk itself then runs in memory.
+
         Args:
             func_id: Function ID
             depend_ids: Dependency function IDs
-            path: Current dependency path
 
         Raises:
             CircularDependencyError: If circular dependency is detected
         """
-        if path is None:
-            path = []
+        graph: Dict[int, List[int]] = {}
+        if depend_ids and func_id not in depend_ids:
+            # UNION drops repeated edges, so the recursion ends even when the
+            # stored dependencies already contain a cycle
+            edge = aliased(TbFuncDepends)
+            reachable = (
+                select(TbFuncDepends.func_id, TbFuncDepends.depends_on_func_id)
+                .where(TbFuncDepends.func_id.in_(depend_ids))
+                .cte("reachable", recursive=True)
+            )
+            reachable = reachable.union(
+                select(edge.func_id, edge.depends_on_func_id).join(
+                    reachable, edge.func_id == reachable.c.depends_on_func_id
+                )
+            )
+            result = await self.db.execute(select(reachable))
+            for parent_id, child_id in result.all():
+                graph.setdefault(parent_id, []).append(child_id)
+
+        self._walk_dependencies(func_id, depend_ids, graph, [])
+
+    def _walk_dependencies(
+        self,
+        func_id: int,
+        depend_ids: Sequence[int],
+        graph: Dict[int, List[int]],
+        path: List[int],
+    ) -> None:
+        """
+        Walk loaded dependency edges depth-first, looking for a cycle.
 
+        Args:
+            func_id: Function ID
+            depend_ids: Dependency function IDs at this level
+            graph: Dependency IDs of each reachable function
+            path: Current dependency path
+
+        Raises:
+            CircularDependencyError: If circular dependency is detected
+        """
         # Check if func_id is in depend_ids
         if func_id in depend_ids:
             logger.error(
@@ -150,18 +196,11 @@ class FuncService:
                     func_id=func_id, dependency_path=path + [depend_id]
                 )
 
-            # Get dependencies of this dependency
-            result = await self.db.execute(
-                select(TbFuncDepends.depends_on_func_id).where(
-                    TbFuncDepends.func_id == depend_id
-                )
-            )
-            nested_depend_ids = [row[0] for row in result]
-
             # Recursively check
+            nested_depend_ids = graph.get(depend_id)
             if nested_depend_ids:
-                await self.check_circular_dependency(
-                    func_id, nested_depend_ids, path + [depend_id]
+                self._walk_dependencies(
+                    func_id, nested_depend_ids, graph, path + [depend_id]
                 )
 
     @audit(operation_type="create", object_type="func")
@@ -352,49 +391,59 @@ class FuncService:
         return deploy
 
     async def get_func_deploy_history(
-        self, func_id: int, page: int = 1, size: int = 20
-    ) -> Tuple[List[TbFuncDeploy], int]:
+        self,
+        func_id: int,
+        page: int = 1,
+        size: int = 20,
+        cursor: Optional[int] = None,
+    ) -> Tuple[List[TbFuncDeploy], int, bool]:
         """
         Get function deployment history.
 
+        Deployments are ordered by version descending. When a cursor is
+        given, the page starts after that version (keyset pagination) and
+        page is ignored.
+
         Args:
             func_id: Function ID
             page: Page number (1-based)
             size: Page size
+            cursor: Version of the last deployment of the previous page
 
         Returns:
-            Tuple[List[TbFuncDeploy], int]: List of deployments and total count
+            Tuple[List[TbFuncDeploy], int, bool]: List of deployments, total
+                count and whether more deployments follow
 
         Raises:
             FuncNotFoundError: If function not found
         """
         # Check if function exists
-        func = await self.get_func_by_id(func_id)
-        if not func:
+        if not await self.get_func_by_id(func_id):
             logger.error(f"Function not found for deployment history query: {func_id}")
             raise FuncNotFoundError(func_id=func_id)
 
         # Query deployments
         query = select(TbFuncDeploy).where(TbFuncDeploy.func_id == func_id)
 
-        # Count total
+        # Count total in the database instead of loading every ID
         count_result = await self.db.execute(
-            select(TbFuncDeploy.id).where(TbFuncDeploy.func_id == func_id)
+            select(func.count(TbFuncDeploy.id)).where(TbFuncDeploy.func_id == func_id)
         )
-        total = len(count_result.scalars().all())
+        total = count_result.scalar()
 
-        # Apply pagination and ordering
-        query = (
-            query.order_by(desc(TbFuncDeploy.version))
-            .offset((page - 1) * size)
-            .limit(size)
-        )
+        # Apply pagination and ordering; one extra row tells whether more follow
+        query = query.order_by(desc(TbFuncDeploy.version)).limit(size + 1)
+        if cursor is not None:
+            query = query.where(TbFuncDeploy.version < cursor)
+        else:
+            query = query.offset((page - 1) * size)
 
         # Execute query
         result = await self.db.execute(query)
-        deploys = result.scalars().all()
+        deploys = list(result.scalars().all())
 
-        return list(deploys), total
+        has_next = len(deploys) > size
+        return deploys[:size], total, has_next
 
     @audit(operation_type="rollback", object_type="func")
     async def rollback_func(
@@ -457,37 +506,21 @@ class FuncService:
         Returns:
             Tuple[bool, List[dict], List[dict]]: Is in use, tools using it, functions using it
         """
-        # Check if used by tools
+        # Get the tools using it in a single join
         result = await self.db.execute(
-            select(TbToolFunc).where(TbToolFunc.func_id == func_id)
+            select(TbTool.id, TbTool.name)
+            .join(TbToolFunc, TbToolFunc.tool_id == TbTool.id)
+            .where(TbToolFunc.func_id == func_id)
         )
-        tool_funcs = result.scalars().all()
+        tools_using = [{"id": row.id, "name": row.name} for row in result.all()]
 
-        # Check if used by other functions
+        # Get the functions depending on it in a single join
         result = await self.db.execute(
-            select(TbFuncDepends).where(TbFuncDepends.depends_on_func_id == func_id)
+            select(TbFunc.id, TbFunc.name)
+            .join(TbFuncDepends, TbFuncDepends.func_id == TbFunc.id)
+            .where(TbFuncDepends.depends_on_func_id == func_id)
         )
-        func_depends = result.scalars().all()
-
-        # Get tool details
-        tools_using = []
-        for tool_func in tool_funcs:
-            result = await self.db.execute(
-                select(TbFunc).where(TbFunc.id == tool_func.tool_id)
-            )
-            tool = result.scalars().first()
-            if tool:
-                tools_using.append({"id": tool.id, "name": tool.name})
-
-        # Get function details
-        funcs_using = []
-        for func_depend in func_depends:
-            result = await self.db.execute(
-                select(TbFunc).where(TbFunc.id == func_depend.func_id)
-            )
-            func = result.scalars().first()
-            if func:
-                funcs_using.append({"id": func.id, "name": func.name})
+        funcs_using = [{"id": row.id, "name": row.name} for row in result.all()]
 
         is_in_use = len(tools_using) > 0 or len(funcs_using) > 0
 
@@ -3,13 +3,19 @@ Log service for managing system logs.
 """
 
 import logging
-from datetime import datetime
+import mmap
+import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+from api.errors.base_error import ValidationError
 
 # Create logger
 logger = logging.getLogger(__name__)
 
+# Bytes read from a log file at a time
+LOG_CHUNK_SIZE = 64 * 1024
+
 
 class LogService:
     """
@@ -55,11 +61,7 @@ class LogService:
                         "name": file_path.name,
                         "path": str(file_path),
                         "size": stats.st_size,
-                        "size_human": self._format_size(stats.st_size),
                         "modified_at": int(stats.st_mtime * 1000),  # Convert to UnixMS
-                        "modified_at_human": datetime.fromtimestamp(
-                            stats.st_mtime
-                        ).strftime("%Y-%m-%d %H:%M:%S"),
                     }
 
                     log_files.append(file_info)
@@ -86,44 +88,15 @@ class LogService:
         Returns:
             Tuple[str, int]: Log content and total number of lines
         """
-        file_path = self.log_dir / file_name
-        content = ""
-        total_lines = 0
-
         try:
-            # Check if file exists and is within the logs directory
-            if not file_path.exists() or not file_path.is_file():
-                logger.warning(f"Log file not found: {file_name}")
-                return f"Log file not found: {file_name}", 0
-
-            # Security check: ensure the file is within the logs directory
-            if not str(file_path.resolve()).startswith(str(self.log_dir.resolve())):
-                logger.warning(
-                    f"Attempted to access file outside logs directory: {file_name}"
-                )
-                return "Access denied: File is outside logs directory", 0
-
-            # Read file content
-            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                if tail:
-                    # Count total lines first
-                    lines = f.readlines()
-                    total_lines = len(lines)
-
-                    # Get the last max_lines
-                    start_line = max(0, total_lines - max_lines)
-                    content_lines = lines[start_line:]
-                    content = "".join(content_lines)
-                else:
-                    # Read from beginning
-                    lines = []
-                    for i, line in enumerate(f):
-                        if i < max_lines:
-                            lines.append(line)
-                        total_lines = i + 1
-
-                    content = "".join(lines)
-
+            file_path, start, end, total_lines = self.get_log_range(
+                file_name, max_lines, tail
+            )
+            content = b"".join(self.iter_log_bytes(file_path, start, end)).decode(
+                "utf-8", errors="replace"
+            )
+        except ValidationError as e:
+            return e.description, 0
         except Exception as e:
             logger.error(f"Error reading log file {file_name}: {str(e)}")
             content = f"Error reading log file: {str(e)}"
@@ -131,20 +104,108 @@ class LogService:
 
         return content, total_lines
 
-    # 日志文件下载功能已移除
+    def get_log_range(
+        self, file_name: str, max_lines: int = 1000, tail: bool = True
+    ) -> Tuple[Path, int, int, int]:
+        """
+        Locate the byte range holding the requested lines of a log file.
+
+        The file is memory-mapped and scanned for newlines, so finding the
+        range never loads the file into Python memory.
+
+        Args:
+            file_name: Name of the log file
+            max_lines: Maximum number of lines to select
+            tail: If True, selects the last max_lines, otherwise the first
+
+        Returns:
+            Tuple[Path, int, int, int]: File path, start offset, end offset
+            and total number of lines
+
+        Raises:
+            ValidationError: If the file does not exist or is outside the logs
+                directory
+        """
+        file_path = self.log_dir / file_name
+
+        # Check if file exists and is within the logs directory
+        if not file_path.exists() or not file_path.is_file():
+            logger.warning(f"Log file not found: {file_name}")
+            raise ValidationError(
+                reason="日志文件不存在",
+                description=f"Log file not found: {file_name}",
+                details={"file_name": file_name},
+            )
+
+        # Security check: ensure the file is within the logs directory
+        if not str(file_path.resolve()).startswith(str(self.log_dir.resolve())):
+            logger.warning(
+                f"Attempted to access file outside logs directory: {file_name}"
+            )
+            raise ValidationError(
+                reason="禁止访问日志目录以外的文件",
+                description="Access denied: File is outside logs directory",
+                details={"file_name": file_name},
+            )
+
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return file_path, 0, 0, 0
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                total_lines = sum(
+                    mm[i : i + LOG_CHUNK_SIZE].count(b"\n")
+                    for i in range(0, size, LOG_CHUNK_SIZE)
+                )
+                has_trailing_newline = mm[size - 1 : size] == b"\n"
+                if not has_trailing_newline:
+                    total_lines += 1
+
+                if tail:
+                    # Walk back max_lines newlines from the end of the file
+                    pos = size - 1 if has_trailing_newline else size
+                    for _ in range(max_lines):
+                        pos = mm.rfind(b"\n", 0, pos)
+                        if pos < 0:
+                            break
+                    return file_path, pos + 1, size, total_lines
+
+                # Walk forward max_lines newlines from the start of the file
+                end = pos = 0
+                for _ in range(max_lines):
+                    pos = mm.find(b"\n", end)
+                    if pos < 0:
+                        end = size
+                        break
+                    end = pos + 1
+                return file_path, 0, end, total_lines
 
     @staticmethod
-    def _format_size(size_bytes: int) -> str:
+    def iter_log_bytes(
+        file_path: Path, start: int, end: int, chunk_size: int = LOG_CHUNK_SIZE
+    ) -> Iterator[bytes]:
         """
-        Format file size in human-readable format.
+        Read a byte range of a log file in chunks through a memory map.
 
         Args:
-            size_bytes: Size in bytes
+            file_path: Log file path
+            start: Start offset
+            end: End offset (exclusive)
+            chunk_size: Size of each chunk in bytes
 
-        Returns:
-            str: Human-readable size
+        Yields:
+            bytes: Consecutive chunks of the range
         """
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size_bytes < 1024 or unit == "GB":
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024
+        with open(file_path, "rb") as f:
+            # The file may have been rotated or truncated since the range was
+            # located
+            end = min(end, os.fstat(f.fileno()).st_size)
+            if end <= start:
+                return
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for offset in range(start, end, chunk_size):
+                    yield mm[offset : min(offset + chunk_size, end)]
+
+    # 日志文件下载功能已移除
@@ -205,12 +205,9 @@ class OpenApiService:
 
                 # Deploy tool
                 await self.tool_service.deploy_tool(
-                    tool.id, "Initial import from OpenAPI", current_user
+                    tool.id, "Initial import from OpenAPI", current_user, tool=tool
                 )
 
-                # Refresh tool
-                await self.db.refresh(tool)
-
                 imported_tools.append(tool)
 
             except ToolAlreadyExistsError:
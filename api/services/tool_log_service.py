@@ -2,12 +2,13 @@
 Tool log service.
 """
 
-import json
 import logging
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple, Dict, Any
 
-from sqlalchemy import desc, func, and_, case
+import orjson
+from sqlalchemy import desc, func, and_, case, lambda_stmt
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -74,18 +75,24 @@ class ToolLogService:
         """
         current_time = get_current_unix_ms()
 
-        # Convert parameters and response data to JSON strings
+        # Convert parameters and response data to JSON strings. orjson never
+        # writes NaN/Infinity, so the stored text is always valid JSON and can
+        # be embedded verbatim in list responses.
         request_params_str = None
         if request_params:
             try:
-                request_params_str = json.dumps(request_params, ensure_ascii=False)
+                request_params_str = orjson.dumps(
+                    request_params, option=orjson.OPT_NON_STR_KEYS
+                ).decode()
             except Exception as e:
                 logger.warning(f"Failed to serialize request_params: {str(e)}")
 
         response_data_str = None
         if response_data:
             try:
-                response_data_str = json.dumps(response_data, ensure_ascii=False)
+                response_data_str = orjson.dumps(
+                    response_data, option=orjson.OPT_NON_STR_KEYS
+                ).decode()
             except Exception as e:
                 logger.warning(f"Failed to serialize response_data: {str(e)}")
 
@@ -136,50 +143,90 @@ class ToolLogService:
         Returns:
             Tuple[List[TbToolLog], int]: List of logs and total count
         """
-        query = select(TbToolLog)
+        # Statements are built as lambda statements so SQLAlchemy caches the
+        # compiled SQL per filter combination; filter values become bound params
+        query = self._apply_log_filters(
+            lambda_stmt(lambda: select(TbToolLog)),
+            tool_name,
+            call_type,
+            is_success,
+            start_time,
+            end_time,
+        )
+        count_query = self._apply_log_filters(
+            lambda_stmt(lambda: select(func.count(TbToolLog.id))),
+            tool_name,
+            call_type,
+            is_success,
+            start_time,
+            end_time,
+        )
 
-        # Apply filters
-        if tool_name:
-            query = query.where(TbToolLog.tool_name.ilike(f"%{tool_name}%"))
-        if call_type:
-            query = query.where(TbToolLog.call_type == call_type)
-        if is_success is not None:
-            query = query.where(TbToolLog.is_success == is_success)
-        if start_time:
-            query = query.where(TbToolLog.request_time >= start_time)
-        if end_time:
-            query = query.where(TbToolLog.request_time <= end_time)
+        count_result = await self.db.execute(count_query)
+        total = count_result.scalar()
 
-        # Count total
-        count_query = select(func.count(TbToolLog.id))
+        # Apply pagination and ordering
+        offset = (page - 1) * size
+        query += lambda s: s.order_by(desc(TbToolLog.request_time))
+        query += lambda s: s.offset(offset).limit(size)
 
-        # Apply the same filters to count query
+        # Execute query
+        result = await self.db.execute(query)
+        logs = result.scalars().all()
+
+        return list(logs), total
+
+    @staticmethod
+    def _apply_log_filters(
+        stmt: StatementLambdaElement,
+        tool_name: Optional[str] = None,
+        call_type: Optional[str] = None,
+        is_success: Optional[bool] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+    ) -> StatementLambdaElement:
+        """
+        Add log filter criteria to a lambda statement.
+
+        Args:
+            stmt: Lambda statement to extend
+            tool_name: Tool name filter
+            call_type: Call type filter (mcp, debug)
+            is_success: Success status filter
+            start_time: Start time filter (UnixMS)
+            end_time: End time filter (UnixMS)
+
+        Returns:
+            StatementLambdaElement: Statement with filters applied
+        """
         if tool_name:
-            count_query = count_query.where(TbToolLog.tool_name.ilike(f"%{tool_name}%"))
+            tool_name_pattern = f"%{tool_name}%"
+            stmt += lambda s: s.where(TbToolLog.tool_name.ilike(tool_name_pattern))
         if call_type:
-            count_query = count_query.where(TbToolLog.call_type == call_type)
+            stmt += lambda s: s.where(TbToolLog.call_type == call_type)
         if is_success is not None:
-            count_query = count_query.where(TbToolLog.is_success == is_success)
+            stmt += lambda s: s.where(TbToolLog.is_success == is_success)
         if start_time:
-            count_query = count_query.where(TbToolLog.request_time >= start_time)
+            stmt += lambda s: s.where(TbToolLog.request_time >= start_time)
         if end_time:
-            count_query = count_query.where(TbToolLog.request_time <= end_time)
+            stmt += lambda s: s.where(TbToolLog.request_time <= end_time)
+        return stmt
 
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar()
+    @staticmethod
+    def _count_if(condition):
+        """
+        Build a conditional count expression for aggregate queries.
 
-        # Apply pagination and ordering
-        query = (
-            query.order_by(desc(TbToolLog.request_time))
-            .offset((page - 1) * size)
-            .limit(size)
-        )
+        SUM returns a Decimal on MySQL, so callers convert the result with
+        int() before building response models.
 
-        # Execute query
-        result = await self.db.execute(query)
-        logs = result.scalars().all()
+        Args:
+            condition: SQL condition to count
 
-        return list(logs), total
+        Returns:
+            SQL expression counting rows matching the condition
+        """
+        return func.sum(case((condition, 1), else_=0))
 
     async def get_stats(self) -> ToolStatsResponse:
         """
@@ -200,15 +247,29 @@ class ToolLogService:
         week_start = int((datetime.now() - timedelta(days=7)).timestamp() * 1000)
         month_start = int((datetime.now() - timedelta(days=30)).timestamp() * 1000)
 
-        # Total calls
-        total_result = await self.db.execute(select(func.count(TbToolLog.id)))
-        total_calls = total_result.scalar() or 0
-
-        # Success calls
-        success_result = await self.db.execute(
-            select(func.count(TbToolLog.id)).where(TbToolLog.is_success == True)
+        # All counters are computed in a single aggregate query
+        result = await self.db.execute(
+            select(
+                func.count(TbToolLog.id).label("total_calls"),
+                self._count_if(TbToolLog.is_success == True).label("success_calls"),
+                func.avg(TbToolLog.duration_ms).label("avg_duration_ms"),
+                self._count_if(TbToolLog.request_time >= today_start).label(
+                    "calls_today"
+                ),
+                self._count_if(TbToolLog.request_time >= week_start).label(
+                    "calls_this_week"
+                ),
+                self._count_if(TbToolLog.request_time >= month_start).label(
+                    "calls_this_month"
+                ),
+                self._count_if(TbToolLog.call_type == "mcp").label("mcp_calls"),
+                self._count_if(TbToolLog.call_type == "debug").label("debug_calls"),
+            )
         )
-        success_calls = success_result.scalar() or 0
+        row = result.one()
+
+        total_calls = int(row.total_calls or 0)
+        success_calls = int(row.success_calls or 0)
 
         # Failed calls
         failed_calls = total_calls - success_calls
@@ -216,54 +277,21 @@ class ToolLogService:
         # Success rate
         success_rate = (success_calls / total_calls * 100) if total_calls > 0 else 0
 
-        # Average duration
-        avg_duration_result = await self.db.execute(
-            select(func.avg(TbToolLog.duration_ms)).where(
-                TbToolLog.duration_ms.is_not(None)
-            )
-        )
-        avg_duration_ms = avg_duration_result.scalar()
-
-        # Calls today
-        today_result = await self.db.execute(
-            select(func.count(TbToolLog.id)).where(
-                TbToolLog.request_time >= today_start
-            )
-        )
-        calls_today = today_result.scalar() or 0
-
-        # Calls this week
-        week_result = await self.db.execute(
-            select(func.count(TbToolLog.id)).where(TbToolLog.request_time >= week_start)
-        )
-        calls_this_week = week_result.scalar() or 0
-
-        # Calls this month
-        month_result = await self.db.execute(
-            select(func.count(TbToolLog.id)).where(
-                TbToolLog.request_time >= month_start
-            )
-        )
-        calls_this_month = month_result.scalar() or 0
-
-        # MCP calls
-        mcp_result = await self.db.execute(
-            select(func.count(TbToolLog.id)).where(TbToolLog.call_type == "mcp")
-        )
-        mcp_calls = mcp_result.scalar() or 0
-
-        # Debug calls
-        debug_result = await self.db.execute(
-            select(func.count(TbToolLog.id)).where(TbToolLog.call_type == "debug")
-        )
-        debug_calls = debug_result.scalar() or 0
+        avg_duration_ms = row.avg_duration_ms
+        calls_today = int(row.calls_today or 0)
+        calls_this_week = int(row.calls_this_week or 0)
+        calls_this_month = int(row.calls_this_month or 0)
+        mcp_calls = int(row.mcp_calls or 0)
+        debug_calls = int(row.debug_calls or 0)
 
-        return ToolStatsResponse(
+        return ToolStatsResponse.model_construct(
             total_calls=total_calls,
             success_calls=success_calls,
             failed_calls=failed_calls,
             success_rate=round(success_rate, 2),
-            avg_duration_ms=round(avg_duration_ms, 2) if avg_duration_ms else None,
+            avg_duration_ms=(
+                round(float(avg_duration_ms), 2) if avg_duration_ms else None
+            ),
             calls_today=calls_today,
             calls_this_week=calls_this_week,
             calls_this_month=calls_this_month,
@@ -296,79 +324,48 @@ class ToolLogService:
                 datetime.combine(date, datetime.max.time()).timestamp() * 1000
             )
 
-            # Total calls for the day
-            total_result = await self.db.execute(
-                select(func.count(TbToolLog.id)).where(
+            # One range-bounded aggregate query per day on the indexed request_time
+            result = await self.db.execute(
+                select(
+                    func.count(TbToolLog.id).label("total_calls"),
+                    self._count_if(TbToolLog.is_success == True).label(
+                        "success_calls"
+                    ),
+                    self._count_if(TbToolLog.call_type == "mcp").label("mcp_calls"),
+                    self._count_if(TbToolLog.call_type == "debug").label(
+                        "debug_calls"
+                    ),
+                    func.avg(TbToolLog.duration_ms).label("avg_duration_ms"),
+                ).where(
                     and_(
                         TbToolLog.request_time >= day_start,
                         TbToolLog.request_time <= day_end,
                     )
                 )
             )
-            total_calls = total_result.scalar() or 0
+            row = result.one()
 
-            # Success calls for the day
-            success_result = await self.db.execute(
-                select(func.count(TbToolLog.id)).where(
-                    and_(
-                        TbToolLog.request_time >= day_start,
-                        TbToolLog.request_time <= day_end,
-                        TbToolLog.is_success == True,
-                    )
-                )
-            )
-            success_calls = success_result.scalar() or 0
+            total_calls = int(row.total_calls or 0)
+            success_calls = int(row.success_calls or 0)
 
             # Failed calls for the day
             failed_calls = total_calls - success_calls
 
-            # MCP calls for the day
-            mcp_result = await self.db.execute(
-                select(func.count(TbToolLog.id)).where(
-                    and_(
-                        TbToolLog.request_time >= day_start,
-                        TbToolLog.request_time <= day_end,
-                        TbToolLog.call_type == "mcp",
-                    )
-                )
-            )
-            mcp_calls = mcp_result.scalar() or 0
-
-            # Debug calls for the day
-            debug_result = await self.db.execute(
-                select(func.count(TbToolLog.id)).where(
-                    and_(
-                        TbToolLog.request_time >= day_start,
-                        TbToolLog.request_time <= day_end,
-                        TbToolLog.call_type == "debug",
-                    )
-                )
-            )
-            debug_calls = debug_result.scalar() or 0
-
-            # Average duration for the day
-            avg_duration_result = await self.db.execute(
-                select(func.avg(TbToolLog.duration_ms)).where(
-                    and_(
-                        TbToolLog.request_time >= day_start,
-                        TbToolLog.request_time <= day_end,
-                        TbToolLog.duration_ms.is_not(None),
-                    )
-                )
-            )
-            avg_duration_ms = avg_duration_result.scalar()
+            mcp_calls = int(row.mcp_calls or 0)
+            debug_calls = int(row.debug_calls or 0)
+            avg_duration_ms = row.avg_duration_ms
 
             trends.append(
-                ToolTrendResponse(
+                ToolTrendResponse.model_construct(
                     date=date_str,
                     total_calls=total_calls,
                     success_calls=success_calls,
                     failed_calls=failed_calls,
                     mcp_calls=mcp_calls,
                     debug_calls=debug_calls,
-                    avg_duration_ms=round(avg_duration_ms, 2)
-                    if avg_duration_ms
-                    else None,
+                    avg_duration_ms=(
+                        round(float(avg_duration_ms), 2) if avg_duration_ms else None
+                    ),
                 )
             )
 
@@ -390,15 +387,9 @@ class ToolLogService:
                 TbToolLog.tool_name,
                 TbToolLog.tool_id,
                 func.count(TbToolLog.id).label("total_calls"),
-                func.sum(case((TbToolLog.is_success == True, 1), else_=0)).label(
-                    "success_calls"
-                ),
-                func.sum(case((TbToolLog.call_type == "mcp", 1), else_=0)).label(
-                    "mcp_calls"
-                ),
-                func.sum(case((TbToolLog.call_type == "debug", 1), else_=0)).label(
-                    "debug_calls"
-                ),
+                self._count_if(TbToolLog.is_success == True).label("success_calls"),
+                self._count_if(TbToolLog.call_type == "mcp").label("mcp_calls"),
+                self._count_if(TbToolLog.call_type == "debug").label("debug_calls"),
                 func.avg(TbToolLog.duration_ms).label("avg_duration_ms"),
                 func.max(TbToolLog.request_time).label("last_call_time"),
             )
@@ -409,15 +400,15 @@ class ToolLogService:
 
         tool_stats = []
         for row in result:
-            total_calls = row.total_calls or 0
-            success_calls = row.success_calls or 0
+            total_calls = int(row.total_calls or 0)
+            success_calls = int(row.success_calls or 0)
             failed_calls = total_calls - success_calls
-            mcp_calls = row.mcp_calls or 0
-            debug_calls = row.debug_calls or 0
+            mcp_calls = int(row.mcp_calls or 0)
+            debug_calls = int(row.debug_calls or 0)
             success_rate = (success_calls / total_calls * 100) if total_calls > 0 else 0
 
             tool_stats.append(
-                ToolUsageStatsResponse(
+                ToolUsageStatsResponse.model_construct(
                     tool_name=row.tool_name,
                     tool_id=row.tool_id,
                     total_calls=total_calls,
@@ -426,9 +417,11 @@ class ToolLogService:
                     mcp_calls=mcp_calls,
                     debug_calls=debug_calls,
                     success_rate=round(success_rate, 2),
-                    avg_duration_ms=round(row.avg_duration_ms, 2)
-                    if row.avg_duration_ms
-                    else None,
+                    avg_duration_ms=(
+                        round(float(row.avg_duration_ms), 2)
+                        if row.avg_duration_ms
+                        else None
+                    ),
                     last_call_time=row.last_call_time,
                 )
             )
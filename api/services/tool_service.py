@@ -2,19 +2,22 @@
 Tool service.
 """
 
-import io
+import asyncio
 import json
 import logging
 import os
+import time
 import traceback
-from contextlib import redirect_stdout, redirect_stderr
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, AsyncIterator
+from urllib.parse import urlparse
 
+import orjson
 import yaml
-from sqlalchemy import or_, desc, func
+from sqlalchemy import Row, or_, desc, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from api.errors.base_error import ValidationError
 from api.errors.config_error import ConfigAlreadyExistsError
 from api.errors.tool_error import (
     ToolNotFoundError,
@@ -38,14 +41,45 @@ from api.services.config_service import ConfigService
 from api.services.func_service import FuncService
 from api.services.tool_log_service import ToolLogService
 from api.utils.audit_util import audit
+from api.utils.exec_util import create_executor, exec_captured
+from api.utils.json_util import loads_cached
 from api.utils.time_util import get_current_unix_ms
-from api.mybatisx import MyBatisXml
-from api.config import BASE_DIR
+from api.mybatisx import BACKSLASH_ESCAPE_SCHEMES, MyBatisXml
+from api.config import BASE_DIR, get_config
 from api.constants import ToolType
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Tool code is synchronous, so it runs on worker threads to keep the event
+# loop responsive while a tool computes or blocks on I/O
+_tool_executor = create_executor(get_config().tool_executor_workers)
+
+# Largest page query_tools will return; use list_mcp_tools to fetch everything
+MAX_PAGE_SIZE = 100
+
+# Builtin tool catalog cache: (expires_at monotonic seconds, catalog)
+BUILTIN_TOOLS_CACHE_TTL = 300
+_builtin_tools_cache: Optional[Tuple[float, BuiltinToolListResponse]] = None
+
+# Rendered MCP tool list: (tools version it was built for, JSON bytes).
+# The version is bumped whenever a tool is created, changed or removed.
+_mcp_tools_version = 0
+_mcp_tools_json_cache: Optional[Tuple[int, bytes]] = None
+
+
+# MCP name lookups: name -> (tools version, (id, is_enabled) row or None)
+MCP_TOOL_REF_CACHE_SIZE = 1024
+_mcp_tool_ref_cache: Dict[str, Tuple[int, Optional[Row]]] = {}
+
+
+def invalidate_mcp_tools_cache() -> None:
+    """
+    Mark the rendered MCP tool list as stale.
+    """
+    global _mcp_tools_version
+    _mcp_tools_version += 1
+
 
 class ToolService:
     """
@@ -74,6 +108,19 @@ class ToolService:
         result = await self.db.execute(select(TbTool).where(TbTool.id == tool_id))
         return result.scalars().first()
 
+    async def _tool_exists(self, tool_id: int) -> bool:
+        """
+        Check whether a tool exists without loading the row.
+
+        Args:
+            tool_id: Tool ID
+
+        Returns:
+            bool: True if the tool exists
+        """
+        result = await self.db.execute(select(TbTool.id).where(TbTool.id == tool_id))
+        return result.first() is not None
+
     async def get_tool_by_name(self, name: str) -> Optional[TbTool]:
         """
         Get tool by name.
@@ -87,25 +134,73 @@ class ToolService:
         result = await self.db.execute(select(TbTool).where(TbTool.name == name))
         return result.scalars().first()
 
+    async def get_mcp_tool_ref(self, name: str) -> Optional[Row]:
+        """
+        Resolve a tool name to its ID and enabled state for MCP execution.
+
+        Results are cached until the next tool change, so back-to-back calls
+        of the same tool skip the lookup.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            Optional[Row]: Row with id and is_enabled, or None if not found
+        """
+        version = _mcp_tools_version
+        cached = _mcp_tool_ref_cache.get(name)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        result = await self.db.execute(
+            select(TbTool.id, TbTool.is_enabled).where(TbTool.name == name)
+        )
+        ref = result.first()
+
+        if len(_mcp_tool_ref_cache) >= MCP_TOOL_REF_CACHE_SIZE:
+            _mcp_tool_ref_cache.clear()
+        _mcp_tool_ref_cache[name] = (version, ref)
+        return ref
+
     async def query_tools(
         self,
         page: int = 1,
         size: int = 20,
         search: Optional[str] = None,
         tag_ids: Optional[List[int]] = None,
-    ) -> Tuple[List[TbTool], int]:
+        cursor: Optional[int] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[TbTool], Optional[int], bool]:
         """
         Query tools with pagination.
 
+        Tools are ordered by ID descending. When a cursor is given, the page
+        starts after that tool ID (keyset pagination) and page is ignored.
+        One extra row is fetched to tell whether another page follows, so the
+        COUNT query can be skipped when the caller does not need a total.
+
         Args:
             page: Page number (1-based)
             size: Page size
             search: Search term for name or description
             tag_ids: List of tag IDs to filter by
+            cursor: ID of the last tool of the previous page
+            include_total: Whether to count the total number of matching tools
 
         Returns:
-            Tuple[List[TbTool], int]: List of tools and total count
+            Tuple[List[TbTool], Optional[int], bool]: List of tools, total count
+                (None if not requested) and whether more tools follow
+
+        Raises:
+            ValidationError: If size is outside 1..MAX_PAGE_SIZE
         """
+        if size < 1 or size > MAX_PAGE_SIZE:
+            raise ValidationError(
+                reason="Invalid page size",
+                description=f"size must be between 1 and {MAX_PAGE_SIZE}",
+                details={"size": size},
+            )
+
         query = select(TbTool)
 
         # Apply tag filter
@@ -126,35 +221,125 @@ class ToolService:
                 )
             )
 
-        # Count total
-        count_query = select(func.count(func.distinct(TbTool.id)))
-
-        # Apply tag filter to count query
-        if tag_ids:
-            count_query = count_query.join(
-                TbToolTag, TbTool.id == TbToolTag.tool_id
-            ).where(TbToolTag.tag_id.in_(tag_ids))
-
-        # Apply search filter to count query
-        if search:
-            count_query = count_query.where(
-                or_(
-                    TbTool.name.ilike(f"%{search}%"),
-                    TbTool.description.ilike(f"%{search}%"),
+        total = None
+        if include_total:
+            # Count total
+            count_query = select(func.count(func.distinct(TbTool.id)))
+
+            # Apply tag filter to count query
+            if tag_ids:
+                count_query = count_query.join(
+                    TbToolTag, TbTool.id == TbToolTag.tool_id
+                ).where(TbToolTag.tag_id.in_(tag_ids))
+
+            # Apply search filter to count query
+            if search:
+                count_query = count_query.where(
+                    or_(
+                        TbTool.name.ilike(f"%{search}%"),
+                        TbTool.description.ilike(f"%{search}%"),
+                    )
                 )
-            )
 
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar()
+            count_result = await self.db.execute(count_query)
+            total = count_result.scalar()
 
         # Apply pagination and ordering
-        query = query.order_by(desc(TbTool.id)).offset((page - 1) * size).limit(size)
+        query = query.order_by(desc(TbTool.id)).limit(size + 1)
+        if cursor is not None:
+            query = query.where(TbTool.id < cursor)
+        else:
+            query = query.offset((page - 1) * size)
 
         # Execute query
         result = await self.db.execute(query)
-        tools = result.scalars().all()
+        tools = list(result.scalars().all())
+
+        has_next = len(tools) > size
+        return tools[:size], total, has_next
 
-        return list(tools), total
+    def _mcp_tools_query(self, tag_ids: Optional[List[int]] = None):
+        """
+        Build the query for enabled tools with only the MCP columns.
+
+        Args:
+            tag_ids: List of tag IDs to filter by
+
+        Returns:
+            Select: Query returning name, description and parameters
+        """
+        query = select(TbTool.name, TbTool.description, TbTool.parameters).where(
+            TbTool.is_enabled == True
+        )
+
+        # Apply tag filter
+        if tag_ids:
+            query = query.where(
+                TbTool.id.in_(
+                    select(TbToolTag.tool_id).where(TbToolTag.tag_id.in_(tag_ids))
+                )
+            )
+
+        return query.order_by(desc(TbTool.id))
+
+    async def list_mcp_tools(self, tag_ids: Optional[List[int]] = None) -> List[Row]:
+        """
+        List enabled tools with only the columns needed to expose them over MCP.
+
+        Args:
+            tag_ids: List of tag IDs to filter by
+
+        Returns:
+            List[Row]: Rows with name, description and parameters
+        """
+        result = await self.db.execute(self._mcp_tools_query(tag_ids))
+        return list(result.all())
+
+    async def stream_mcp_tools(
+        self, tag_ids: Optional[List[int]] = None
+    ) -> AsyncIterator[Row]:
+        """
+        Iterate enabled tools for MCP one row at a time.
+
+        Args:
+            tag_ids: List of tag IDs to filter by
+
+        Yields:
+            Row: Row with name, description and parameters
+        """
+        result = await self.db.stream(self._mcp_tools_query(tag_ids))
+        async for row in result:
+            yield row
+
+    async def get_mcp_tools_json(self) -> bytes:
+        """
+        Get all enabled tools for MCP as a rendered JSON array.
+
+        The bytes are cached until a tool changes, so repeated polling skips
+        both the query and serialization.
+
+        Returns:
+            bytes: JSON array of objects with name, description and parameters
+        """
+        global _mcp_tools_json_cache
+
+        version = _mcp_tools_version
+        if _mcp_tools_json_cache and _mcp_tools_json_cache[0] == version:
+            return _mcp_tools_json_cache[1]
+
+        tools = await self.list_mcp_tools()
+        rendered = orjson.dumps(
+            [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": loads_cached(tool.parameters),
+                }
+                for tool in tools
+            ]
+        )
+        _mcp_tools_json_cache = (version, rendered)
+        return rendered
 
     def _load_function_code(self, file_path: str) -> str:
         """
@@ -221,10 +406,9 @@ class ToolService:
             )
 
         # Add easy_http_call to func_ids if not already included
-        if tool_data.func_ids is None:
-            tool_data.func_ids = []
-        if http_func.id not in tool_data.func_ids:
-            tool_data.func_ids.append(http_func.id)
+        func_ids = tool_data.func_ids or ()
+        if http_func.id not in func_ids:
+            tool_data.func_ids = (*func_ids, http_func.id)
 
     async def _ensure_database_func(
         self, tool_data: ToolCreate, current_user: Optional[str] = None
@@ -273,10 +457,9 @@ class ToolService:
             )
 
         # Add easy_database_call to func_ids if not already included
-        if tool_data.func_ids is None:
-            tool_data.func_ids = []
-        if database_func.id not in tool_data.func_ids:
-            tool_data.func_ids.append(database_func.id)
+        func_ids = tool_data.func_ids or ()
+        if database_func.id not in func_ids:
+            tool_data.func_ids = (*func_ids, database_func.id)
 
     @audit(operation_type="create", object_type="tool")
     async def create_tool(
@@ -327,6 +510,7 @@ class ToolService:
 
         self.db.add(tool)
         await self.db.commit()
+        invalidate_mcp_tools_cache()
         await self.db.refresh(tool)
 
         # Add function associations
@@ -444,6 +628,7 @@ class ToolService:
                 self.db.add(tool_config)
 
         await self.db.commit()
+        invalidate_mcp_tools_cache()
         await self.db.refresh(tool)
 
         return tool
@@ -454,14 +639,19 @@ class ToolService:
         tool_id: int,
         description: Optional[str] = None,
         current_user: Optional[str] = None,
+        tool: Optional[TbTool] = None,
     ) -> TbToolDeploy:
         """
         Deploy tool.
 
+        The tool's ``current_version`` is updated in place, so callers that
+        pass in the tool they already hold don't need to reload it.
+
         Args:
             tool_id: Tool ID
             description: Deployment description
             current_user: Current username
+            tool: Already loaded tool, skips the lookup by ID
 
         Returns:
             TbToolDeploy: Tool deployment
@@ -470,7 +660,8 @@ class ToolService:
             ToolNotFoundError: If tool not found
         """
         # Get tool
-        tool = await self.get_tool_by_id(tool_id)
+        if tool is None:
+            tool = await self.get_tool_by_id(tool_id)
         if not tool:
             logger.error(f"Tool not found for deploy operation: {tool_id}")
             raise ToolNotFoundError(tool_id=tool_id)
@@ -507,18 +698,28 @@ class ToolService:
         return deploy
 
     async def get_tool_deploy_history(
-        self, tool_id: int, page: int = 1, size: int = 20
-    ) -> Tuple[List[TbToolDeploy], int]:
+        self,
+        tool_id: int,
+        page: int = 1,
+        size: int = 20,
+        cursor: Optional[int] = None,
+    ) -> Tuple[List[TbToolDeploy], int, bool]:
         """
         Get tool deployment history.
 
+        Deployments are ordered by version descending. When a cursor is
+        given, the page starts after that version (keyset pagination) and
+        page is ignored.
+
         Args:
             tool_id: Tool ID
             page: Page number (1-based)
             size: Page size
+            cursor: Version of the last deployment of the previous page
 
         Returns:
-            Tuple[List[TbToolDeploy], int]: List of deployments and total count
+            Tuple[List[TbToolDeploy], int, bool]: List of deployments, total
+                count and whether more deployments follow
 
         Raises:
             ToolNotFoundError: If tool not found
@@ -532,24 +733,25 @@ class ToolService:
         # Query deployments
         query = select(TbToolDeploy).where(TbToolDeploy.tool_id == tool_id)
 
-        # Count total
+        # Count total in the database instead of loading every ID
         count_result = await self.db.execute(
-            select(TbToolDeploy.id).where(TbToolDeploy.tool_id == tool_id)
+            select(func.count(TbToolDeploy.id)).where(TbToolDeploy.tool_id == tool_id)
         )
-        total = len(count_result.scalars().all())
+        total = count_result.scalar()
 
-        # Apply pagination and ordering
-        query = (
-            query.order_by(desc(TbToolDeploy.version))
-            .offset((page - 1) * size)
-            .limit(size)
-        )
+        # Apply pagination and ordering; one extra row tells whether more follow
+        query = query.order_by(desc(TbToolDeploy.version)).limit(size + 1)
+        if cursor is not None:
+            query = query.where(TbToolDeploy.version < cursor)
+        else:
+            query = query.offset((page - 1) * size)
 
         # Execute query
         result = await self.db.execute(query)
-        deploys = result.scalars().all()
+        deploys = list(result.scalars().all())
 
-        return list(deploys), total
+        has_next = len(deploys) > size
+        return deploys[:size], total, has_next
 
     @audit(operation_type="rollback", object_type="tool")
     async def rollback_tool(
@@ -597,6 +799,7 @@ class ToolService:
         tool.updated_by = current_user
 
         await self.db.commit()
+        invalidate_mcp_tools_cache()
         await self.db.refresh(tool)
 
         return tool
@@ -640,6 +843,7 @@ class ToolService:
             tool.updated_by = current_user
 
             await self.db.commit()
+            invalidate_mcp_tools_cache()
             await self.db.refresh(tool)
 
             logger.info(
@@ -693,6 +897,7 @@ class ToolService:
         # Delete tool
         await self.db.delete(tool)
         await self.db.commit()
+        invalidate_mcp_tools_cache()
 
         return tool
 
@@ -709,12 +914,6 @@ class ToolService:
         Raises:
             ToolNotFoundError: If tool not found
         """
-        # Check if tool exists
-        tool = await self.get_tool_by_id(tool_id)
-        if not tool:
-            logger.error(f"Tool not found for function list query: {tool_id}")
-            raise ToolNotFoundError(tool_id=tool_id)
-
         # Get functions used by this tool
         result = await self.db.execute(
             select(TbFunc)
@@ -723,6 +922,11 @@ class ToolService:
         )
         funcs = result.scalars().all()
 
+        # Only an empty result needs the extra existence check
+        if not funcs and not await self._tool_exists(tool_id):
+            logger.error(f"Tool not found for function list query: {tool_id}")
+            raise ToolNotFoundError(tool_id=tool_id)
+
         return funcs
 
     async def get_tool_configs(self, tool_id: int) -> List[TbConfig]:
@@ -738,12 +942,6 @@ class ToolService:
         Raises:
             ToolNotFoundError: If tool not found
         """
-        # Check if tool exists
-        tool = await self.get_tool_by_id(tool_id)
-        if not tool:
-            logger.error(f"Tool not found for config list query: {tool_id}")
-            raise ToolNotFoundError(tool_id=tool_id)
-
         # Get configurations used by this tool
         result = await self.db.execute(
             select(TbConfig)
@@ -752,6 +950,11 @@ class ToolService:
         )
         configs = result.scalars().all()
 
+        # Only an empty result needs the extra existence check
+        if not configs and not await self._tool_exists(tool_id):
+            logger.error(f"Tool not found for config list query: {tool_id}")
+            raise ToolNotFoundError(tool_id=tool_id)
+
         return configs
 
     async def execute_tool(
@@ -841,28 +1044,29 @@ class ToolService:
 
             if tool.type == "database" and setting:
                 sql_content = setting["sql"]
-                mapper = MyBatisXml(sql_content)
+                scheme = urlparse(setting["url"]).scheme.lower()
+                mapper = MyBatisXml(
+                    sql_content, backslash_escapes=scheme in BACKSLASH_ESCAPE_SCHEMES
+                )
                 sql = mapper.get_sql(parameters)
                 namespace["url"] = setting["url"]
                 namespace["username"] = setting["username"]
                 namespace["password"] = setting["password"]
                 namespace["sql"] = sql
 
-            # Execute the module code directly
-            output_buffer = io.StringIO()
+            # Execute the module code on a worker thread
+            loop = asyncio.get_running_loop()
 
             try:
-                with redirect_stdout(output_buffer), redirect_stderr(output_buffer):
-                    exec(combined_code, namespace)
+                output = await loop.run_in_executor(
+                    _tool_executor, exec_captured, combined_code, namespace
+                )
             except Exception as e:
                 error_message = (
                     f"Error executing tool: {str(e)}\n{traceback.format_exc()}"
                 )
                 raise ToolExecutionError(tool_id=tool_id, error_message=error_message)
 
-            # Get the output
-            output = output_buffer.getvalue()
-
             # Process the output into logs
             if output:
                 # Split the output into lines and add to logs
@@ -909,6 +1113,26 @@ class ToolService:
         """
         List all builtin tools from the sample directory.
 
+        The catalog only changes when the application is redeployed, so it is
+        cached in process for BUILTIN_TOOLS_CACHE_TTL seconds.
+
+        Returns:
+            BuiltinToolListResponse: List of builtin tools
+        """
+        global _builtin_tools_cache
+
+        now = time.monotonic()
+        if _builtin_tools_cache and _builtin_tools_cache[0] > now:
+            return _builtin_tools_cache[1]
+
+        response = self._load_builtin_tools()
+        _builtin_tools_cache = (now + BUILTIN_TOOLS_CACHE_TTL, response)
+        return response
+
+    def _load_builtin_tools(self) -> BuiltinToolListResponse:
+        """
+        Read builtin tool manifests from the sample directory.
+
         Returns:
             BuiltinToolListResponse: List of builtin tools
         """
@@ -1067,10 +1291,7 @@ class ToolService:
                 await self.db.commit()
 
             # Deploy tool
-            await self.deploy_tool(tool.id, "Initial import", current_user)
-
-            # Refresh tool
-            await self.db.refresh(tool)
+            await self.deploy_tool(tool.id, "Initial import", current_user, tool=tool)
 
             return tool
 
@@ -1090,13 +1311,59 @@ class ToolService:
         Returns:
             List[TbTag]: List of tags associated with the tool
         """
+        tags_by_tool = await self.get_tools_tags([tool_id])
+        return tags_by_tool.get(tool_id, [])
+
+    async def get_tools_tags(self, tool_ids: List[int]) -> Dict[int, List[TbTag]]:
+        """
+        Get tags associated with several tools in a single query.
+
+        Args:
+            tool_ids: Tool IDs
+
+        Returns:
+            Dict[int, List[TbTag]]: Tags ordered by name, keyed by tool ID
+        """
+        tags_by_tool: Dict[int, List[TbTag]] = {tool_id: [] for tool_id in tool_ids}
+        if not tool_ids:
+            return tags_by_tool
+
+        result = await self.db.execute(
+            select(TbToolTag.tool_id, TbTag)
+            .join(TbTag, TbTag.id == TbToolTag.tag_id)
+            .where(TbToolTag.tool_id.in_(tool_ids))
+            .order_by(TbTag.name)
+        )
+        for tool_id, tag in result.all():
+            tags_by_tool[tool_id].append(tag)
+
+        return tags_by_tool
+
+    async def get_tool_with_tags(
+        self, tool_id: int
+    ) -> Tuple[Optional[TbTool], List[TbTag]]:
+        """
+        Get a tool and its tags in a single query.
+
+        Args:
+            tool_id: Tool ID
+
+        Returns:
+            Tuple[Optional[TbTool], List[TbTag]]: Tool (None if not found) and
+                its tags ordered by name
+        """
         result = await self.db.execute(
-            select(TbTag)
-            .join(TbToolTag, TbTag.id == TbToolTag.tag_id)
-            .where(TbToolTag.tool_id == tool_id)
+            select(TbTool, TbTag)
+            .outerjoin(TbToolTag, TbToolTag.tool_id == TbTool.id)
+            .outerjoin(TbTag, TbTag.id == TbToolTag.tag_id)
+            .where(TbTool.id == tool_id)
             .order_by(TbTag.name)
         )
-        return list(result.scalars().all())
+        rows = result.all()
+        if not rows:
+            return None, []
+
+        return rows[0][0], [tag for _, tag in rows if tag is not None]
 
     async def set_tool_tags(
         self, tool_id: int, tag_ids: List[int], current_user: str
@@ -1104,6 +1371,10 @@ class ToolService:
         """
         Set tags for a tool (replace all existing tags).
 
+        Only the difference from the current tags is written: removed tags are
+        deleted and new ones inserted, and nothing is written if the set of
+        tags is unchanged.
+
         Args:
             tool_id: Tool ID
             tag_ids: List of tag IDs to set
@@ -1113,30 +1384,45 @@ class ToolService:
             ToolNotFoundError: If tool not found
         """
         # Check if tool exists
-        tool = await self.get_tool_by_id(tool_id)
-        if not tool:
+        if not await self._tool_exists(tool_id):
             raise ToolNotFoundError(tool_id=tool_id)
 
-        # Remove all existing tag associations
-        await self.db.execute(
-            TbToolTag.__table__.delete().where(TbToolTag.tool_id == tool_id)
+        result = await self.db.execute(
+            select(TbToolTag.tag_id).where(TbToolTag.tool_id == tool_id)
         )
+        existing = set(result.scalars().all())
+        wanted = set(tag_ids)
+        to_remove = existing - wanted
+        to_add = wanted - existing
 
-        # Commit the deletion first
-        await self.db.commit()
+        if not to_remove and not to_add:
+            return
 
-        # Add new tag associations
-        current_time = get_current_unix_ms()
-        for tag_id in tag_ids:
-            tool_tag = TbToolTag(
-                tool_id=tool_id,
-                tag_id=tag_id,
-                created_at=current_time,
-                created_by=current_user,
+        # Remove tags that are no longer wanted
+        if to_remove:
+            await self.db.execute(
+                TbToolTag.__table__.delete().where(
+                    TbToolTag.tool_id == tool_id, TbToolTag.tag_id.in_(to_remove)
+                )
+            )
+
+        # Add new tag associations in one statement
+        if to_add:
+            current_time = get_current_unix_ms()
+            await self.db.execute(
+                TbToolTag.__table__.insert().values(
+                    [
+                        {
+                            "tool_id": tool_id,
+                            "tag_id": tag_id,
+                            "created_at": current_time,
+                            "created_by": current_user,
+                        }
+                        for tag_id in sorted(to_add)
+                    ]
+                )
             )
-            self.db.add(tool_tag)
 
-        # Commit the additions
         await self.db.commit()
 
         logger.info(f"Set tags {tag_ids} for tool {tool_id} by {current_user}")
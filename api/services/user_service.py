@@ -3,22 +3,91 @@ User service.
 """
 
 import logging
-from typing import List, Optional, Tuple
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 from sqlalchemy import or_, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 from sqlalchemy.future import select
 
 from api.errors.user_error import UserAlreadyExistsError, UserNotFoundError
 from api.models.tb_user import TbUser
 from api.schemas.user_schema import UserCreate, UserUpdate
 from api.utils.audit_util import audit
-from api.utils.security_util import get_password_hash
+from api.utils.security_util import (
+    get_password_hash,
+    invalidate_current_user_cache,
+)
 from api.utils.time_util import get_current_unix_ms
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Rendered user reads (list pages and single users), cleared on every change
+USER_READ_CACHE_TTL = 60
+USER_READ_CACHE_SIZE = 256
+_user_read_cache: Dict[Hashable, Tuple[float, Any]] = {}
+# Bumped on every invalidation, see set_cached_user_read
+_user_read_cache_version = 0
+
+
+def get_cached_user_read(key: Hashable) -> Optional[Any]:
+    """
+    Get a cached user read result.
+
+    Args:
+        key: Cache key built by the caller from the read parameters
+
+    Returns:
+        Any: Cached value, or None if missing or expired
+    """
+    cached = _user_read_cache.get(key)
+    if cached is None or time.monotonic() - cached[0] >= USER_READ_CACHE_TTL:
+        return None
+    return cached[1]
+
+
+def get_user_read_cache_version() -> int:
+    """
+    Get the current user read cache version.
+
+    Read it before loading a result that will be passed to
+    set_cached_user_read.
+
+    Returns:
+        int: Cache version
+    """
+    return _user_read_cache_version
+
+
+def set_cached_user_read(key: Hashable, value: Any, version: int) -> None:
+    """
+    Cache a user read result.
+
+    The result is dropped if the cache was invalidated since version was
+    read, since it may have been loaded before the change.
+
+    Args:
+        key: Cache key built by the caller from the read parameters
+        value: Value to cache, must not be mutated afterwards
+        version: Cache version read before the result was loaded
+    """
+    if version != _user_read_cache_version:
+        return
+    if len(_user_read_cache) >= USER_READ_CACHE_SIZE:
+        _user_read_cache.clear()
+    _user_read_cache[key] = (time.monotonic(), value)
+
+
+def invalidate_user_read_cache() -> None:
+    """
+    Drop all cached user reads.
+    """
+    global _user_read_cache_version
+    _user_read_cache_version += 1
+    _user_read_cache.clear()
+
 
 class UserService:
     """
@@ -74,30 +143,31 @@ class UserService:
             search: Search term for username or email (optional)
 
         Returns:
-            Tuple[List[TbUser], int]: List of users and total count
+            Tuple[List[TbUser], int]: List of users and total count. Only the
+            columns shown in user listings are loaded; the password hash is not.
         """
-        query = select(TbUser)
-
-        # Apply filters
-        if search:
-            query = query.where(
-                or_(
-                    TbUser.username.ilike(f"%{search}%"),
-                    TbUser.email.ilike(f"%{search}%"),
-                )
+        # Listings never show the password hash, so it is not selected
+        query = select(TbUser).options(
+            load_only(
+                TbUser.id,
+                TbUser.username,
+                TbUser.email,
+                TbUser.created_at,
+                TbUser.updated_at,
             )
+        )
 
         # Count total
         count_query = select(func.count(TbUser.id))
 
-        # Apply the same filters to count query
+        # Apply the same filters to both queries
         if search:
-            count_query = count_query.where(
-                or_(
-                    TbUser.username.ilike(f"%{search}%"),
-                    TbUser.email.ilike(f"%{search}%"),
-                )
+            condition = or_(
+                TbUser.username.ilike(f"%{search}%"),
+                TbUser.email.ilike(f"%{search}%"),
             )
+            query = query.where(condition)
+            count_query = count_query.where(condition)
 
         count_result = await self.db.execute(count_query)
         total = count_result.scalar()
@@ -151,6 +221,7 @@ class UserService:
         self.db.add(user)
         await self.db.commit()
         await self.db.refresh(user)
+        invalidate_user_read_cache()
 
         return user
 
@@ -190,6 +261,8 @@ class UserService:
 
         await self.db.commit()
         await self.db.refresh(user)
+        invalidate_current_user_cache(user.username)
+        invalidate_user_read_cache()
 
         return user
 
@@ -219,5 +292,7 @@ class UserService:
         # Delete user
         await self.db.delete(user)
         await self.db.commit()
+        invalidate_current_user_cache(user.username)
+        invalidate_user_read_cache()
 
         return user
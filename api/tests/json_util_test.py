@@ -0,0 +1,112 @@
+"""
+Test cases for reading stored JSON text columns.
+"""
+
+import math
+import unittest
+from types import SimpleNamespace
+from typing import List
+
+import orjson
+from pydantic import TypeAdapter
+
+from api.schemas.config_schema import ConfigResponse
+from api.utils.json_util import dump_rows_json, parse_json_text
+from api.utils.response_util import validate_rows
+
+_CONFIGS_ADAPTER = TypeAdapter(List[ConfigResponse])
+
+
+def _config_row(config_id: int, conf_schema: str, conf_value: str) -> SimpleNamespace:
+    """Build an object shaped like a TbConfig row."""
+    return SimpleNamespace(
+        id=config_id,
+        name=f"config{config_id}",
+        description=None,
+        conf_schema=conf_schema,
+        conf_value=conf_value,
+        created_at=1,
+        updated_at=1,
+        created_by="admin",
+        updated_by="admin",
+    )
+
+
+class ParseJsonTextTest(unittest.TestCase):
+    """Test cases for parse_json_text."""
+
+    def test_valid_text(self):
+        """Test valid JSON text is parsed."""
+        self.assertEqual(parse_json_text('{"a": [1, 2]}'), {"a": [1, 2]})
+        self.assertEqual(parse_json_text(b'{"a": 1}'), {"a": 1})
+
+    def test_non_finite_floats(self):
+        """Test NaN and Infinity written by json.dumps are parsed."""
+        value = parse_json_text('{"a": NaN, "b": Infinity, "c": -Infinity}')
+        self.assertTrue(math.isnan(value["a"]))
+        self.assertEqual(value["b"], math.inf)
+        self.assertEqual(value["c"], -math.inf)
+
+    def test_invalid_text(self):
+        """Test invalid and empty text is read as an empty object."""
+        self.assertEqual(parse_json_text("{not json"), {})
+        self.assertEqual(parse_json_text(""), {})
+        self.assertEqual(parse_json_text(b"\xff"), {})
+
+    def test_non_text_values(self):
+        """Test values that are not text are returned as-is."""
+        self.assertIsNone(parse_json_text(None))
+        self.assertEqual(parse_json_text({"a": 1}), {"a": 1})
+
+
+class ValidateRowsTest(unittest.TestCase):
+    """Test cases for validate_rows on JSON text columns."""
+
+    def test_valid_rows(self):
+        """Test rows with valid JSON columns are validated."""
+        rows = [_config_row(1, '{"type": "object"}', '{"k": 1}')]
+        configs = validate_rows(_CONFIGS_ADAPTER, ConfigResponse, rows)
+        self.assertEqual(configs[0].conf_schema, {"type": "object"})
+        self.assertEqual(configs[0].conf_value, {"k": 1})
+
+    def test_non_finite_floats(self):
+        """Test NaN in a JSON column does not fail the page."""
+        rows = [_config_row(1, '{"default": NaN}', "{}")]
+        configs = validate_rows(_CONFIGS_ADAPTER, ConfigResponse, rows)
+        self.assertTrue(math.isnan(configs[0].conf_schema["default"]))
+
+    def test_invalid_row(self):
+        """Test one invalid JSON column does not fail the other rows."""
+        rows = [
+            _config_row(1, '{"type": "object"}', '{"k": 1}'),
+            _config_row(2, "{not json", ""),
+        ]
+        configs = validate_rows(_CONFIGS_ADAPTER, ConfigResponse, rows)
+        self.assertEqual(configs[0].conf_value, {"k": 1})
+        self.assertEqual(configs[1].conf_schema, {})
+        self.assertEqual(configs[1].conf_value, {})
+
+
+class DumpRowsJsonTest(unittest.TestCase):
+    """Test cases for dump_rows_json on JSON text columns."""
+
+    def test_output_is_strict_json(self):
+        """Test NaN and invalid text still give a strict JSON document."""
+        rows = [
+            SimpleNamespace(id=1, data='{"x": NaN}'),
+            SimpleNamespace(id=2, data="{not json"),
+            SimpleNamespace(id=3, data='{"y": 1}'),
+        ]
+        rendered = orjson.loads(dump_rows_json(rows, ("id", "data"), ("data",)))
+        self.assertEqual(
+            rendered,
+            [
+                {"id": 1, "data": {"x": None}},
+                {"id": 2, "data": {}},
+                {"id": 3, "data": {"y": 1}},
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -184,6 +184,43 @@ class MyBatisXmlTest(unittest.TestCase):
         )
         self.assertEqual(sql, expected)
 
+    def test_string_parameter_quotes_escaped(self):
+        """Test single quotes in string parameters are escaped."""
+        sql_content = """
+        SELECT id FROM users WHERE username = #{username}
+        """
+        mapper = MyBatisXml(sql_content)
+        sql = mapper.get_sql({"username": "x' OR '1'='1"})
+        expected = "SELECT id FROM users WHERE username = 'x'' OR ''1''=''1'"
+        self.assertEqual(sql, expected)
+
+    def test_string_parameter_backslashes_escaped(self):
+        """Test backslashes are escaped for databases that treat them as escapes."""
+        sql_content = """
+        SELECT id FROM users WHERE username = #{username}
+        """
+        value = "x\\' OR 1=1 -- \\"
+        sql = MyBatisXml(sql_content).get_sql({"username": value})
+        self.assertEqual(sql, "SELECT id FROM users WHERE username = 'x\\'' OR 1=1 -- \\'")
+        sql = MyBatisXml(sql_content, backslash_escapes=True).get_sql(
+            {"username": value}
+        )
+        expected = "SELECT id FROM users WHERE username = 'x\\\\'' OR 1=1 -- \\\\'"
+        self.assertEqual(sql, expected)
+
+    def test_in_clause_string_parameter(self):
+        """Test a comma-separated string in an IN clause is split and escaped."""
+        sql_content = """
+        SELECT id FROM users WHERE id IN (#{ids})
+        """
+        mapper = MyBatisXml(sql_content)
+        sql = mapper.get_sql({"ids": "1,2,3"})
+        self.assertEqual(sql, "SELECT id FROM users WHERE id IN (1,2,3)")
+        sql = mapper.get_sql({"ids": "'a', b"})
+        self.assertEqual(sql, "SELECT id FROM users WHERE id IN ('a','b')")
+        sql = mapper.get_sql({"ids": "1) OR (1=1"})
+        self.assertEqual(sql, "SELECT id FROM users WHERE id IN ('1) OR (1=1')")
+
 
 if __name__ == "__main__":
     unittest.main()
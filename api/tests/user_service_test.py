@@ -0,0 +1,73 @@
+"""
+Test cases for UserService queries.
+"""
+
+import unittest
+from typing import List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from api.models.tb_user import TbUser
+from api.services.user_service import UserService
+
+
+class QueryUsersTest(unittest.IsolatedAsyncioTestCase):
+    """Test cases for UserService.query_users."""
+
+    async def asyncSetUp(self):
+        """Create an in-memory database with a few users."""
+        self.engine = create_async_engine("sqlite+aiosqlite://")
+        async with self.engine.begin() as conn:
+            await conn.run_sync(TbUser.__table__.create)
+        async with AsyncSession(self.engine) as session:
+            for i in range(1, 4):
+                session.add(
+                    TbUser(
+                        id=i,
+                        username=f"user{i}",
+                        password="hashed",
+                        email=f"user{i}@example.com",
+                        created_at=1,
+                        updated_at=1,
+                    )
+                )
+            await session.commit()
+
+        self.statements: List[str] = []
+        event.listen(self.engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    async def asyncTearDown(self):
+        """Dispose of the database."""
+        await self.engine.dispose()
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        """Record every statement sent to the database."""
+        self.statements.append(statement)
+
+    async def _query_users(self, **kwargs):
+        """Run query_users in a fresh session."""
+        async with AsyncSession(self.engine, expire_on_commit=False) as session:
+            return await UserService(session).query_users(**kwargs)
+
+    async def test_two_statements_without_password(self):
+        """Test a page is a count and a select that skips the password."""
+        users, total = await self._query_users(page=1, size=20)
+        self.assertEqual(total, 3)
+        self.assertEqual([user.username for user in users], ["user1", "user2", "user3"])
+        self.assertEqual(len(self.statements), 2)
+        for statement in self.statements:
+            self.assertNotIn("password", statement)
+
+    async def test_search_two_statements_without_password(self):
+        """Test a filtered page also takes a count and a select."""
+        users, total = await self._query_users(page=1, size=20, search="user2")
+        self.assertEqual(total, 1)
+        self.assertEqual([user.username for user in users], ["user2"])
+        self.assertEqual(len(self.statements), 2)
+        for statement in self.statements:
+            self.assertNotIn("password", statement)
+
+
+if __name__ == "__main__":
+    unittest.main()
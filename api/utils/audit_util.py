@@ -2,12 +2,13 @@
 Audit utility functions.
 """
 
+import asyncio
 import functools
 import inspect
 import json
 import logging
 from datetime import datetime
-from typing import Optional, Any, Callable, TypeVar, Awaitable, cast, Dict
+from typing import Optional, Any, Callable, TypeVar, Awaitable, cast, Dict, List
 
 from fastapi import Request
 
@@ -20,6 +21,16 @@ logger = logging.getLogger(__name__)
 # Type variables for function signatures
 F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
 
+# Audit rows per INSERT, and how long a batch waits to fill up (seconds)
+AUDIT_BATCH_SIZE = 100
+AUDIT_MAX_WAIT = 0.05
+
+# Queued rows at which audited calls wait for the writer to catch up
+AUDIT_QUEUE_SIZE = 1000
+
+# Rows waiting for run_audit_writer, None while no writer runs
+_audit_queue: Optional[asyncio.Queue] = None
+
 
 def _json_serializable(obj: Any) -> Any:
     """将对象转换为可 JSON 序列化的形式
@@ -73,8 +84,71 @@ def _extract_resource_info(obj: Any) -> tuple[Optional[int], Optional[str]]:
     return resource_id, resource_name
 
 
+async def _write_audit_rows(rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert a batch of audit rows in one statement and one commit.
+
+    Args:
+        rows: Column values of the audit rows
+    """
+    from api.database import get_session
+    from api.services.audit_service import AuditService
+
+    try:
+        async with get_session() as db_session:
+            await AuditService(db_session).record_many(rows)
+    except Exception as e:
+        logger.error(f"Error writing {len(rows)} audit logs: {str(e)}")
+
+
+async def run_audit_writer(
+    batch_size: int = AUDIT_BATCH_SIZE, max_wait: float = AUDIT_MAX_WAIT
+) -> None:
+    """
+    Write queued audit rows in batches until cancelled.
+
+    While it runs, _create_audit_log only queues rows. A batch is written
+    once batch_size rows are waiting or max_wait seconds after its first
+    row, whichever comes first. Rows still queued when the writer is
+    cancelled are written before it exits.
+
+    Args:
+        batch_size: Maximum number of rows per INSERT
+        max_wait: Seconds to wait for more rows before writing a batch
+    """
+    global _audit_queue
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=AUDIT_QUEUE_SIZE)
+    _audit_queue = queue
+    rows: List[Dict[str, Any]] = []
+    writing: Optional[asyncio.Future] = None
+    try:
+        while True:
+            rows.append(await queue.get())
+            # A timed-out Queue.get never takes the item it was waiting for
+            try:
+                async with asyncio.timeout_at(loop.time() + max_wait):
+                    while len(rows) < batch_size:
+                        rows.append(await queue.get())
+            except TimeoutError:
+                pass
+            # The batch leaves rows before it is written, and the write is
+            # shielded, so a cancellation neither repeats nor drops it
+            batch, rows = rows, []
+            writing = asyncio.ensure_future(_write_audit_rows(batch))
+            await asyncio.shield(writing)
+    finally:
+        _audit_queue = None
+        if writing is not None and not writing.done():
+            await writing
+        while not queue.empty():
+            rows.append(queue.get_nowait())
+        if rows:
+            await _write_audit_rows(rows)
+
+
 async def _create_audit_log(
-    db_session: Any,
+    db_session: Optional[Any],
     username: str,
     action: str,
     resource_type: str,
@@ -85,8 +159,10 @@ async def _create_audit_log(
 ) -> None:
     """创建并保存审计日志
 
+    审计写入任务运行时只入队，由 run_audit_writer 批量写入；否则直接写入。
+
     Args:
-        db_session: 数据库会话
+        db_session: 数据库会话，为 None 时使用新会话
         username: 用户名
         action: 操作类型
         resource_type: 资源类型
@@ -95,19 +171,27 @@ async def _create_audit_log(
         details: 详细信息
         ip_address: IP地址
     """
-    audit_log = TbAudit(
-        username=username,
-        action=action,
-        resource_type=resource_type,
-        resource_id=resource_id,
-        resource_name=resource_name,
-        details=json.dumps(details, default=str),
-        ip_address=ip_address,
-        created_at=get_current_unix_ms(),
-    )
+    row = {
+        "username": username,
+        "action": action,
+        "resource_type": resource_type,
+        "resource_id": resource_id,
+        "resource_name": resource_name,
+        "details": json.dumps(details, default=str),
+        "ip_address": ip_address,
+        "created_at": get_current_unix_ms(),
+    }
+
+    if _audit_queue is not None:
+        await _audit_queue.put(row)
+        return
+
+    if db_session is None:
+        await _write_audit_rows([row])
+        return
 
     try:
-        db_session.add(audit_log)
+        db_session.add(TbAudit(**row))
         await db_session.commit()
     except Exception as e:
         logger.error(f"Error creating audit log: {str(e)}")
@@ -177,106 +261,86 @@ def audit(operation_type: str, object_type: str) -> Callable[[F], F]:
                             f"Could not convert {param_name} to serializable format: {str(e)}"
                         )
 
-            audit_db = None
-
             try:
-                # 获取数据库连接
-                from api.database import get_db
-
-                try:
-                    db_gen = get_db()
-                    audit_db = await anext(db_gen)
-                except Exception as db_error:
-                    logger.error(
-                        f"Error creating database connection for audit: {str(db_error)}"
-                    )
-
                 # 执行原始函数
                 result = await func(*args, **kwargs)
 
-                # 如果有数据库连接，创建审计日志
-                if audit_db is not None:
-                    # 从结果中补充资源信息
-                    if result is not None:
-                        if resource_id is None or resource_name is None:
-                            if isinstance(result, list) and result:
-                                # 如果结果是列表，使用第一个元素
-                                res_id, res_name = _extract_resource_info(result[0])
-                            else:
-                                # 否则直接使用结果对象
-                                res_id, res_name = _extract_resource_info(result)
-
-                            if resource_id is None:
-                                resource_id = res_id
-                            if resource_name is None:
-                                resource_name = res_name
-
-                    # 如果有资源ID但没有资源名称，使用默认格式
-                    if resource_id is not None and resource_name is None:
-                        resource_name = f"{object_type}_{resource_id}"
-
-                    # 准备详细信息
-                    details = data_params.copy()  # 使用保存的 *_data 参数作为详细信息
-
-                    # 如果没有 *_data 参数或是创建操作，添加结果信息
-                    if not details or operation_type == "create" and result is not None:
-                        if hasattr(result, "id"):
-                            details["result_id"] = result.id
-                        if hasattr(result, "name"):
-                            details["result_name"] = result.name
-
-                    # 标记请求已处理
-                    if request is not None:
-                        request.state.audited = True
-
-                    # 创建审计日志
-                    await _create_audit_log(
-                        audit_db,
-                        current_user or "system",
-                        operation_type,
-                        object_type,
-                        resource_id,
-                        resource_name,
-                        details,
-                        request.client.host if request else None,
-                    )
+                # 从结果中补充资源信息
+                if result is not None:
+                    if resource_id is None or resource_name is None:
+                        if isinstance(result, list) and result:
+                            # 如果结果是列表，使用第一个元素
+                            res_id, res_name = _extract_resource_info(result[0])
+                        else:
+                            # 否则直接使用结果对象
+                            res_id, res_name = _extract_resource_info(result)
+
+                        if resource_id is None:
+                            resource_id = res_id
+                        if resource_name is None:
+                            resource_name = res_name
+
+                # 如果有资源ID但没有资源名称，使用默认格式
+                if resource_id is not None and resource_name is None:
+                    resource_name = f"{object_type}_{resource_id}"
+
+                # 准备详细信息
+                details = data_params.copy()  # 使用保存的 *_data 参数作为详细信息
+
+                # 如果没有 *_data 参数或是创建操作，添加结果信息
+                if not details or operation_type == "create" and result is not None:
+                    if hasattr(result, "id"):
+                        details["result_id"] = result.id
+                    if hasattr(result, "name"):
+                        details["result_name"] = result.name
+
+                # 标记请求已处理
+                if request is not None:
+                    request.state.audited = True
+
+                # 创建审计日志
+                await _create_audit_log(
+                    None,
+                    current_user or "system",
+                    operation_type,
+                    object_type,
+                    resource_id,
+                    resource_name,
+                    details,
+                    request.client.host if request else None,
+                )
 
                 return result
 
             except Exception as e:
                 # 记录错误审计日志
-                if audit_db is not None:
-                    # 确保有资源名称
-                    if resource_id is not None and resource_name is None:
-                        resource_name = f"{object_type}_{resource_id}"
-
-                    # 标记请求已处理
-                    if request is not None:
-                        request.state.audited = True
-
-                    # 准备错误详细信息
-                    error_details = data_params.copy()  # 使用保存的 *_data 参数
-                    error_details["error"] = str(e)  # 添加错误信息
-
-                    # 创建错误审计日志
-                    await _create_audit_log(
-                        audit_db,
-                        current_user or "system",
-                        f"{operation_type}_error",
-                        object_type,
-                        resource_id,
-                        resource_name,
-                        error_details,
-                        request.client.host if request else None,
-                    )
+                # 确保有资源名称
+                if resource_id is not None and resource_name is None:
+                    resource_name = f"{object_type}_{resource_id}"
+
+                # 标记请求已处理
+                if request is not None:
+                    request.state.audited = True
+
+                # 准备错误详细信息
+                error_details = data_params.copy()  # 使用保存的 *_data 参数
+                error_details["error"] = str(e)  # 添加错误信息
+
+                # 创建错误审计日志
+                await _create_audit_log(
+                    None,
+                    current_user or "system",
+                    f"{operation_type}_error",
+                    object_type,
+                    resource_id,
+                    resource_name,
+                    error_details,
+                    request.client.host if request else None,
+                )
 
                 # 重新抛出异常
                 raise
 
-            finally:
-                # 数据库连接会在请求结束时自动关闭
-                pass
-
         return cast(F, wrapper)
 
     return decorator
@@ -0,0 +1,90 @@
+"""
+Code execution utility functions.
+"""
+
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, TextIO
+
+# Per-thread capture buffer used by the stdout/stderr proxies
+_local = threading.local()
+_install_lock = threading.Lock()
+
+
+class _ThreadLocalStream(io.TextIOBase):
+    """
+    Stream proxy that sends writes to the current thread's capture buffer.
+
+    contextlib.redirect_stdout swaps the process-wide sys.stdout, which is
+    only safe while one tool runs at a time. The proxy lets tools running on
+    different worker threads capture their own output, and passes writes from
+    any other thread through to the original stream.
+    """
+
+    def __init__(self, target: TextIO):
+        self._target = target
+
+    def write(self, text: str) -> int:
+        buffer: Optional[io.StringIO] = getattr(_local, "buffer", None)
+        if buffer is not None:
+            return buffer.write(text)
+        return self._target.write(text)
+
+    def flush(self) -> None:
+        if getattr(_local, "buffer", None) is None:
+            self._target.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target, name)
+
+
+def _install_proxies() -> None:
+    """
+    Wrap sys.stdout and sys.stderr with thread-local proxies if not done yet.
+    """
+    with _install_lock:
+        if not isinstance(sys.stdout, _ThreadLocalStream):
+            sys.stdout = _ThreadLocalStream(sys.stdout)
+        if not isinstance(sys.stderr, _ThreadLocalStream):
+            sys.stderr = _ThreadLocalStream(sys.stderr)
+
+
+def exec_captured(code: str, namespace: Dict[str, Any]) -> str:
+    """
+    Execute code and return everything it printed to stdout and stderr.
+
+    Safe to call from several threads at once; each call only captures its
+    own output.
+
+    Args:
+        code: Python source to execute
+        namespace: Globals for the executed code, updated in place
+
+    Returns:
+        str: Captured output
+
+    Raises:
+        Exception: Whatever the executed code raises
+    """
+    _install_proxies()
+    _local.buffer = io.StringIO()
+    try:
+        exec(code, namespace)
+        return _local.buffer.getvalue()
+    finally:
+        _local.buffer = None
+
+
+def create_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Create the worker pool that runs tool code off the event loop.
+
+    Args:
+        max_workers: Maximum number of tools executing at the same time
+
+    Returns:
+        ThreadPoolExecutor: Worker pool
+    """
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tool-exec")
@@ -0,0 +1,45 @@
+"""
+HTTP utility functions.
+"""
+
+import threading
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Optional
+
+import httpx
+
+# Pooled client shared by tool code, created on first use
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Get the HTTP client shared by all tool calls.
+
+    Tool and function code is executed afresh for every call, so a client
+    created there would open new connections each time. This one is created
+    once per process and keeps connections to the same host alive between
+    calls. httpx.Client is thread-safe, so tools running on different
+    executor threads can use it at the same time.
+
+    The client is shared across tools and users, so its cookie jar refuses
+    every cookie. Redirects are followed and requests time out after 30 s;
+    pass timeout or follow_redirects per request to change that.
+
+    Returns:
+        httpx.Client: Shared client
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    timeout=30,
+                    follow_redirects=True,
+                    cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+                    limits=httpx.Limits(
+                        max_connections=100, max_keepalive_connections=20
+                    ),
+                )
+    return _http_client
@@ -0,0 +1,169 @@
+"""
+JSON utility functions.
+"""
+
+import json
+import logging
+import sys
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
+from typing import Any, Collection, Iterable
+
+import orjson
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+# Marks attributes a row does not have in dump_rows_json
+_MISSING = object()
+
+
+@lru_cache(maxsize=1024)
+def loads_cached(text: str) -> Any:
+    """
+    Parse a JSON string, memoizing the result by the string content.
+
+    Intended for JSON columns that are read far more often than they are
+    written, such as tool parameter schemas. The returned object is shared
+    between callers and must be treated as read-only.
+
+    Args:
+        text: JSON string
+
+    Returns:
+        Any: Parsed JSON value, or {} if the string is not valid JSON
+    """
+    return parse_json_text(text)
+
+
+def _loads_stored(text: Any) -> Any:
+    """
+    Parse JSON text written by json.dumps.
+
+    json.dumps writes NaN, Infinity and -Infinity for non-finite floats,
+    which orjson rejects; such text is parsed with json.loads instead.
+
+    Args:
+        text: JSON string or bytes
+
+    Returns:
+        Any: Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
+def _embeddable_json(text: bytes) -> bytes:
+    """
+    Return JSON text that can be spliced into a strict JSON document.
+
+    Text orjson accepts is returned unchanged. Other text, such as NaN or
+    Infinity written by json.dumps in older rows, is read with
+    parse_json_text and encoded again; orjson writes non-finite floats as
+    null.
+
+    Args:
+        text: JSON text
+
+    Returns:
+        bytes: Strict JSON text
+    """
+    try:
+        orjson.loads(text)
+        return text
+    except orjson.JSONDecodeError:
+        return orjson.dumps(parse_json_text(text), option=orjson.OPT_NON_STR_KEYS)
+
+
+def dump_rows_json(
+    rows: Iterable[Any],
+    fields: Iterable[str],
+    raw_json_fields: Collection[str],
+    check_raw: bool = True,
+) -> bytes:
+    """
+    Render ORM rows as a JSON array, embedding JSON text columns verbatim.
+
+    Plain columns are encoded with orjson. Columns listed in raw_json_fields
+    hold JSON text in the database and are spliced in as-is, so they are
+    parsed only once, by whoever decodes the result. Fields the rows do not
+    have are left out.
+
+    The layout is worked out once from the first row: the field names are
+    interned and read from every row with a single attrgetter call.
+
+    Args:
+        rows: ORM objects of the same type
+        fields: Names of the attributes to include
+        raw_json_fields: Names of attributes that contain JSON text
+        check_raw: Check that each JSON text column is strict JSON and
+            re-encode it if not. Callers that decode the result with a
+            parser accepting NaN and Infinity may skip the check.
+
+    Returns:
+        bytes: JSON array with one object per row. With check_raw, it is
+        strict JSON even if some rows hold NaN, Infinity or invalid text.
+    """
+    rows = iter(rows)
+    first = next(rows, _MISSING)
+    if first is _MISSING:
+        return b"[]"
+
+    names = tuple(sys.intern(field) for field in fields if hasattr(first, field))
+    raw_columns = tuple(
+        (index, name, b'"' + name.encode() + b'":')
+        for index, name in enumerate(names)
+        if name in raw_json_fields
+    )
+    if len(names) == 1:
+        single = attrgetter(names[0])
+        getter = lambda row: (single(row),)
+    else:
+        getter = attrgetter(*names) if names else lambda row: ()
+
+    rendered = []
+    for row in chain((first,), rows):
+        values = getter(row)
+        plain = dict(zip(names, values))
+        raw = []
+        for index, name, key in raw_columns:
+            value = values[index]
+            if isinstance(value, (str, bytes)):
+                del plain[name]
+                if isinstance(value, str):
+                    value = value.encode()
+                raw.append(key + (_embeddable_json(value) if check_raw else value))
+        body = orjson.dumps(plain)[1:-1]
+        rendered.append(b"{" + b",".join(([body] if body else []) + raw) + b"}")
+    return b"[" + b",".join(rendered) + b"]"
+
+
+def parse_json_text(value: Any) -> Any:
+    """
+    Parse a JSON text column read from the database.
+
+    Shared by the response schemas' before-validators: strings and bytes are
+    parsed, anything else (already parsed values, None) is returned as-is.
+    Non-finite floats written by json.dumps are accepted. Other invalid text
+    is logged and read as {}, so one bad row does not fail a whole listing.
+
+    Args:
+        value: Column value
+
+    Returns:
+        Any: Parsed value, or {} if the text is not valid JSON
+    """
+    if isinstance(value, (str, bytes)):
+        try:
+            return _loads_stored(value)
+        except ValueError as e:
+            # json.JSONDecodeError, or UnicodeDecodeError for bytes
+            logger.warning(f"Invalid JSON text read as {{}}: {str(e)}")
+            return {}
+    return value
@@ -0,0 +1,212 @@
+"""
+Request parameter utility functions.
+"""
+
+import re
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from fastapi import Query, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+
+from api.errors.base_error import ValidationError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Comma-separated list of positive integer IDs, e.g. "1,2,3"
+ID_LIST_PATTERN = re.compile(r"^\d+(?:,\d+)*$")
+
+# Maximum number of tag IDs accepted in one filter
+MAX_TAG_IDS = 50
+
+# Keyset cursor of an audit log page, "created_at:id"
+AUDIT_CURSOR_PATTERN = re.compile(r"^(\d+):(\d+)$")
+
+# Related data that can be embedded in a tool detail response
+TOOL_INCLUDE_OPTIONS = {"tags", "funcs", "configs"}
+
+
+def parse_id_list(
+    value: Optional[str], name: str, max_items: int
+) -> Optional[List[int]]:
+    """
+    Parse a comma-separated list of IDs.
+
+    Args:
+        value: Raw parameter value (e.g. "1,2,3")
+        name: Parameter name used in error messages
+        max_items: Maximum number of IDs accepted
+
+    Returns:
+        Optional[List[int]]: Parsed IDs, or None if the parameter is empty
+
+    Raises:
+        ValidationError: If the value is malformed or has too many IDs
+    """
+    if value is None:
+        return None
+
+    value = value.replace(" ", "")
+    if not value:
+        return None
+
+    if not ID_LIST_PATTERN.match(value):
+        raise ValidationError(
+            reason=f"Invalid {name}",
+            description=f"{name} must be a comma-separated list of integer IDs",
+        )
+
+    ids = [int(item) for item in value.split(",")]
+    if len(ids) > max_items:
+        raise ValidationError(
+            reason=f"Too many {name}",
+            description=f"{name} accepts at most {max_items} IDs",
+        )
+
+    return ids
+
+
+def parse_tag_ids(
+    tag_ids: Optional[str] = Query(
+        None, description="Comma-separated tag IDs to filter by"
+    ),
+) -> Optional[List[int]]:
+    """
+    Dependency that parses the tag_ids query parameter.
+
+    Args:
+        tag_ids: Comma-separated tag IDs (e.g., "1,2,3")
+
+    Returns:
+        Optional[List[int]]: Parsed tag IDs, or None if no filter is given
+
+    Raises:
+        ValidationError: If tag_ids is malformed or has too many IDs
+    """
+    return parse_id_list(tag_ids, "tag_ids", MAX_TAG_IDS)
+
+
+def parse_audit_cursor(
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous page (overrides page)"
+    ),
+) -> Optional[Tuple[int, int]]:
+    """
+    Dependency that parses the cursor query parameter of the audit list.
+
+    Args:
+        cursor: Cursor from the previous page's next_cursor, "created_at:id"
+
+    Returns:
+        Optional[Tuple[int, int]]: (created_at, id), or None if not given
+
+    Raises:
+        ValidationError: If cursor is malformed
+    """
+    if not cursor:
+        return None
+
+    match = AUDIT_CURSOR_PATTERN.match(cursor)
+    if not match:
+        raise ValidationError(
+            reason="Invalid cursor",
+            description="cursor must be the next_cursor of a previous page",
+        )
+
+    return int(match.group(1)), int(match.group(2))
+
+
+def parse_tool_include(
+    include: Optional[str] = Query(
+        None, description="Comma-separated related data to embed: tags,funcs,configs"
+    ),
+) -> Set[str]:
+    """
+    Dependency that parses the include query parameter of the tool detail.
+
+    Args:
+        include: Comma-separated names (e.g., "funcs,configs")
+
+    Returns:
+        Set[str]: Requested related data, empty if none
+
+    Raises:
+        ValidationError: If include names an unknown option
+    """
+    if not include:
+        return set()
+
+    names = {name.strip() for name in include.split(",") if name.strip()}
+    unknown = names - TOOL_INCLUDE_OPTIONS
+    if unknown:
+        raise ValidationError(
+            reason="Invalid include",
+            description=f"include accepts only: {', '.join(sorted(TOOL_INCLUDE_OPTIONS))}",
+            details={"unknown": sorted(unknown)},
+        )
+
+    return names
+
+
+def json_body(model: Type[ModelT]) -> Callable[[Request], Awaitable[ModelT]]:
+    """
+    Build a dependency that validates the raw JSON request body as a model.
+
+    The bytes are parsed and validated in a single pass by pydantic-core,
+    instead of being decoded to Python objects first and validated after.
+    Declare the body for the docs with json_body_openapi.
+
+    Args:
+        model: Body model
+
+    Returns:
+        Callable[[Request], Awaitable[ModelT]]: Dependency returning the model
+
+    Raises:
+        RequestValidationError: If the body is not valid JSON for the model
+    """
+    adapter = TypeAdapter(model)
+
+    async def parse_body(request: Request) -> ModelT:
+        try:
+            return adapter.validate_json(await request.body())
+        except PydanticValidationError as e:
+            # Report errors the way FastAPI does for a declared body parameter
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", *error["loc"])}
+                    for error in e.errors(include_url=False)
+                ]
+            )
+
+    return parse_body
+
+
+def json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    OpenAPI request body for a route that reads its body with json_body.
+
+    Args:
+        model: Body model without nested models
+
+    Returns:
+        Dict[str, Any]: Value for the route's openapi_extra
+    """
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
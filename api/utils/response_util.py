@@ -0,0 +1,156 @@
+"""
+Response utility functions.
+"""
+
+import hashlib
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from api.schemas.common_schema import PaginatedResponse
+from api.schemas.common_schema import Response as ApiResponse
+from api.utils.json_util import dump_rows_json
+
+
+def paginated_json_response(
+    items: List[Dict[str, Any]],
+    total: int,
+    has_next: Optional[bool] = None,
+    next_cursor: Optional[str] = None,
+) -> ORJSONResponse:
+    """
+    Build a paginated JSON response from already-serializable items.
+
+    Use this for list endpoints whose rows map one-to-one onto the response
+    schema: the items are encoded as-is, skipping per-item model validation
+    and FastAPI's generic response serialization. The endpoint should still
+    declare response_model so the API documentation stays accurate.
+
+    Args:
+        items: Response items as JSON-serializable dictionaries
+        total: Total number of items
+        has_next: Whether another page follows, if known
+        next_cursor: Cursor for the next page (cursor-paginated endpoints only)
+
+    Returns:
+        ORJSONResponse: Response with the standard paginated envelope
+    """
+    envelope = PaginatedResponse(
+        total=total, has_next=has_next, next_cursor=next_cursor
+    ).model_dump()
+    return ORJSONResponse(content={**envelope, "data": items})
+
+
+def raw_json_response(data_json: bytes) -> Response:
+    """
+    Wrap already-rendered JSON in the standard response envelope.
+
+    Only the envelope fields are serialized per request; the data bytes are
+    embedded verbatim, so cached renderings can be served without model
+    validation or re-encoding.
+
+    Args:
+        data_json: JSON-encoded response data
+
+    Returns:
+        Response: application/json response with the standard envelope
+    """
+    envelope = orjson.dumps(ApiResponse().model_dump(exclude={"data"}))
+    content = b'{"data":' + data_json + b"," + envelope[1:]
+    return Response(content=content, media_type="application/json")
+
+
+def raw_paginated_json_response(data_json: bytes, total: int) -> Response:
+    """
+    Wrap an already-rendered JSON array in the paginated response envelope.
+
+    Paginated counterpart of raw_json_response, for list endpoints that
+    render their items with dump_rows_json.
+
+    Args:
+        data_json: JSON-encoded list of items
+        total: Total number of items
+
+    Returns:
+        Response: application/json response with the paginated envelope
+    """
+    envelope = orjson.dumps(PaginatedResponse(total=total).model_dump(exclude={"data"}))
+    content = b'{"data":' + data_json + b"," + envelope[1:]
+    return Response(content=content, media_type="application/json")
+
+
+def compute_etag(*parts: Any) -> str:
+    """
+    Compute a weak ETag from values that change whenever the resource does.
+
+    Args:
+        *parts: Version markers such as IDs, versions and update times
+
+    Returns:
+        str: Weak ETag, e.g. W/"1a2b3c..."
+    """
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def check_etag(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Attach an ETag and short-circuit when the client already has this version.
+
+    Args:
+        request: Current request, read for If-None-Match
+        response: Response the endpoint will return, receives the ETag header
+        etag: ETag of the current representation
+
+    Returns:
+        Optional[Response]: A 304 Not Modified response when If-None-Match
+        matches, otherwise None
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Weak comparison: the W/ prefix is ignored on both sides
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        if "*" in candidates or etag.removeprefix("W/") in candidates:
+            return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return None
+
+
+def validate_rows(
+    adapter: TypeAdapter, model: Type[BaseModel], rows: Sequence[Any]
+) -> List[Any]:
+    """
+    Validate ORM rows into response models in a single JSON pass.
+
+    The rows are rendered to JSON with the model's JSON text columns
+    (``model.json_columns``) embedded verbatim and validated with
+    ``adapter.validate_json``, so those columns are parsed once, in
+    pydantic-core, instead of by a Python field validator. If a JSON column
+    does not hold valid JSON, the rows are validated from their attributes
+    instead, where the model's before-validators read that column as {}.
+
+    Args:
+        adapter: TypeAdapter for List[model]
+        model: Response model with from_attributes enabled
+        rows: ORM objects
+
+    Returns:
+        List[Any]: Validated response models
+    """
+    if not rows:
+        return []
+    # validate_json accepts NaN and Infinity, so the JSON text columns need
+    # no strict-JSON check
+    data = dump_rows_json(
+        rows, model.model_fields, getattr(model, "json_columns", ()), check_raw=False
+    )
+    try:
+        return adapter.validate_json(data)
+    except ValidationError:
+        return adapter.validate_python(rows)
@@ -0,0 +1,111 @@
+"""
+Text search utility functions.
+"""
+
+from typing import List, Literal
+
+from sqlalchemy import Index, func, literal
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.functions import FunctionElement
+
+# "prefix" matches from the start of the value and can use an index;
+# "contains" matches anywhere and always scans the table
+SearchMode = Literal["prefix", "contains"]
+
+# Escape character for LIKE patterns built from user input
+LIKE_ESCAPE = "\\"
+
+
+def escape_like(term: str) -> str:
+    """
+    Escape LIKE wildcards so a search term only matches literally.
+
+    Args:
+        term: User search term
+
+    Returns:
+        str: Term with %, _ and the escape character escaped
+    """
+    return (
+        term.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+
+
+class _prefix_ilike(FunctionElement):
+    """
+    Case-insensitive prefix match, compiled to the form each dialect indexes.
+
+    The pattern must already be lower-case.
+    """
+
+    inherit_cache = True
+
+
+@compiles(_prefix_ilike)
+def _compile_prefix_ilike(element, compiler, **kw):
+    column, pattern = element.clauses.clauses
+    return compiler.process(column.ilike(pattern, escape=LIKE_ESCAPE), **kw)
+
+
+@compiles(_prefix_ilike, "postgresql")
+def _compile_prefix_ilike_postgresql(element, compiler, **kw):
+    # ILIKE cannot use a btree index; lower() LIKE uses ix_*_lower
+    column, pattern = element.clauses.clauses
+    return compiler.process(func.lower(column).like(pattern, escape=LIKE_ESCAPE), **kw)
+
+
+@compiles(_prefix_ilike, "sqlite")
+def _compile_prefix_ilike_sqlite(element, compiler, **kw):
+    # SQLite LIKE is already case-insensitive and uses ix_*_nocase as is
+    column, pattern = element.clauses.clauses
+    return compiler.process(column.like(pattern, escape=LIKE_ESCAPE), **kw)
+
+
+def search_condition(
+    column: ColumnElement, term: str, mode: SearchMode = "prefix"
+) -> ColumnElement:
+    """
+    Build a case-insensitive search condition on a column.
+
+    Args:
+        column: Column to search
+        term: User search term, matched literally
+        mode: "prefix" to match the start of the value, "contains" to match
+            anywhere in it
+
+    Returns:
+        ColumnElement: Filter condition
+    """
+    term = escape_like(term)
+    if mode == "contains":
+        return column.ilike(f"%{term}%", escape=LIKE_ESCAPE)
+    return _prefix_ilike(column, literal(f"{term.lower()}%"))
+
+
+def prefix_search_indexes(table_name: str, column: ColumnElement) -> List[Index]:
+    """
+    Declare the indexes that serve prefix searches on a column.
+
+    Only the index matching the connected database's dialect is created.
+
+    Args:
+        table_name: Table name, used to name the indexes
+        column: Column searched by prefix
+
+    Returns:
+        List[Index]: Postgres and SQLite indexes, attached to the column's table
+    """
+    label = f"{column.key}_lower"
+    return [
+        Index(
+            f"ix_{table_name}_{label}",
+            func.lower(column).label(label),
+            postgresql_ops={label: "varchar_pattern_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(f"ix_{table_name}_{column.key}_nocase", column.collate("NOCASE")).ddl_if(
+            dialect="sqlite"
+        ),
+    ]
@@ -3,10 +3,11 @@ Security utility functions.
 """
 
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -25,6 +26,20 @@ ALGORITHM = config.jwt.algorithm
 ACCESS_TOKEN_EXPIRE_MINUTES = config.jwt.access_token_expire_minutes
 ADMIN_USERNAME = config.admin_user.username
 
+# JWT decode arguments, built once instead of on every request
+JWT_ALGORITHMS = [ALGORITHM]
+JWT_DECODE_OPTIONS = {"verify_aud": False}
+
+# Authenticated users are cached briefly to skip the per-request lookup. The
+# cache holds detached copies: a session-bound row is expired when its
+# request rolls back and can no longer be read once that session closes.
+CURRENT_USER_CACHE_TTL = 60
+_current_user_cache: Dict[str, Tuple[float, TbUser]] = {}
+# Bumped on every invalidation; a lookup only fills the cache if no
+# invalidation happened since it started, so a user deleted meanwhile
+# is not cached again
+_current_user_cache_version = 0
+
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated=["auto"])
 
@@ -135,13 +150,35 @@ async def check_is_admin(user: TbUser) -> None:
         )
 
 
+def invalidate_current_user_cache(username: Optional[str] = None) -> None:
+    """
+    Drop cached users so the next request reloads them.
+
+    Args:
+        username: Username to drop, or None to clear the whole cache
+    """
+    global _current_user_cache_version
+    _current_user_cache_version += 1
+    if username is None:
+        _current_user_cache.clear()
+    else:
+        _current_user_cache.pop(username, None)
+
+
 async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
 ) -> TbUser:
     """
     Get current user from token.
 
+    The user is stored on ``request.state`` so later lookups within the same
+    request reuse it, and kept in a short-lived process cache keyed by
+    username.
+
     Args:
+        request: Current request
         token: JWT token
         db: Database session
 
@@ -151,6 +188,10 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
+    user = getattr(request.state, "current_user", None)
+    if user is not None:
+        return user
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -158,7 +199,9 @@ async def get_current_user(
     )
 
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(
+            token, SECRET_KEY, algorithms=JWT_ALGORITHMS, options=JWT_DECODE_OPTIONS
+        )
         username: str = payload.get("sub")
 
         if username is None:
@@ -167,10 +210,23 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    result = await db.execute(select(TbUser).where(TbUser.username == username))
-    user = result.scalars().first()
+    cached = _current_user_cache.get(username)
+    if cached is not None and time.monotonic() - cached[0] < CURRENT_USER_CACHE_TTL:
+        user = cached[1]
+    else:
+        version = _current_user_cache_version
+        result = await db.execute(select(TbUser).where(TbUser.username == username))
+        user = result.scalars().first()
 
-    if user is None:
-        raise credentials_exception
+        if user is None:
+            _current_user_cache.pop(username, None)
+            raise credentials_exception
+
+        if version == _current_user_cache_version:
+            _current_user_cache[username] = (
+                time.monotonic(),
+                TbUser(**user.model_dump()),
+            )
 
+    request.state.current_user = user
     return user